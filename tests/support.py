@@ -0,0 +1,45 @@
+"""Fixtures shared by the test modules."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+from vibe_sentinel.storage import CACHE_DIR_ENV
+
+
+def isolated_cache() -> tuple[Callable[[], None], Callable[[], None]]:
+    """Return a ``setUpModule``/``tearDownModule`` pair that points persisted caches at a throwaway directory.
+
+    Every test module assigns the pair so no test writes to the user's real cache.
+    """
+    state: list[tuple[tempfile.TemporaryDirectory[str], Any]] = []
+
+    def set_up() -> None:
+        cache_dir = tempfile.TemporaryDirectory()
+        patcher = mock.patch.dict(os.environ, {CACHE_DIR_ENV: cache_dir.name})
+        patcher.start()
+        state.append((cache_dir, patcher))
+
+    def tear_down() -> None:
+        cache_dir, patcher = state.pop()
+        patcher.stop()
+        cache_dir.cleanup()
+
+    return set_up, tear_down
+
+
+def git(root: Path, *args: str) -> str:
+    """Run ``git`` in ``root`` with a fixed test identity and return its stripped stdout."""
+    return subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=root,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
@@ -5,9 +5,13 @@ import tempfile
 import unittest
 from pathlib import Path
 
+from tests.support import isolated_cache
 from vibe_sentinel.agent_pack import build_agent_tasks, write_agent_pack
 
 
+setUpModule, tearDownModule = isolated_cache()
+
+
 class AgentPackTests(unittest.TestCase):
     def test_build_agent_tasks_from_open_findings(self) -> None:
         payload = {
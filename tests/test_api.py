@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tests.support import isolated_cache
+from vibe_sentinel import api
+from vibe_sentinel.api import AuditOptions
+from vibe_sentinel.storage import CACHE_DIR_ENV
+
+
+setUpModule, tearDownModule = isolated_cache()
+
+
+class ApiTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tmp = Path(self._tmp.name)
+        patcher = mock.patch.dict(os.environ, {CACHE_DIR_ENV: str(self.tmp / "cache")})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.projects = []
+        for name in ("alpha", "beta", "gamma"):
+            project = self.tmp / name
+            project.mkdir()
+            (project / "README.md").write_text(f"# {name}\nTiny demo\n", encoding="utf-8")
+            self.projects.append(project)
+
+    def test_audit_returns_typed_results_and_honours_options(self) -> None:
+        project = self.projects[0]
+        first = api.audit(project)
+        self.assertFalse(first.cache_hit)
+        self.assertIsNone(first.report_json)
+        self.assertFalse((project / ".vibe-sentinel").exists())
+        self.assertTrue(api.audit(str(project)).cache_hit)
+        self.assertFalse(api.audit(project, AuditOptions(use_cache=False)).cache_hit)
+
+        partial = api.audit(project, AuditOptions(only=["fast"]), output_dir=self.tmp / "out")
+        self.assertNotIn("secret_scan", {check.check_id for check in partial.report.checks})
+        self.assertEqual(AuditOptions(only="fast").only, ("fast",))
+        self.assertEqual(api.audit(project, AuditOptions(only="fast")).report.checks, partial.report.checks)
+        self.assertEqual(partial.report_json, self.tmp / "out" / "report.json")
+        self.assertTrue(partial.report_json.exists())
+        with self.assertRaises(ValueError):
+            api.audit(project, AuditOptions(only=["no_such_check"]))
+        # A partial audit only reads the working tree, so it must not quietly ignore ``rev``.
+        with self.assertRaises(ValueError):
+            api.audit(project, AuditOptions(only="license_present", rev="no-such-ref"))
+
+    def test_ship_links_every_stage(self) -> None:
+        project = self.projects[0]
+        result = api.ship(project)
+        artifacts = project / ".vibe-sentinel"
+        self.assertEqual(result.after.report_json, artifacts / "report.json")
+        self.assertEqual(result.agent_pack.tasks_path, artifacts / "agent_tasks.json")
+        self.assertEqual(len(result.agent_pack.tasks), sum(check.status != "pass" for check in result.before.report.checks))
+        self.assertTrue(result.coach.applied_files)
+        self.assertTrue(result.roadmap.roadmap_path.read_text(encoding="utf-8").startswith("#"))
+        self.assertGreater(result.improvement, 0)
+        # The re-audit only re-ran checks the new starter files and artifacts touch, yet matches a full audit.
+        self.assertIn("tests_present", result.rerun)
+        self.assertNotIn("problem_statement", result.rerun)
+        self.assertEqual(result.after.report.checks, api.audit(project, AuditOptions(use_cache=False)).report.checks)
+        # Every stage and every artifact write is timed, and the batched writes all landed.
+        self.assertEqual(
+            set(result.timings),
+            set(api.SHIP_STAGES) | {"write.report", "write.agent_pack", "write.coach", "write.roadmap"},
+        )
+        self.assertTrue(all(path.exists() for path in result.agent_pack.pack.files()))
+        self.assertEqual(result.after.report_markdown, artifacts / "report.md")
+        with self.assertRaises(ValueError):
+            api.ship(project, options=AuditOptions(rev="HEAD"))
+
+    def test_write_false_renders_artifacts_without_touching_disk(self) -> None:
+        project = self.projects[1]
+        output = self.tmp / "dry"
+        pack = api.agent_pack(project, output_dir=output, write=False)
+        self.assertTrue(pack.markdown.startswith("#"))
+        self.assertEqual(len(pack.pack.prompts), len(pack.tasks))
+        self.assertIsNone(pack.audit.report_json)
+        self.assertIn("Roadmap", api.roadmap(project, output_dir=output, write=False).markdown)
+
+        shipped = api.ship(project, output_dir=output, write=False)
+        self.assertFalse(output.exists())
+        self.assertIsNone(shipped.after.report_json)
+        self.assertNotIn("write.report", shipped.timings)
+        self.assertEqual(shipped.roadmap.roadmap_path, output.resolve() / "roadmap.md")
+        # The starter files are real project changes, so the coach still creates them.
+        self.assertTrue(shipped.coach.applied_files)
+        self.assertTrue(all(path.exists() for path in shipped.coach.applied_files))
+
+    def test_async_variants_share_one_executor(self) -> None:
+        async def audit_all() -> list[api.AuditResult]:
+            return await asyncio.gather(*(api.audit_async(project) for project in self.projects))
+
+        results = asyncio.run(audit_all())
+        self.assertEqual([Path(result.report.project_path) for result in results], [p.resolve() for p in self.projects])
+        self.assertIs(api.shared_executor(), api.shared_executor())
+
+        coached = asyncio.run(api.coach_async(self.projects[1], output_dir=self.tmp / "coach"))
+        self.assertEqual(coached.coach_path, self.tmp / "coach" / "coach.md")
+        self.assertEqual(coached.applied_files, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tests.support import isolated_cache
+from vibe_sentinel import checks as checks_module
+from vibe_sentinel.assets import binary_weight, parse_lfs_patterns
+from vibe_sentinel.checks import evaluate_checks, lazy_context
+from vibe_sentinel.tree import FileStat
+
+MB = 1 << 20
+
+
+setUpModule, tearDownModule = isolated_cache()
+
+
+class BinaryAssetTests(unittest.TestCase):
+    def test_tallies_binaries_per_directory_from_sizes(self) -> None:
+        index = {
+            ".video_assets/intro.mp4": FileStat(6 * MB, 0),
+            ".video_assets/voice.wav": FileStat(2 * MB, 0),
+            "docs/logo.png": FileStat(20_000, 0),
+            "src/app.py": FileStat(50 * MB, 0),
+        }
+        weight = binary_weight(index)
+        self.assertEqual(weight.large, [(".video_assets/intro.mp4", 6 * MB), (".video_assets/voice.wav", 2 * MB)])
+        self.assertEqual(weight.by_directory, {".video_assets": 8 * MB, "docs": 20_000})
+        self.assertEqual(weight.oversized, [(".video_assets/intro.mp4", 6 * MB)])
+        self.assertEqual(weight.heavy_directories, [])
+
+    def test_lfs_tracked_files_are_not_counted(self) -> None:
+        patterns = parse_lfs_patterns("# media\n*.mp4 filter=lfs diff=lfs merge=lfs -text\n*.py text\n")
+        self.assertEqual(patterns, ["*.mp4"])
+        weight = binary_weight({"media/demo.mp4": FileStat(30 * MB, 0)}, patterns)
+        self.assertEqual((weight.total_bytes, weight.lfs_tracked), (0, 1))
+
+    def test_check_warns_without_reading_binaries(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "frames").mkdir()
+            for index in range(6):
+                with (root / "frames" / f"{index:02d}.png").open("wb") as handle:
+                    handle.truncate(2 * MB)
+
+            with mock.patch.object(checks_module, "read_text_file", side_effect=AssertionError("read")):
+                result = evaluate_checks(lazy_context(root), only={"binary_assets"})[0]
+            self.assertEqual(result.status, "warn")
+            self.assertIn("frames/ holds 12.0 MB", result.detail)
+            self.assertIn("Git LFS", result.recommendation)
+
+            (root / ".gitattributes").write_text("frames/*.png filter=lfs -text\n", encoding="utf-8")
+            result = evaluate_checks(lazy_context(root), only={"binary_assets"})[0]
+            self.assertEqual(result.status, "pass")
+
+
+if __name__ == "__main__":
+    unittest.main()
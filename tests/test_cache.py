@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from tests.support import isolated_cache
+from vibe_sentinel.cache import AuditCache, cached_audit, tree_fingerprint
+from vibe_sentinel.checks import scan_project
+from vibe_sentinel.report import write_report_files
+
+
+setUpModule, tearDownModule = isolated_cache()
+
+
+class AuditCacheTests(unittest.TestCase):
+    def test_repeat_audit_hits_cache_and_refreshes_timestamp(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "project"
+            root.mkdir()
+            (root / "README.md").write_text("problem install usage example", encoding="utf-8")
+            cache = AuditCache(Path(tmp) / "cache")
+
+            first, first_hit = cached_audit(root, cache=cache)
+            write_report_files(first, root / ".vibe-sentinel")
+            time.sleep(0.01)
+            second, second_hit = cached_audit(root, cache=cache)
+
+            self.assertFalse(first_hit)
+            self.assertTrue(second_hit)
+            self.assertEqual(second.to_dict()["checks"], first.to_dict()["checks"])
+            self.assertNotEqual(second.generated_at, first.generated_at)
+
+            _, bypass_hit = cached_audit(root, use_cache=False, cache=cache)
+            self.assertFalse(bypass_hit)
+
+    def test_fingerprint_changes_when_a_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            readme = root / "README.md"
+            readme.write_text("one", encoding="utf-8")
+            before = tree_fingerprint(root, scan_project(root).digest)
+            self.assertEqual(before, tree_fingerprint(root, scan_project(root).digest))
+
+            readme.write_text("one two", encoding="utf-8")
+            self.assertNotEqual(before, tree_fingerprint(root, scan_project(root).digest))
+
+    def test_cache_evicts_least_recently_used_entries(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = AuditCache(Path(tmp), max_entries=2)
+            cache.put("a", {"n": 1})
+            cache.put("b", {"n": 2})
+            stale = time.time() - 60
+            os.utime(Path(tmp) / "a.json", (stale, stale))
+            os.utime(Path(tmp) / "b.json", (stale - 60, stale - 60))
+            self.assertEqual(cache.get("b"), {"n": 2})  # touching b makes a the oldest
+            cache.put("c", {"n": 3})
+
+            self.assertIsNone(cache.get("a"))
+            self.assertEqual(cache.get("b"), {"n": 2})
+            self.assertEqual(cache.get("c"), {"n": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,8 +3,27 @@ from __future__ import annotations
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
-from vibe_sentinel.checks import compute_scorecard, run_checks
+from tests.support import isolated_cache
+from vibe_sentinel import checks as checks_module
+from vibe_sentinel.checks import (
+    CHECK_SPECS,
+    WALK_CHECKS,
+    AuditContext,
+    ContentRule,
+    compute_scorecard,
+    evaluate_checks,
+    lazy_context,
+    run_checks,
+    secret_candidates,
+    secret_risk,
+    visit_files,
+)
+from vibe_sentinel.storage import cache_root
+
+
+setUpModule, tearDownModule = isolated_cache()
 
 
 class CheckEngineTests(unittest.TestCase):
@@ -61,6 +80,16 @@ class CheckEngineTests(unittest.TestCase):
             self.assertEqual(secret_check.status, "fail")
             self.assertEqual(secret_check.severity, "high")
 
+    def test_secret_scan_reads_every_env_variant(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "README.md").write_text("problem install usage example", encoding="utf-8")
+            (root / ".env.production").write_text('API_KEY="0123456789abcdef0123456789"\n', encoding="utf-8")
+
+            self.assertEqual(secret_candidates([".env.production", ".env", "notes.bin"]), [".env", ".env.production"])
+            secret_check = [check for check in run_checks(root) if check.check_id == "secret_scan"][0]
+            self.assertEqual(secret_check.status, "fail")
+
     def test_secret_scan_ignores_test_fixtures(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp)
@@ -85,6 +114,181 @@ class CheckEngineTests(unittest.TestCase):
             dependency_check = [check for check in checks if check.check_id == "dependency_lock"][0]
             self.assertEqual(dependency_check.status, "pass")
 
+    def test_content_rules_read_each_file_once(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "README.md").write_text("problem install usage example", encoding="utf-8")
+            (root / "DEMO_SCRIPT.md").write_text("word " * 350, encoding="utf-8")
+            (root / "SUBMISSION.md").write_text("discord\n", encoding="utf-8")
+            (root / "requirements.txt").write_text("requests==2.32.0\n", encoding="utf-8")
+
+            with mock.patch.object(
+                checks_module, "read_text_file", wraps=checks_module.read_text_file
+            ) as reader:
+                checks = run_checks(root)
+
+            read_paths = [call.args[0] for call in reader.call_args_list]
+            self.assertEqual(len(read_paths), len(set(read_paths)))
+            self.assertEqual(len(read_paths), 4)
+            demo_check = [check for check in checks if check.check_id == "demo_script"][0]
+            self.assertEqual(demo_check.status, "pass")
+
+    def test_custom_content_rule_receives_matching_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "notes.md").write_text("TODO: ship it", encoding="utf-8")
+            (root / "app.py").write_text("print('hi')\n", encoding="utf-8")
+
+            rule = ContentRule(
+                "todo",
+                lambda _, content: True if "TODO" in content else None,
+                suffixes=frozenset({".md"}),
+            )
+            results = visit_files(root, {"notes.md", "app.py"}, [rule])
+            self.assertEqual(results, {"todo": {"notes.md": True}})
+
+    def test_lazy_context_answers_fast_checks_without_walking(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "README.md").write_text("## Problem\nInstall then usage example\n```\nrun\n```\n", encoding="utf-8")
+            (root / "LICENSE").write_text("MIT\n", encoding="utf-8")
+            (root / ".github" / "workflows").mkdir(parents=True)
+            (root / ".github" / "workflows" / "ci.yml").write_text("on: push\n", encoding="utf-8")
+            (root / "node_modules" / "pkg").mkdir(parents=True)
+            (root / "node_modules" / "pkg" / "UNIQUE_EDGE.md").write_text("vendored\n", encoding="utf-8")
+            (root / "docs").mkdir()
+            (root / "docs" / "UNIQUE_EDGE.md").symlink_to(root / "node_modules" / "pkg" / "UNIQUE_EDGE.md")
+
+            fast = [check_id for check_id in checks_module.CHECK_FUNCTIONS if check_id not in WALK_CHECKS]
+            with mock.patch.object(checks_module, "scan_project", side_effect=AssertionError("walked")):
+                lazy = evaluate_checks(lazy_context(root), only=fast)
+
+            eager = [check for check in run_checks(root) if check.check_id in fast]
+            self.assertEqual(lazy, eager)
+            self.assertEqual({check.check_id for check in lazy}, set(fast))
+
+    def test_context_with_files_but_no_stats_stats_those_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for copy in ("a", "b"):
+                (root / copy).mkdir()
+                (root / copy / "data.txt").write_text("same\n", encoding="utf-8")
+            ctx = AuditContext(root, files={"a/data.txt", "b/data.txt"})
+            with mock.patch.object(checks_module, "scan_project", side_effect=AssertionError("walked")):
+                result = evaluate_checks(ctx, only={"duplicate_files"})[0]
+            self.assertEqual(ctx.stats["a/data.txt"].size, 5)
+            self.assertEqual(result.status, "warn")
+
+    def test_secret_scan_skips_generated_vendored_and_tool_output(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            leak = 'API_KEY="0123456789abcdef0123456789"\n'
+            (root / ".vibe-sentinel").mkdir()
+            (root / ".vibe-sentinel" / "notes.md").write_text(leak, encoding="utf-8")
+            (root / ".vibe-sentinel" / "SUBMISSION.md").write_text(
+                "discord github profile github repo demo video\n", encoding="utf-8"
+            )
+            (root / "vendor").mkdir()
+            (root / "vendor" / "client.py").write_text(leak, encoding="utf-8")
+            (root / "bundle.js").write_text("var a=1;" * 400 + leak, encoding="utf-8")
+            (root / "api.py").write_text("# Code generated by codegen. DO NOT EDIT.\n" + leak, encoding="utf-8")
+
+            ctx = checks_module.build_context(root)
+            results = {check.check_id: check for check in evaluate_checks(ctx)}
+            self.assertEqual(results["secret_scan"].status, "pass")
+            self.assertEqual(results["submission_template"].status, "pass")
+            self.assertEqual(
+                ctx.file_kinds,
+                {
+                    ".vibe-sentinel/SUBMISSION.md": "tool_output",
+                    ".vibe-sentinel/notes.md": "tool_output",
+                    "api.py": "generated",
+                    "bundle.js": "generated",
+                    "vendor/client.py": "vendored",
+                },
+            )
+
+            unfiltered = evaluate_checks(checks_module.build_context(root, classify=False), only={"secret_scan"})
+            self.assertEqual(unfiltered[0].status, "fail")
+
+    def test_secret_scan_orders_by_risk_and_fails_fast(self) -> None:
+        files = ["src/app.py", "deploy/values.yaml", "app/config.py", ".env.production", "README.md"]
+        self.assertEqual(
+            sorted(files, key=secret_risk),
+            [".env.production", "app/config.py", "deploy/values.yaml", "README.md", "src/app.py"],
+        )
+        self.assertLess(secret_risk("new.py", 2), secret_risk("old.py", 1))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            leak = 'API_KEY = "0123456789abcdef0123456789"\n'
+            (root / "README.md").write_text("problem install usage example", encoding="utf-8")
+            (root / "config.yaml").write_text(leak, encoding="utf-8")
+            for index in range(5):
+                (root / f"module{index}.py").write_text(leak, encoding="utf-8")
+
+            with mock.patch.object(
+                checks_module, "read_text_file", wraps=checks_module.read_text_file
+            ) as reader:
+                ctx = checks_module.build_context(root, fail_fast=True)
+            read_paths = [Path(call.args[0]).name for call in reader.call_args_list]
+            # The riskiest file leaks, so only README (a path rule) is read after it.
+            self.assertEqual(read_paths[0], "config.yaml")
+            self.assertEqual(sorted(read_paths), ["README.md", "config.yaml"])
+            self.assertEqual(list(ctx.content["secret_scan"]), ["config.yaml"])
+            self.assertEqual(ctx.readme_text, "problem install usage example")
+            secret = evaluate_checks(ctx, only={"secret_scan"})[0]
+            self.assertEqual(secret.status, "fail")
+            self.assertIn("stopped at the first hit", secret.detail)
+
+    def test_deferred_context_reports_cheap_checks_before_the_content_pass(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "README.md").write_text("## Problem\n## Installation\n", encoding="utf-8")
+            (root / "app.py").write_text('API_KEY = "0123456789abcdef0123456789"\n', encoding="utf-8")
+
+            events: list[str] = []
+            original_visit = checks_module.visit_files
+
+            def visit(*args: object, **kwargs: object) -> object:
+                events.append("visit")
+                return original_visit(*args, **kwargs)
+
+            with mock.patch.object(checks_module, "visit_files", side_effect=visit):
+                ctx = checks_module.build_context(root, defer=True)
+                self.assertEqual(events, [])
+                results = evaluate_checks(ctx, on_check=lambda check: events.append(check.check_id))
+
+            self.assertEqual([check.check_id for check in results], [spec.check_id for spec in CHECK_SPECS])
+            # Every cheap check is reported before the single content pass, which the secret scan triggers.
+            self.assertEqual(events.count("visit"), 1)
+            visit_at = events.index("visit")
+            self.assertEqual(set(events[: visit_at - 1]), {spec.check_id for spec in CHECK_SPECS} - WALK_CHECKS)
+            self.assertEqual(events[visit_at - 1 : visit_at + 2], ["tests_present", "visit", "secret_scan"])
+            self.assertEqual(results, evaluate_checks(checks_module.build_context(root)))
+
+    def test_plain_check_api_persists_nothing_unless_asked(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "project"
+            root.mkdir()
+            (root / "a.txt").write_text("same\n" * 20, encoding="utf-8")
+            (root / "b.txt").write_text("same\n" * 20, encoding="utf-8")
+            cache_dir = cache_root()
+            run_checks(root)
+            evaluate_checks(lazy_context(root))
+            self.assertEqual(list(cache_dir.iterdir()), [])
+
+            evaluate_checks(checks_module.build_context(root, persist=True))
+            self.assertEqual(sorted(path.name for path in cache_dir.iterdir()), ["hashes", "trees"])
+
+    def test_partial_scorecard_blends_only_evaluated_categories(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "LICENSE").write_text("MIT\n", encoding="utf-8")
+            score = compute_scorecard(evaluate_checks(lazy_context(root), only={"license_present"}))
+            self.assertEqual(score.impact, 100.0)
+            self.assertEqual(score.overall, 100.0)
+
     def test_scorecard_is_bounded(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp)
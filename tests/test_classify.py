@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import unittest
+
+from tests.support import isolated_cache
+from vibe_sentinel.classify import classify_path, classify_text
+
+
+setUpModule, tearDownModule = isolated_cache()
+
+
+class ClassifierTests(unittest.TestCase):
+    def test_path_heuristics(self) -> None:
+        self.assertEqual(classify_path(".vibe-sentinel/prompts/task.md"), "tool_output")
+        self.assertEqual(classify_path("src/vendor/lib/client.py"), "vendored")
+        self.assertEqual(classify_path("third_party/json.hpp"), "vendored")
+        self.assertEqual(classify_path("static/app.min.js"), "generated")
+        self.assertEqual(classify_path("proto/api_pb2.py"), "generated")
+        self.assertEqual(classify_path("web/package-lock.json"), "generated")
+        self.assertIsNone(classify_path("src/vendor.py"))
+        self.assertIsNone(classify_path("app/main.py"))
+
+    def test_header_markers_must_be_comments_near_the_top(self) -> None:
+        self.assertEqual(classify_text("// Code generated by protoc-gen-go. DO NOT EDIT.\npackage api\n"), "generated")
+        self.assertEqual(classify_text('"""Auto-generated by schema-tool."""\n'), "generated")
+        self.assertEqual(classify_text("# @generated\nx = 1\n"), "generated")
+        self.assertIsNone(classify_text('label = "generated by hand"\n'))
+        self.assertIsNone(classify_text("# Title\n\n\n\n\n# generated by the build\n"))
+
+    def test_minified_line_lengths(self) -> None:
+        self.assertEqual(classify_text("var a=1;" * 500), "generated")
+        self.assertIsNone(classify_text("x = 1\n" * 500))
+
+
+if __name__ == "__main__":
+    unittest.main()
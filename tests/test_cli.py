@@ -1,12 +1,67 @@
 from __future__ import annotations
 
+import io
 import json
+import os
+import subprocess
+import sys
 import tempfile
+import time
 import unittest
+from contextlib import redirect_stdout
 from pathlib import Path
 
+from tests.support import isolated_cache
 from vibe_sentinel.cli import build_parser, main
 
+# The `vibe-sentinel` console script; it imports the CLI only when the daemon does not take the command.
+ENTRY_POINT = "vibe_sentinel.__main__"
+# Modules that importing the entry point or the CLI must not load; each handler imports them on demand.
+HEAVY_MODULES = (
+    "vibe_sentinel.checks",
+    "vibe_sentinel.gui",
+    "vibe_sentinel.cache",
+    "vibe_sentinel.daemon",
+    "http.server",
+    "socketserver",
+    "threading",
+    "traceback",
+    "concurrent.futures",
+)
+# Wall-clock budget for importing the entry point, on top of a bare `python -c pass` timed in the same
+# run. It takes ~40 ms over the bare interpreter on a slow host; the audit engine alone adds ~65 ms.
+ENTRY_IMPORT_BUDGET_MS = 100
+
+
+setUpModule, tearDownModule = isolated_cache()
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Cumulative import time per module, parsed from ``python -X importtime``."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def _best_start_ms(code: str, runs: int = 5) -> float:
+    """Fastest of ``runs`` interpreter starts running ``code``; the minimum rides out scheduler noise."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
 
 class CliTests(unittest.TestCase):
     def test_init_audit_and_roadmap_flow(self) -> None:
@@ -101,6 +156,56 @@ class CliTests(unittest.TestCase):
             self.assertTrue(pack_runbook_path.exists())
             self.assertTrue(pack_prompts_path.exists())
 
+    def test_audit_fail_fast_exits_nonzero_on_leak(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            project = Path(tmp)
+            (project / "settings.py").write_text('API_KEY = "0123456789abcdef0123456789"\n', encoding="utf-8")
+            out = str(project / "out")
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(main(["audit", str(project), "--fail-fast", "--output-dir", out]), 1)
+                (project / "settings.py").write_text("API_KEY = None\n", encoding="utf-8")
+                self.assertEqual(main(["audit", str(project), "--fail-fast", "--output-dir", out]), 0)
+                self.assertEqual(main(["audit", str(project), "--fail-fast", "--sample-rate", "0.5"]), 2)
+
+    def test_audit_ndjson_streams_checks_then_scorecard(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            project = Path(tmp)
+            (project / "settings.py").write_text('API_KEY = "0123456789abcdef0123456789"\n', encoding="utf-8")
+            out = io.StringIO()
+            with redirect_stdout(out):
+                code = main(["audit", str(project), "--format", "ndjson", "--no-cache", "--output-dir", str(project / "out")])
+            self.assertEqual(code, 0)
+            lines = [json.loads(line) for line in out.getvalue().splitlines()]
+            self.assertEqual([line["type"] for line in lines], ["check"] * 14 + ["scorecard"])
+            self.assertEqual(lines[-1]["scorecard"], json.loads((project / "out" / "report.json").read_text(encoding="utf-8"))["scorecard"])
+            secret = next(line for line in lines if line["check_id"] == "secret_scan")
+            self.assertEqual(secret["status"], "fail")
+
+            out = io.StringIO()
+            with redirect_stdout(out):
+                self.assertEqual(main(["audit", str(project), "--format", "ndjson", "--only", "bogus"]), 2)
+            self.assertEqual(json.loads(out.getvalue())["type"], "error")
+
+    def test_audit_ndjson_stops_quietly_when_the_reader_closes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            project = Path(tmp)
+            read_fd, write_fd = os.pipe()
+            os.close(read_fd)
+            with open(write_fd, "w", encoding="utf-8") as closed_pipe, redirect_stdout(closed_pipe):
+                code = main(["audit", str(project), "--format", "ndjson", "--no-cache", "--output-dir", str(project / "out")])
+            self.assertEqual(code, 1)
+
+    def test_cli_import_stays_light(self) -> None:
+        for entry in (ENTRY_POINT, "vibe_sentinel.cli"):
+            loaded = _import_times(entry)
+            self.assertIn(entry, loaded)
+            for module in HEAVY_MODULES:
+                self.assertNotIn(module, loaded, entry)
+        # Relative to a bare interpreter on the same host, so slow CI machines do not fail it.
+        _best_start_ms(f"import {ENTRY_POINT}", runs=1)  # warm the bytecode cache
+        overhead = _best_start_ms(f"import {ENTRY_POINT}") - _best_start_ms("pass")
+        self.assertLess(overhead, ENTRY_IMPORT_BUDGET_MS)
+
     def test_studio_parser_accepts_args(self) -> None:
         parser = build_parser()
         args = parser.parse_args(["studio", "--host", "127.0.0.1", "--port", "9876"])
@@ -5,9 +5,13 @@ import tempfile
 import unittest
 from pathlib import Path
 
+from tests.support import isolated_cache
 from vibe_sentinel.coach import write_coach
 
 
+setUpModule, tearDownModule = isolated_cache()
+
+
 class CoachTests(unittest.TestCase):
     def test_write_coach_generates_action_cards(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import io
+import os
+import socket
+import stat
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+from tests.support import isolated_cache
+from vibe_sentinel import __version__, daemon, daemon_client
+from vibe_sentinel.cli import main, run
+from vibe_sentinel.daemon import WarmAudits, serve
+from vibe_sentinel.daemon_client import daemon_status, forward, send_request, socket_path, stop_daemon
+from vibe_sentinel.storage import CACHE_DIR_ENV
+
+
+setUpModule, tearDownModule = isolated_cache()
+
+
+class DaemonTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tmp = Path(self._tmp.name)
+        patcher = mock.patch.dict(os.environ, {CACHE_DIR_ENV: str(self.tmp / "cache")})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # forward() declines when the caller's shell disables the daemon.
+        os.environ.pop(daemon_client.NO_DAEMON_ENV, None)
+        self.project = self.tmp / "project"
+        self.project.mkdir()
+        (self.project / "README.md").write_text("## Problem\n", encoding="utf-8")
+
+    def _start(self) -> threading.Thread:
+        ready = threading.Event()
+        thread = threading.Thread(target=serve, args=(run,), kwargs={"ready": ready}, daemon=True)
+        thread.start()
+        self.assertTrue(ready.wait(5))
+        self.addCleanup(lambda: stop_daemon() and thread.join(5))
+        return thread
+
+    def test_forwards_commands_to_a_running_daemon(self) -> None:
+        self.assertIsNone(forward(["audit", str(self.project)]))
+        self._start()
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = forward(["audit", str(self.project), "--output-dir", str(self.tmp / "out")])
+        self.assertEqual(code, 0)
+        self.assertIn("Projected Vibeathon score", out.getvalue())
+        self.assertTrue((self.tmp / "out" / "report.json").exists())
+        self.assertEqual(daemon_status()["served"], 1)
+
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()) as err:
+            self.assertEqual(forward(["audit", "--no-such-flag"]), 2)
+        self.assertIn("unrecognized arguments", err.getvalue())
+        self.assertIsNone(forward(["studio"]))
+        self.assertIsNone(forward(["audit", str(self.project), "--format", "ndjson"]))
+        # A daemon from another release declines, and the client runs the command itself.
+        response = send_request(socket_path(), {"argv": ["audit"], "cwd": str(self.project), "version": "0.0.0"})
+        self.assertEqual(response, {"exit": None})
+        # Long-running or unknown commands and malformed requests are refused rather than run.
+        for argv in (["watch", str(self.project)], ["studio"], [], [1]):
+            request = {"argv": argv, "cwd": str(self.project), "version": __version__}
+            self.assertEqual(send_request(socket_path(), request), {"exit": None})
+        self.assertEqual(send_request(socket_path(), ["audit"]), {"exit": None})  # type: ignore[arg-type]
+        self.assertEqual(stat.S_IMODE(socket_path().stat().st_mode) & 0o077, 0)
+        with mock.patch.dict(os.environ, {daemon_client.NO_DAEMON_ENV: "1"}):
+            self.assertIsNone(forward(["audit", str(self.project)]))
+        # Only the entry point forwards; calling the CLI in-process never reaches the daemon.
+        served = daemon_status()["served"]
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(main(["audit", str(self.project), "--output-dir", str(self.tmp / "out")]), 0)
+        self.assertEqual(daemon_status()["served"], served)
+
+    def test_keeps_each_project_warm_between_audits(self) -> None:
+        self._start()
+        argv = ["audit", str(self.project), "--output-dir", str(self.tmp / "out")]
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(forward(argv), 0)
+        self.assertEqual(daemon_status()["warm_projects"], 1)
+
+        out = io.StringIO()
+        with redirect_stdout(out), mock.patch.object(
+            daemon.WarmAudits, "audit", autospec=True, side_effect=WarmAudits.audit
+        ) as audit:
+            self.assertEqual(forward(argv), 0)
+            self.assertIn("reused cached results", out.getvalue())
+            (self.project / "app.py").write_text('API_KEY = "0123456789abcdef0123456789"\n', encoding="utf-8")
+            self.assertEqual(forward(argv), 0)
+        self.assertEqual(audit.call_count, 2)
+        self.assertIn("secret", out.getvalue().rsplit("reused cached results", 1)[1].lower())
+        # Partial and uncached audits still go through the regular path.
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(forward([*argv, "--no-cache"]), 0)
+        self.assertEqual(daemon_status()["warm_projects"], 1)
+        with redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(main(["daemon", "--status"]), 0)
+        self.assertIn("keeps 1 project(s) warm", out.getvalue())
+
+    def test_fails_without_rerunning_when_the_daemon_does_not_answer(self) -> None:
+        path = socket_path()
+        path.parent.mkdir(parents=True)
+        # Accepts connections into the backlog but never replies, like a daemon wedged on another request.
+        wedged = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.addCleanup(wedged.close)
+        wedged.bind(str(path))
+        wedged.listen()
+        # The request was sent, so running it again in-process could audit twice; report an error instead.
+        with mock.patch.object(daemon_client, "FORWARD_TIMEOUT", 0.1), redirect_stderr(io.StringIO()) as err:
+            self.assertEqual(forward(["audit", str(self.project)]), 2)
+        self.assertIn(daemon_client.NO_DAEMON_ENV, err.getvalue())
+
+    def test_applies_the_client_environment_per_request(self) -> None:
+        seen: list[str | None] = []
+
+        def record(argv: list[str]) -> int:
+            seen.append(os.environ.get(CACHE_DIR_ENV))
+            return 0
+
+        elsewhere = str(self.tmp / "elsewhere")
+        before = os.environ[CACHE_DIR_ENV]
+        daemon._run_captured(record, [], str(self.project), {CACHE_DIR_ENV: elsewhere})
+        daemon._run_captured(record, [], str(self.project), {})
+        self.assertEqual(seen, [elsewhere, None])
+        self.assertEqual(os.environ[CACHE_DIR_ENV], before)
+        self.assertEqual(daemon_client.client_env()[CACHE_DIR_ENV], before)
+
+    def test_replaces_stale_socket_and_refuses_a_second_daemon(self) -> None:
+        path = socket_path()
+        path.parent.mkdir(parents=True)
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(path))
+        stale.close()
+        self.assertIsNone(forward(["audit", str(self.project)]))
+
+        thread = self._start()
+        with self.assertRaises(FileExistsError):
+            serve(run)
+        self.assertTrue(stop_daemon())
+        thread.join(5)
+        self.assertFalse(path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
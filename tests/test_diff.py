@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tests.support import git, isolated_cache
+from vibe_sentinel import diff, duplicates
+from vibe_sentinel.diff import differential_audit
+from vibe_sentinel.gitstore import GitRepository
+
+
+setUpModule, tearDownModule = isolated_cache()
+
+
+@unittest.skipUnless(shutil.which("git"), "git is not installed")
+class DifferentialAuditTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name)
+        git(self.root, "init", "-q", "-b", "main")
+        (self.root / "README.md").write_text("problem install usage example\n" * 20, encoding="utf-8")
+        (self.root / "app.py").write_text("print('hello')\n", encoding="utf-8")
+        (self.root / "config.py").write_text('API_KEY="0123456789abcdef0123456789"\n', encoding="utf-8")
+        git(self.root, "add", "-A")
+        git(self.root, "commit", "-q", "-m", "base")
+
+    def test_matches_git_index(self) -> None:
+        repo, _ = GitRepository.discover(self.root)
+        staged = {path: entry.sha for path, entry in repo.read_index().items()}
+        listed = {}
+        for line in git(self.root, "ls-files", "-s").splitlines():
+            meta, path = line.split("\t")
+            listed[path] = meta.split()[1]
+        self.assertEqual(staged, listed)
+
+    def test_edits_to_known_leaks_are_pre_existing(self) -> None:
+        (self.root / "config.py").write_text('API_KEY="0123456789abcdef0123456789"\nDEBUG = True\n', encoding="utf-8")
+
+        read_paths: list[str] = []
+        original_read = diff.read_text_file
+
+        def tracking_read(path: Path) -> str:
+            read_paths.append(path.relative_to(self.root).as_posix())
+            return original_read(path)
+
+        with mock.patch.object(diff, "read_text_file", side_effect=tracking_read), mock.patch.object(
+            diff, "hash_blob", wraps=diff.hash_blob
+        ) as hashed, mock.patch.object(duplicates, "_partial_hash", side_effect=AssertionError("hashed")):
+            report = differential_audit(self.root, "HEAD")
+
+        self.assertEqual(report.diff["changed_files"], ["config.py"])
+        self.assertEqual(report.diff["introduced"], [])
+        self.assertIn("secret_scan", report.diff["pre_existing"])
+        self.assertIn("license_present", report.diff["pre_existing"])
+        # app.py is untouched: its index stat matches, so it is neither hashed nor read.
+        self.assertNotIn("app.py", read_paths)
+        self.assertEqual([call.args[0].name for call in hashed.call_args_list], ["config.py"])
+
+    def test_new_leaks_are_introduced_and_fixes_resolved(self) -> None:
+        (self.root / "new.py").write_text('TOKEN="abcdefabcdefabcdefabcdef"\n', encoding="utf-8")
+        (self.root / "LICENSE").write_text("MIT\n", encoding="utf-8")
+
+        report = differential_audit(self.root, "HEAD")
+
+        self.assertEqual(report.diff["changed_files"], ["LICENSE", "new.py"])
+        self.assertEqual(report.diff["introduced"], ["secret_scan"])
+        self.assertEqual(report.diff["resolved"], ["license_present"])
+        self.assertEqual(report.to_dict()["diff"]["base"], git(self.root, "rev-parse", "HEAD"))
+
+    def test_include_generated_scans_generated_files(self) -> None:
+        (self.root / "static").mkdir()
+        (self.root / "static" / "app.min.js").write_text('TOKEN="abcdefabcdefabcdefabcdef"\n', encoding="utf-8")
+
+        self.assertEqual(differential_audit(self.root, "HEAD").diff["introduced"], [])
+        report = differential_audit(self.root, "HEAD", include_generated=True)
+        self.assertEqual(report.diff["introduced"], ["secret_scan"])
+
+
+if __name__ == "__main__":
+    unittest.main()
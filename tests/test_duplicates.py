@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tests.support import isolated_cache
+from vibe_sentinel import duplicates
+from vibe_sentinel.checks import evaluate_checks, lazy_context, scan_project
+from vibe_sentinel.duplicates import find_duplicates
+
+
+setUpModule, tearDownModule = isolated_cache()
+
+
+class DuplicateFileTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name) / "project"
+
+        big = "x" * 5000 + "MIDDLE" + "y" * 5000
+        for copy in ("demo-a", "demo-b"):
+            (self.root / copy / "src").mkdir(parents=True)
+            (self.root / copy / "README.md").write_text("same readme\n", encoding="utf-8")
+            (self.root / copy / "src" / "data.txt").write_text(big, encoding="utf-8")
+        # Same size and same first/last 4 KB as data.txt, but a different middle.
+        (self.root / "near.txt").write_text(big.replace("MIDDLE", "middle"), encoding="utf-8")
+        (self.root / "unique.txt").write_text("only one\n", encoding="utf-8")
+        (self.root / ".vibe-sentinel").mkdir()
+        (self.root / ".vibe-sentinel" / "README.md").write_text("same readme\n", encoding="utf-8")
+
+    def test_groups_by_size_edges_then_full_hash(self) -> None:
+        index = scan_project(self.root).index
+        with mock.patch.object(duplicates, "_full_hash", wraps=duplicates._full_hash) as full:
+            found = find_duplicates(self.root, index, persist=True)
+
+        self.assertEqual(found.subtrees, [["demo-a", "demo-b"]])
+        self.assertIn(["demo-a/src/data.txt", "demo-b/src/data.txt"], found.groups)
+        self.assertNotIn("near.txt", {path for group in found.groups for path in group})
+        # One extra copy of data.txt, two of README.md (one under .vibe-sentinel/).
+        self.assertEqual(found.wasted_bytes, 10006 + 2 * 12)
+        # Only the three edge-hash survivors are fully hashed; unique sizes are never read.
+        self.assertEqual(sorted(call.args[0].name for call in full.call_args_list), ["data.txt", "data.txt", "near.txt"])
+
+        with mock.patch.object(duplicates, "_partial_hash", side_effect=AssertionError("rehashed")), mock.patch.object(
+            duplicates, "_full_hash", side_effect=AssertionError("rehashed")
+        ):
+            self.assertEqual(find_duplicates(self.root, index, persist=True), found)
+
+    def test_empty_files_do_not_break_duplicated_directories(self) -> None:
+        for copy in ("demo-a", "demo-b"):
+            (self.root / copy / "src" / "__init__.py").write_text("", encoding="utf-8")
+        found = find_duplicates(self.root, scan_project(self.root).index)
+        self.assertEqual(found.subtrees, [["demo-a", "demo-b"]])
+        self.assertNotIn("demo-a/src/__init__.py", {path for group in found.groups for path in group})
+        self.assertEqual(found.wasted_bytes, 10006 + 2 * 12)
+
+    def test_check_warns_on_duplicated_directories(self) -> None:
+        result = evaluate_checks(lazy_context(self.root), only={"duplicate_files"})[0]
+        self.assertEqual(result.status, "warn")
+        self.assertIn("demo-a = demo-b", result.detail)
+
+    def test_trusts_supplied_content_ids(self) -> None:
+        index = scan_project(self.root).index
+        ids = {path: "big" if path.endswith(".txt") and path != "unique.txt" else path for path in index}
+        with mock.patch.object(duplicates, "_partial_hash", side_effect=AssertionError("read")):
+            found = find_duplicates(self.root, index, content_ids=ids)
+        self.assertEqual(found.groups, [["demo-a/src/data.txt", "demo-b/src/data.txt", "near.txt"]])
+        self.assertEqual(found.subtrees, [["demo-a/src", "demo-b/src"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import csv
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from tests.support import isolated_cache
+from vibe_sentinel.cli import main
+from vibe_sentinel.fleet import (
+    CHECKPOINT_NAME,
+    discover_projects,
+    merge_leaderboards,
+    parse_shard,
+    read_checkpoint,
+    run_fleet_audit,
+)
+
+
+setUpModule, tearDownModule = isolated_cache()
+
+
+def _make_project(root: Path, name: str, complete: bool) -> Path:
+    project = root / name
+    project.mkdir()
+    if complete:
+        (project / "README.md").write_text(
+            "## Problem\n## Installation\n## Usage\n```bash\nrun\n```\n## Why this is different\nunique",
+            encoding="utf-8",
+        )
+        (project / "LICENSE").write_text("MIT", encoding="utf-8")
+    else:
+        (project / "README.md").write_text("Tiny demo", encoding="utf-8")
+    return project
+
+
+class FleetTests(unittest.TestCase):
+    def test_discover_projects_from_directory_and_list_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            alpha = _make_project(root, "alpha", complete=True)
+            beta = _make_project(root, "beta", complete=False)
+            (root / ".hidden").mkdir()
+
+            self.assertEqual(discover_projects(root), [alpha.resolve(), beta.resolve()])
+
+            listing = root / "projects.txt"
+            listing.write_text("# submissions\nbeta\n\nalpha\n", encoding="utf-8")
+            self.assertEqual(discover_projects(listing), [beta.resolve(), alpha.resolve()])
+
+    def test_fleet_audit_ranks_projects_and_writes_reports(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            projects_dir = root / "projects"
+            projects_dir.mkdir()
+            _make_project(projects_dir, "weak", complete=False)
+            _make_project(projects_dir, "strong", complete=True)
+            out = root / "out"
+
+            result = run_fleet_audit(discover_projects(projects_dir), out, workers=2)
+
+            self.assertEqual([row["project"] for row in result.rows], ["strong", "weak"])
+            self.assertEqual([row["rank"] for row in result.rows], [1, 2])
+            self.assertTrue((out / "reports" / "strong" / "report.json").exists())
+            self.assertGreater(result.projects_per_second, 0)
+
+            payload = json.loads(result.leaderboard_json.read_text(encoding="utf-8"))
+            self.assertEqual(payload["projects"][0]["project"], "strong")
+            with result.leaderboard_csv.open(encoding="utf-8", newline="") as handle:
+                rows = list(csv.DictReader(handle))
+            self.assertEqual(rows[1]["project"], "weak")
+
+    def test_audit_many_command(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _make_project(root, "solo", complete=True)
+            out = root / "fleet-out"
+
+            exit_code = main(["audit-many", str(root), "--output-dir", str(out), "--workers", "1"])
+            self.assertEqual(exit_code, 0)
+            self.assertTrue((out / "leaderboard.json").exists())
+            self.assertTrue((out / "leaderboard.csv").exists())
+
+    def test_parse_shard_rejects_bad_values(self) -> None:
+        self.assertEqual(parse_shard("2/4"), (2, 4))
+        for bad in ("0/4", "5/4", "2", "a/b"):
+            with self.assertRaises(ValueError):
+                parse_shard(bad)
+
+    def test_shards_partition_projects_and_merge(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            projects_dir = root / "projects"
+            projects_dir.mkdir()
+            for idx in range(6):
+                _make_project(projects_dir, f"p{idx}", complete=idx % 2 == 0)
+            projects = discover_projects(projects_dir)
+
+            shard_dirs = [root / "shard1", root / "shard2"]
+            audited: list[str] = []
+            for idx, shard_dir in enumerate(shard_dirs, start=1):
+                result = run_fleet_audit(projects, shard_dir, workers=1, shard=(idx, 2))
+                audited.extend(row["project"] for row in result.rows)
+            self.assertEqual(sorted(audited), [f"p{idx}" for idx in range(6)])
+
+            rows, json_path, _ = merge_leaderboards(shard_dirs, root / "merged")
+            self.assertEqual(len(rows), 6)
+            self.assertEqual([row["rank"] for row in rows], list(range(1, 7)))
+            self.assertTrue(json_path.exists())
+
+    def test_resume_skips_checkpointed_projects(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            projects_dir = root / "projects"
+            projects_dir.mkdir()
+            _make_project(projects_dir, "first", complete=True)
+            out = root / "out"
+
+            run_fleet_audit(discover_projects(projects_dir), out, workers=1)
+            with (out / CHECKPOINT_NAME).open("a", encoding="utf-8") as handle:
+                handle.write('{"project": "torn"')  # simulate a crash mid-write
+
+            _make_project(projects_dir, "second", complete=False)
+            result = run_fleet_audit(discover_projects(projects_dir), out, workers=1, resume=True)
+
+            self.assertEqual(result.skipped, 1)
+            self.assertEqual(result.audited, 1)
+            self.assertEqual(len(result.rows), 2)
+            self.assertEqual(len(read_checkpoint(out / CHECKPOINT_NAME)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import io
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from tests.support import git, isolated_cache
+from vibe_sentinel.cache import cached_audit
+from vibe_sentinel.cli import run
+from vibe_sentinel.gitstore import GitError, GitRepository, revision_files
+
+
+setUpModule, tearDownModule = isolated_cache()
+
+
+@unittest.skipUnless(shutil.which("git"), "git is not installed")
+class GitStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name)
+        git(self.root, "init", "-q", "-b", "main")
+        (self.root / "README.md").write_text("problem install usage example\n" * 20, encoding="utf-8")
+        (self.root / "app.py").write_text('API_KEY="0123456789abcdef0123456789"\n', encoding="utf-8")
+        (self.root / "node_modules").mkdir()
+        (self.root / "node_modules" / "dep.js").write_text("x", encoding="utf-8")
+        git(self.root, "add", "-A")
+        git(self.root, "commit", "-q", "-m", "leaky")
+        git(self.root, "tag", "-a", "v1", "-m", "first release")
+        (self.root / "app.py").write_text("import os\nAPI_KEY = os.environ['API_KEY']\n", encoding="utf-8")
+        (self.root / "README.md").write_text("problem install usage example\n" * 21, encoding="utf-8")
+        git(self.root, "commit", "-q", "-am", "fix leak")
+
+    def _assert_matches_git(self, repo: GitRepository) -> None:
+        for rev in ("HEAD", "HEAD~1", "main^", "v1"):
+            commit = repo.resolve(rev)
+            self.assertEqual(commit, git(self.root, "rev-parse", f"{rev}^{{commit}}"))
+            for path, entry in revision_files(repo, commit, "", {"node_modules"}).items():
+                blob = repo.read_object(entry.sha)[1]
+                self.assertEqual(blob.decode("utf-8"), git(self.root, "show", f"{commit}:{path}") + "\n")
+                self.assertEqual(repo.object_size(entry.sha), len(blob))
+
+    def test_reads_loose_and_packed_objects(self) -> None:
+        repo, prefix = GitRepository.discover(self.root / "node_modules")
+        self.assertEqual(prefix, "node_modules")
+        self._assert_matches_git(repo)
+
+        git(self.root, "gc", "-q", "--aggressive")
+        self.assertFalse(any((self.root / ".git" / "objects").glob("??/*")))
+        self._assert_matches_git(GitRepository.discover(self.root)[0])
+
+        short = git(self.root, "rev-parse", "--short", "HEAD")
+        self.assertEqual(GitRepository.discover(self.root)[0].resolve(short), git(self.root, "rev-parse", "HEAD"))
+
+    def test_audit_revision_ignores_working_tree(self) -> None:
+        (self.root / "app.py").write_text('TOKEN="abcdefabcdefabcdefabcdef"\n', encoding="utf-8")
+
+        old, _ = cached_audit(self.root, use_cache=False, rev="v1")
+        head, _ = cached_audit(self.root, use_cache=False, rev="HEAD")
+
+        secret = {report.revision: [c for c in report.checks if c.check_id == "secret_scan"][0] for report in (old, head)}
+        self.assertEqual(secret[old.revision].status, "fail")
+        self.assertEqual(secret[head.revision].status, "pass")
+        self.assertEqual(old.to_dict()["revision"], git(self.root, "rev-parse", "v1^{commit}"))
+
+    def test_unknown_revision_raises(self) -> None:
+        repo, _ = GitRepository.discover(self.root)
+        with self.assertRaises(GitError):
+            repo.resolve("does-not-exist")
+        # Files under .git that are not refs, and refs that do not hold an object id, are unknown revisions.
+        (self.root / ".git" / "refs" / "heads" / "broken").write_text("not a sha\n", encoding="utf-8")
+        for rev in ("config", "description", "refs/../config", "broken", "FETCH_HEAD"):
+            with self.subTest(rev=rev), self.assertRaisesRegex(GitError, "Unknown revision"):
+                repo.resolve(rev)
+        for argv in (["audit", str(self.root), "--since", "config"], ["history", str(self.root), "--rev", "config"]):
+            out = io.StringIO()
+            with redirect_stdout(out):
+                self.assertEqual(run(argv), 2)
+            self.assertIn("Error: Unknown revision: config", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ import tempfile
 import unittest
 from pathlib import Path
 
+from tests.support import isolated_cache
 from vibe_sentinel.gui import (
     _openclaw_execute,
     read_artifact_file,
@@ -16,6 +17,9 @@ from vibe_sentinel.gui import (
 )
 
 
+setUpModule, tearDownModule = isolated_cache()
+
+
 class GuiFlowTests(unittest.TestCase):
     def test_audit_flow_writes_report_artifacts(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
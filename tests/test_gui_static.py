@@ -2,9 +2,13 @@ from __future__ import annotations
 
 import unittest
 
+from tests.support import isolated_cache
 from vibe_sentinel.gui import _content_type
 
 
+setUpModule, tearDownModule = isolated_cache()
+
+
 class GuiStaticTests(unittest.TestCase):
     def test_content_types_for_core_assets(self) -> None:
         self.assertEqual(_content_type("/"), "text/html; charset=utf-8")
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tests.support import git, isolated_cache
+from vibe_sentinel import history
+from vibe_sentinel.cache import cached_audit
+from vibe_sentinel.history import score_history, write_history
+
+
+setUpModule, tearDownModule = isolated_cache()
+
+
+@unittest.skipUnless(shutil.which("git"), "git is not installed")
+class ScoreHistoryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name)
+        git(self.root, "init", "-q", "-b", "main")
+        (self.root / "README.md").write_text("problem install usage example\n" * 20, encoding="utf-8")
+        (self.root / "app.py").write_text('API_KEY="0123456789abcdef0123456789"\n', encoding="utf-8")
+        git(self.root, "add", "-A")
+        git(self.root, "commit", "-q", "-m", "leaky")
+        (self.root / "app.py").write_text("import os\nAPI_KEY = os.environ['API_KEY']\n", encoding="utf-8")
+        git(self.root, "commit", "-q", "-am", "fix leak")
+        git(self.root, "commit", "-q", "--allow-empty", "-m", "empty")
+        (self.root / "LICENSE").write_text("MIT\n", encoding="utf-8")
+        git(self.root, "add", "LICENSE")
+        git(self.root, "commit", "-q", "-m", "add license")
+
+    def test_matches_per_commit_audits_and_reuses_blobs(self) -> None:
+        with mock.patch.object(history, "blob_text", wraps=history.blob_text) as read:
+            result = score_history(self.root, commits=10)
+
+        self.assertEqual([point.subject for point in result.points], ["leaky", "fix leak", "empty", "add license"])
+        for point in result.points:
+            report, _ = cached_audit(self.root, use_cache=False, rev=point.commit)
+            self.assertEqual(point.scorecard, report.scorecard)
+        self.assertLess(result.points[0].scorecard.overall, result.points[-1].scorecard.overall)
+
+        # README.md is shared by every commit but read once; app.py has two versions.
+        read_shas = [call.args[1] for call in read.call_args_list]
+        self.assertEqual(len(read_shas), len(set(read_shas)))
+        self.assertEqual(len(read_shas), 3)
+        self.assertEqual(result.unique_trees, 3)
+
+    def test_limits_commits_and_writes_series(self) -> None:
+        result = score_history(self.root, commits=2)
+        self.assertEqual([point.subject for point in result.points], ["empty", "add license"])
+
+        json_path, csv_path = write_history(result, self.root / "out")
+        self.assertIn('"subject": "add license"', json_path.read_text(encoding="utf-8"))
+        self.assertEqual(len(csv_path.read_text(encoding="utf-8").splitlines()), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
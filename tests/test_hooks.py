@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tests.support import git, isolated_cache
+from vibe_sentinel import hooks
+from vibe_sentinel.hooks import HOOK_MARKER, install_hook, precommit_audit
+
+LEAK = 'API_KEY = "0123456789abcdef0123456789"\n'
+
+
+setUpModule, tearDownModule = isolated_cache()
+
+
+@unittest.skipUnless(shutil.which("git"), "git is not installed")
+class HookTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name)
+        git(self.root, "init", "-q", "-b", "main")
+        (self.root / "README.md").write_text("problem install usage example\n", encoding="utf-8")
+        (self.root / "LICENSE").write_text("MIT\n", encoding="utf-8")
+        (self.root / "fixture.py").write_text(LEAK + "# vibe-sentinel: allow-secret\n", encoding="utf-8")
+        git(self.root, "add", "-A")
+        git(self.root, "commit", "-q", "-m", "init")
+
+    def test_install_writes_executable_hook_and_keeps_foreign_hooks(self) -> None:
+        hook_path = install_hook(self.root)
+        self.assertEqual(hook_path, self.root / ".git" / "hooks" / "pre-commit")
+        self.assertIn(HOOK_MARKER, hook_path.read_text(encoding="utf-8"))
+        self.assertTrue(os.access(hook_path, os.X_OK))
+        install_hook(self.root)
+
+        hook_path.write_text("#!/bin/sh\nexit 0\n", encoding="utf-8")
+        with self.assertRaises(FileExistsError):
+            install_hook(self.root)
+        install_hook(self.root, force=True)
+        self.assertIn(HOOK_MARKER, hook_path.read_text(encoding="utf-8"))
+
+    def test_precommit_scans_staged_blobs_only(self) -> None:
+        (self.root / "app.py").write_text(LEAK, encoding="utf-8")
+        git(self.root, "add", "app.py")
+        # The working tree is clean again, but the staged blob still leaks.
+        (self.root / "app.py").write_text("API_KEY = None\n", encoding="utf-8")
+
+        with mock.patch.object(hooks, "blob_text", wraps=hooks.blob_text) as read:
+            result = precommit_audit(self.root)
+        self.assertEqual(result.staged, ["app.py"])
+        self.assertTrue(result.blocked)
+        self.assertEqual(read.call_count, 1)
+        by_id = {check.check_id: check for check in result.checks}
+        self.assertEqual(by_id["license_present"].status, "pass")
+
+        git(self.root, "add", "app.py")
+        self.assertFalse(precommit_audit(self.root).blocked)
+
+    def test_installed_hook_blocks_commit_all(self) -> None:
+        install_hook(self.root)
+        (self.root / "fixture.py").write_text(LEAK, encoding="utf-8")
+        # `commit -a` stages into a temporary index named by $GIT_INDEX_FILE, not .git/index.
+        env = {**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parents[1])}
+        env.pop("GIT_INDEX_FILE", None)
+        commit = subprocess.run(
+            ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", "commit", "-qam", "leak"],
+            cwd=self.root,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        self.assertNotEqual(commit.returncode, 0, commit.stdout + commit.stderr)
+        self.assertEqual(git(self.root, "rev-list", "--count", "HEAD"), "1")
+
+
+if __name__ == "__main__":
+    unittest.main()
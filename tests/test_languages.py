@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tests.support import isolated_cache
+from vibe_sentinel import languages
+from vibe_sentinel.cache import cached_audit
+from vibe_sentinel.checks import scan_project
+from vibe_sentinel.languages import collect_language_stats, count_lines, language_of
+from vibe_sentinel.report import write_report_files
+
+
+setUpModule, tearDownModule = isolated_cache()
+
+
+class LanguageStatsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name) / "project"
+        self.root.mkdir()
+        (self.root / "README.md").write_text("problem install usage example\n" * 20, encoding="utf-8")
+        (self.root / "app.py").write_text("print('a')\nprint('b')\nprint('c')", encoding="utf-8")
+        (self.root / "web").mkdir()
+        (self.root / "web" / "index.ts").write_text("export {}\n", encoding="utf-8")
+        (self.root / "logo.png").write_bytes(b"\x89PNG\n" * 10)
+        (self.root / "package-lock.json").write_text("{}\n" * 50, encoding="utf-8")
+
+    def test_counts_files_lines_and_bytes_per_language(self) -> None:
+        self.assertEqual(language_of("src/Dockerfile"), "Dockerfile")
+        self.assertEqual(language_of("a.unknown"), "Other")
+        self.assertEqual(count_lines(str(self.root / "app.py")), 3)
+        self.assertEqual(count_lines(str(self.root / "web" / "index.ts")), 1)
+
+        stats = collect_language_stats(self.root, scan_project(self.root).index)
+        self.assertEqual(stats.languages["Python"], {"files": 1, "lines": 3, "bytes": 32})
+        self.assertEqual(stats.languages["Markdown"]["lines"], 20)
+        self.assertEqual(stats.languages["TypeScript"]["files"], 1)
+        self.assertEqual(stats.languages["Binary"], {"files": 1, "lines": 0, "bytes": 50})
+        # The lockfile is generated and left out.
+        self.assertNotIn("JSON", stats.languages)
+        self.assertEqual(stats.totals["files"], 4)
+
+    def test_warm_run_reads_nothing(self) -> None:
+        index = scan_project(self.root).index
+        cold = collect_language_stats(self.root, index, persist=True)
+        with mock.patch.object(languages, "count_lines", side_effect=AssertionError("file was re-read")):
+            warm = collect_language_stats(self.root, index, persist=True)
+        self.assertEqual(cold, warm)
+
+        (self.root / "app.py").write_text("print('a')\n", encoding="utf-8")
+        changed = collect_language_stats(self.root, scan_project(self.root).index, persist=True)
+        self.assertEqual(changed.languages["Python"]["lines"], 1)
+
+    def test_pool_matches_serial_counts(self) -> None:
+        index = scan_project(self.root).index
+        serial = collect_language_stats(self.root, index)
+        with mock.patch.object(languages, "POOL_MIN_BYTES", 0):
+            pooled = collect_language_stats(self.root, index, workers=2)
+        self.assertEqual(serial, pooled)
+
+    def test_report_includes_stats(self) -> None:
+        report, _ = cached_audit(self.root, use_cache=False)
+        json_path, markdown_path = write_report_files(report, Path(self._tmp.name) / "out")
+        payload = json.loads(json_path.read_text(encoding="utf-8"))
+        self.assertEqual(payload["stats"], report.stats)
+        self.assertEqual(payload["stats"]["totals"]["files"], 4)
+        markdown = markdown_path.read_text(encoding="utf-8")
+        self.assertIn("## Project Size", markdown)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+from tests.support import isolated_cache
+from vibe_sentinel import monorepo as monorepo_module
+from vibe_sentinel.checks import FileStat
+from vibe_sentinel.cli import main
+from vibe_sentinel.monorepo import audit_monorepo, discover_package_roots, partition_files
+
+
+setUpModule, tearDownModule = isolated_cache()
+
+
+class MonorepoTests(unittest.TestCase):
+    def test_partition_assigns_files_to_nearest_root(self) -> None:
+        files = {
+            path: FileStat(1, 0)
+            for path in (
+                "pyproject.toml",
+                "README.md",
+                "packages/api/pyproject.toml",
+                "packages/api/src/app.py",
+                "packages/web/package.json",
+                "packages/web/nested/tool/package.json",
+                "packages/web/nested/tool/index.js",
+                "packages/web/README.md",
+            )
+        }
+        roots = discover_package_roots(files)
+        self.assertEqual(roots, [".", "packages/api", "packages/web", "packages/web/nested/tool"])
+
+        partitions = partition_files(files, roots)
+        self.assertEqual(set(partitions["."]), {"pyproject.toml", "README.md"})
+        self.assertEqual(set(partitions["packages/api"]), {"pyproject.toml", "src/app.py"})
+        self.assertEqual(set(partitions["packages/web"]), {"package.json", "README.md"})
+        self.assertEqual(set(partitions["packages/web/nested/tool"]), {"package.json", "index.js"})
+
+    def test_audit_monorepo_walks_once_and_scores_each_package(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            good = root / "packages" / "good"
+            (good / "tests").mkdir(parents=True)
+            (good / "pyproject.toml").write_text("[project]\nname='good'\n", encoding="utf-8")
+            (good / "README.md").write_text("## Problem\n## Install\n## Usage\n```bash\nrun\n```\n", encoding="utf-8")
+            (good / "LICENSE").write_text("MIT", encoding="utf-8")
+            (good / "tests" / "test_ok.py").write_text("def test_ok():\n    assert True\n", encoding="utf-8")
+            bare = root / "packages" / "bare"
+            bare.mkdir(parents=True)
+            (bare / "package.json").write_text("{}", encoding="utf-8")
+
+            with mock.patch.object(
+                monorepo_module, "scan_project", wraps=monorepo_module.scan_project
+            ) as walker:
+                report = audit_monorepo(root)
+
+            self.assertEqual(walker.call_count, 1)
+            self.assertEqual(sorted(report.packages), ["packages/bare", "packages/good"])
+            good_score = report.packages["packages/good"].scorecard.overall
+            bare_score = report.packages["packages/bare"].scorecard.overall
+            self.assertGreater(good_score, bare_score)
+            self.assertAlmostEqual(report.rollup.overall, (good_score + bare_score) / 2)
+
+            # The process pool returns the same per-package reports as the in-process path.
+            pooled = audit_monorepo(root, workers=2)
+            self.assertEqual(
+                {name: package.checks for name, package in pooled.packages.items()},
+                {name: package.checks for name, package in report.packages.items()},
+            )
+            # Package workers count lines in-process rather than each starting a nested pool.
+            with mock.patch.object(monorepo_module, "ProcessPoolExecutor", ThreadPoolExecutor), mock.patch.object(
+                monorepo_module, "collect_language_stats", wraps=monorepo_module.collect_language_stats
+            ) as stats:
+                audit_monorepo(root, workers=2)
+            self.assertEqual([call.kwargs["workers"] for call in stats.call_args_list], [1, 1])
+
+    def test_audit_command_monorepo_mode(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "libs" / "core").mkdir(parents=True)
+            (root / "libs" / "core" / "pyproject.toml").write_text("[project]\n", encoding="utf-8")
+            out = root / "out"
+
+            exit_code = main(["audit", str(root), "--monorepo", "--output-dir", str(out)])
+            self.assertEqual(exit_code, 0)
+            self.assertTrue((out / "packages" / "libs__core" / "report.json").exists())
+            summary = json.loads((out / "monorepo.json").read_text(encoding="utf-8"))
+            self.assertEqual(summary["packages"][0]["package"], "libs/core")
+            self.assertIn("rollup", summary)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from tests.support import isolated_cache
+from vibe_sentinel.cache import cached_audit
+from vibe_sentinel.sampling import estimate_leak_rate, plan_sample
+
+
+setUpModule, tearDownModule = isolated_cache()
+
+
+class PlanSampleTests(unittest.TestCase):
+    def test_stratifies_and_always_includes_risky_names(self) -> None:
+        candidates = [f"src/m{i}.py" for i in range(80)] + [f"web/p{i}.js" for i in range(20)]
+        candidates += [".env", "app/config.yaml", "deploy/settings.py"]
+
+        plan = plan_sample(candidates, rate=0.1, seed=7)
+        self.assertEqual(plan.risky, {".env", "app/config.yaml", "deploy/settings.py"})
+        self.assertTrue(plan.risky <= plan.selected)
+        self.assertEqual(plan.strata, {"src|.py": (80, 8), "web|.js": (20, 2)})
+        self.assertEqual(plan.population, 103)
+        self.assertEqual(plan, plan_sample(reversed(candidates), rate=0.1, seed=7))
+
+        budgeted = plan_sample(candidates, budget=13)
+        self.assertEqual(len(budgeted.selected), 13)
+        with self.assertRaises(ValueError):
+            plan_sample(candidates, rate=0.1, budget=5)
+
+    def test_estimate_bounds_the_unscanned_leak_rate(self) -> None:
+        candidates = [f"src/m{i}.py" for i in range(1000)]
+        plan = plan_sample(candidates, rate=0.1)
+        clean = estimate_leak_rate(plan, [])
+        self.assertEqual(clean.leak_rate, 0.0)
+        self.assertGreater(clean.upper_bound, 0.0)
+        self.assertLess(clean.upper_bound, 0.05)
+
+        hit = sorted(plan.selected)[:10]
+        leaky = estimate_leak_rate(plan, hit)
+        self.assertAlmostEqual(leaky.leak_rate, 0.1)
+        self.assertGreater(leaky.upper_bound, leaky.leak_rate)
+        self.assertEqual(estimate_leak_rate(plan_sample(candidates, rate=1.0), []).upper_bound, 0.0)
+
+
+class SampledAuditTests(unittest.TestCase):
+    def test_sampled_report_is_marked_and_never_passes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "README.md").write_text("## Problem\n## Installation\n## Usage\n", encoding="utf-8")
+            (root / "src").mkdir()
+            for i in range(40):
+                (root / "src" / f"m{i}.py").write_text("x = 1\n", encoding="utf-8")
+            (root / ".env").write_text("API_KEY=0123456789abcdef0123456789\n", encoding="utf-8")
+
+            report, cache_hit = cached_audit(root, use_cache=False, sample_budget=5)
+            self.assertFalse(cache_hit)
+            self.assertTrue(report.sampling["sampled"])
+            self.assertEqual(report.sampling["risky_hits"], 1)
+            secret = next(check for check in report.checks if check.check_id == "secret_scan")
+            self.assertEqual(secret.status, "fail")
+            self.assertIn("SAMPLED", secret.detail)
+            # Path-registered rules still read unsampled files.
+            problem = next(check for check in report.checks if check.check_id == "problem_statement")
+            self.assertNotEqual(problem.status, "fail")
+
+            (root / ".env").unlink()
+            report, _ = cached_audit(root, use_cache=False, sample_rate=0.5)
+            secret = next(check for check in report.checks if check.check_id == "secret_scan")
+            self.assertEqual(secret.status, "warn")
+            self.assertIn("sampling", report.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
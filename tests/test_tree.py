@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from tests.support import isolated_cache
+from vibe_sentinel.tree import scan_tree
+
+
+setUpModule, tearDownModule = isolated_cache()
+
+
+def _bump_mtime(path: Path, offset_ns: int = 5_000_000_000) -> None:
+    info = path.stat()
+    os.utime(path, ns=(info.st_atime_ns, info.st_mtime_ns + offset_ns))
+
+
+class MerkleTreeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        base = Path(self._tmp.name)
+        self.root = base / "project"
+        self.state = base / "state" / "tree.json"
+        (self.root / "src" / "pkg").mkdir(parents=True)
+        (self.root / "node_modules").mkdir()
+        (self.root / "README.md").write_text("readme", encoding="utf-8")
+        (self.root / "src" / "pkg" / "core.py").write_text("x = 1\n", encoding="utf-8")
+        (self.root / "node_modules" / "dep.js").write_text("ignored", encoding="utf-8")
+
+    def _scan(self, ignore: tuple[str, ...] = ()):
+        return scan_tree(self.root, {"node_modules"}, ignore=ignore, state_path=self.state, persist=True)
+
+    def test_first_scan_indexes_files_and_persists_state(self) -> None:
+        scan = self._scan()
+        self.assertEqual(set(scan.index), {"README.md", "src/pkg/core.py"})
+        self.assertEqual(scan.reused_listings, 0)
+        self.assertTrue(self.state.exists())
+
+    def test_unchanged_tree_reuses_listings_and_digest(self) -> None:
+        first = self._scan()
+        second = self._scan()
+        self.assertEqual(first.digest, second.digest)
+        self.assertEqual(second.reused_listings, 3)
+
+    def test_in_place_edit_changes_root_digest(self) -> None:
+        first = self._scan()
+        core = self.root / "src" / "pkg" / "core.py"
+        core.write_text("x = 2\n", encoding="utf-8")
+        _bump_mtime(core)
+
+        second = self._scan()
+        self.assertNotEqual(first.digest, second.digest)
+
+    def test_added_and_removed_files_update_the_index(self) -> None:
+        first = self._scan()
+        (self.root / "README.md").unlink()
+        (self.root / "src" / "new.py").write_text("y = 1\n", encoding="utf-8")
+
+        scan = self._scan()
+        self.assertEqual(set(scan.index), {"src/new.py", "src/pkg/core.py"})
+        self.assertNotEqual(first.digest, scan.digest)
+
+    def test_ignored_files_do_not_affect_digest(self) -> None:
+        ignore = (".vibe-sentinel/report.json",)
+        first = self._scan(ignore)
+        (self.root / ".vibe-sentinel").mkdir()
+        (self.root / ".vibe-sentinel" / "report.json").write_text("{}", encoding="utf-8")
+
+        second = self._scan(ignore)
+        self.assertEqual(first.digest, second.digest)
+        self.assertIn(".vibe-sentinel/report.json", second.index)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tests.support import isolated_cache
+from vibe_sentinel.cache import cached_audit
+from vibe_sentinel.storage import CACHE_DIR_ENV
+from vibe_sentinel.watch import IncrementalAuditor, WatchUpdate, watch
+
+LEAK = 'API_KEY = "0123456789abcdef0123456789"\n'
+
+
+setUpModule, tearDownModule = isolated_cache()
+
+
+class WatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name) / "project"
+        self.root.mkdir()
+        patcher = mock.patch.dict(os.environ, {CACHE_DIR_ENV: str(Path(self._tmp.name) / "cache")})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        (self.root / "README.md").write_text("hello\n", encoding="utf-8")
+        (self.root / "app.py").write_text("print('hi')\n", encoding="utf-8")
+        self.output_dir = self.root / ".vibe-sentinel"
+
+    def _touch(self, name: str, text: str) -> None:
+        path = self.root / name
+        path.write_text(text, encoding="utf-8")
+        # Make sure the change is visible even on filesystems with coarse mtimes.
+        stamp = time.time_ns() + 1_000_000_000
+        os.utime(path, ns=(stamp, stamp))
+
+    def test_refresh_reruns_only_affected_checks(self) -> None:
+        auditor = IncrementalAuditor(self.root, self.output_dir)
+        self.assertEqual(len(auditor.full().rerun), 14)
+        self.assertIsNone(auditor.refresh())
+
+        self._touch("app.py", LEAK)
+        update = auditor.refresh()
+        self.assertEqual(update.changed, ["app.py"])
+        self.assertEqual(update.rerun, ["secret_scan", "duplicate_files", "binary_assets"])
+        self.assertEqual(update.report.checks, cached_audit(self.root, use_cache=False)[0].checks)
+        self.assertIn("app.py", (self.output_dir / "report.md").read_text(encoding="utf-8"))
+
+        self._touch("README.md", "## Problem\nWho it is for.\n## Installation\npip install x\n")
+        update = auditor.refresh()
+        self.assertIn("problem_statement", update.rerun)
+        self.assertNotIn("ci_present", update.rerun)
+
+        (self.root / "app.py").unlink()
+        update = auditor.refresh()
+        self.assertIn("tests_present", update.rerun)
+        self.assertEqual(update.report.checks, cached_audit(self.root, use_cache=False)[0].checks)
+
+    def _watch_until_change(self, poll: bool) -> list[WatchUpdate]:
+        stop = threading.Event()
+        updates: list[WatchUpdate] = []
+        ready = threading.Event()
+
+        def on_update(update: WatchUpdate) -> None:
+            updates.append(update)
+            ready.set()
+            if len(updates) > 1:
+                stop.set()
+
+        thread = threading.Thread(
+            target=watch,
+            args=(self.root, self.output_dir, on_update),
+            kwargs={"debounce": 0.05, "interval": 0.05, "poll": poll, "stop": stop},
+            daemon=True,
+        )
+        thread.start()
+        self.assertTrue(ready.wait(5))
+        self._touch("app.py", LEAK)
+        thread.join(5)
+        stop.set()
+        self.assertFalse(thread.is_alive())
+        return updates
+
+    def test_polling_watch_rewrites_reports(self) -> None:
+        updates = self._watch_until_change(poll=True)
+        self.assertEqual(updates[1].changed, ["app.py"])
+        self.assertIn("app.py", (self.output_dir / "report.md").read_text(encoding="utf-8"))
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "inotify is Linux-only")
+    def test_inotify_watch_rewrites_reports(self) -> None:
+        updates = self._watch_until_change(poll=False)
+        self.assertEqual(updates[1].changed, ["app.py"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,17 @@
-from vibe_sentinel.cli import main
+import sys
 
-raise SystemExit(main())
+from vibe_sentinel.daemon_client import forward
+
+
+def main() -> int:
+    """Entry point for ``vibe-sentinel``: try the warm daemon before importing the CLI."""
+    code = forward(sys.argv[1:])
+    if code is None:
+        from vibe_sentinel.cli import run
+
+        code = run(sys.argv[1:])
+    return code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
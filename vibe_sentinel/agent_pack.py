@@ -2,9 +2,13 @@ from __future__ import annotations
 
 import json
 import re
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from vibe_sentinel.models import AuditReport
+from vibe_sentinel.report import report_payload
+
 SEVERITY_ORDER = {"high": 0, "medium": 1, "low": 2}
 
 TASK_PLAYBOOK: dict[str, dict[str, Any]] = {
@@ -68,6 +72,16 @@ TASK_PLAYBOOK: dict[str, dict[str, Any]] = {
         "outcome": "Dedicated differentiation artifact exists and is linked.",
         "checks": ["Differentiation Artifact returns PASS."],
     },
+    "duplicate_files": {
+        "files": ["duplicated directories listed in the audit detail"],
+        "outcome": "Copied directories and files are removed or shared from one place.",
+        "checks": ["Duplicate Files returns PASS."],
+    },
+    "binary_assets": {
+        "files": [".gitattributes", "directories listed in the audit detail"],
+        "outcome": "Large media and build artifacts live in Git LFS or release assets, not in plain git.",
+        "checks": ["Large Binary Assets returns PASS."],
+    },
 }
 
 
@@ -181,9 +195,9 @@ def _safe_slug(value: str) -> str:
     return slug or "task"
 
 
-def write_prompt_files(tasks: list[dict[str, Any]], prompts_dir: Path, project_path: Path) -> list[dict[str, Any]]:
-    prompts_dir.mkdir(parents=True, exist_ok=True)
-
+def prompt_files(tasks: list[dict[str, Any]], prompts_dir: Path, project_path: Path) -> dict[Path, str]:
+    """Render one prompt file per task and record its path in the task's ``prompt_file``."""
+    prompts: dict[Path, str] = {}
     for task in tasks:
         slug = _safe_slug(task.get("title", task["task_id"]))
         filename = f"{task['task_id']}-{slug}.txt"
@@ -199,10 +213,10 @@ def write_prompt_files(tasks: list[dict[str, Any]], prompts_dir: Path, project_p
         for command in task["verification_commands"]:
             content.append(f"- {command}")
 
-        path.write_text("\n".join(content) + "\n", encoding="utf-8")
+        prompts[path] = "\n".join(content) + "\n"
         task["prompt_file"] = str(path)
 
-    return tasks
+    return prompts
 
 
 def agent_runbook_markdown(tasks: list[dict[str, Any]], project_path: Path) -> str:
@@ -308,27 +322,72 @@ def agent_pack_markdown(
     return "\n".join(lines) + "\n"
 
 
-def write_agent_pack(
-    report_json_path: Path,
+@dataclass(frozen=True)
+class AgentPack:
+    """Every agent-pack artifact rendered in memory, with the paths ``write`` puts them at."""
+
+    project_path: Path
+    tasks: list[dict[str, Any]]
+    markdown: str
+    runbook: str
+    prompts: dict[Path, str]
+    markdown_path: Path
+    tasks_path: Path
+    runbook_path: Path
+    prompts_dir: Path
+
+    def tasks_json(self) -> str:
+        return json.dumps({"project": str(self.project_path), "tasks": self.tasks}, indent=2) + "\n"
+
+    def files(self) -> dict[Path, str]:
+        """Every file the pack writes, keyed by path."""
+        return {
+            **self.prompts,
+            self.markdown_path: self.markdown,
+            self.tasks_path: self.tasks_json(),
+            self.runbook_path: self.runbook,
+        }
+
+    def write(self) -> None:
+        self.prompts_dir.mkdir(parents=True, exist_ok=True)
+        for path, content in self.files().items():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+
+
+def build_agent_pack(
+    report: AuditReport | dict[str, Any] | Path,
     output_markdown_path: Path,
     output_json_path: Path,
     project_path: Path,
     runbook_path: Path,
     prompts_dir: Path,
-) -> tuple[Path, Path, Path, int, list[dict[str, Any]]]:
-    payload = json.loads(report_json_path.read_text(encoding="utf-8"))
+) -> AgentPack:
+    """Render the pack without touching disk; the output paths only appear as references in the text."""
+    payload = report_payload(report)
     tasks = build_agent_tasks(payload, project_path)
-    tasks = write_prompt_files(tasks, prompts_dir, project_path)
-
-    runbook = agent_runbook_markdown(tasks, project_path)
-    markdown = agent_pack_markdown(payload, tasks, project_path, runbook_path)
-
-    output_markdown_path.parent.mkdir(parents=True, exist_ok=True)
-    output_json_path.parent.mkdir(parents=True, exist_ok=True)
-    runbook_path.parent.mkdir(parents=True, exist_ok=True)
+    prompts = prompt_files(tasks, prompts_dir, project_path)
+    return AgentPack(
+        project_path=project_path,
+        tasks=tasks,
+        markdown=agent_pack_markdown(payload, tasks, project_path, runbook_path),
+        runbook=agent_runbook_markdown(tasks, project_path),
+        prompts=prompts,
+        markdown_path=output_markdown_path,
+        tasks_path=output_json_path,
+        runbook_path=runbook_path,
+        prompts_dir=prompts_dir,
+    )
 
-    output_markdown_path.write_text(markdown, encoding="utf-8")
-    output_json_path.write_text(json.dumps({"project": str(project_path), "tasks": tasks}, indent=2) + "\n", encoding="utf-8")
-    runbook_path.write_text(runbook, encoding="utf-8")
 
-    return output_markdown_path, output_json_path, runbook_path, len(tasks), tasks
+def write_agent_pack(
+    report_json_path: AuditReport | dict[str, Any] | Path,
+    output_markdown_path: Path,
+    output_json_path: Path,
+    project_path: Path,
+    runbook_path: Path,
+    prompts_dir: Path,
+) -> tuple[Path, Path, Path, int, list[dict[str, Any]]]:
+    pack = build_agent_pack(report_json_path, output_markdown_path, output_json_path, project_path, runbook_path, prompts_dir)
+    pack.write()
+    return output_markdown_path, output_json_path, runbook_path, len(pack.tasks), pack.tasks
@@ -0,0 +1,468 @@
+"""Stable Python API for embedding vibe-sentinel in other services.
+
+Each function runs the same work as the matching CLI command and returns typed results instead
+of printing. Artifacts are rendered in memory from the audit report; writing them to disk is a
+last, optional step that ``write=False`` skips. The ``*_async`` variants run that blocking work on
+one shared thread pool, so an asyncio service can audit many projects concurrently.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from graphlib import TopologicalSorter
+from pathlib import Path
+from typing import Any, TypeVar
+
+from vibe_sentinel.agent_pack import AgentPack, build_agent_pack
+from vibe_sentinel.cache import cached_audit
+from vibe_sentinel.checks import select_checks
+from vibe_sentinel.coach import build_coach
+from vibe_sentinel.models import AuditReport
+from vibe_sentinel.report import report_files, roadmap_markdown, write_report_files
+from vibe_sentinel.watch import IncrementalAuditor, WatchUpdate
+
+__all__ = [
+    "AgentPackResult",
+    "AuditOptions",
+    "AuditResult",
+    "CoachResult",
+    "RoadmapResult",
+    "ShipResult",
+    "agent_pack",
+    "agent_pack_async",
+    "audit",
+    "audit_async",
+    "coach",
+    "coach_async",
+    "roadmap",
+    "roadmap_async",
+    "shared_executor",
+    "ship",
+    "ship_async",
+]
+
+ARTIFACT_DIR = ".vibe-sentinel"
+
+# Each ship stage and the stages whose results it reads. Stages whose inputs are ready run
+# concurrently, so the agent pack renders while the coach, re-audit and roadmap run.
+SHIP_STAGES: dict[str, tuple[str, ...]] = {
+    "before": (),
+    "agent_pack": ("before",),
+    "coach": ("before",),
+    "after": ("coach",),
+    "roadmap": ("after",),
+    "write": ("agent_pack", "coach", "roadmap"),
+}
+
+_T = TypeVar("_T")
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class AuditOptions:
+    """Settings shared by every API call.
+
+    ``only`` limits the audit to those check ids; ``"fast"`` selects every check that needs no
+    full tree walk. ``rev`` audits a git revision from the object store instead of the working
+    tree, always with every check. ``workers`` caps the process pool that counts lines on large trees. A single id may be
+    given as a plain string.
+    """
+
+    use_cache: bool = True
+    only: Iterable[str] | str | None = None
+    include_generated: bool = False
+    fail_fast: bool = False
+    rev: str | None = None
+    workers: int | None = None
+
+    def __post_init__(self) -> None:
+        if isinstance(self.only, str):
+            # A bare string would otherwise be iterated character by character.
+            object.__setattr__(self, "only", (self.only,))
+
+
+@dataclass(frozen=True)
+class AuditResult:
+    report: AuditReport
+    cache_hit: bool
+    report_json: Path | None = None
+    report_markdown: Path | None = None
+
+
+@dataclass(frozen=True)
+class AgentPackResult:
+    """The rendered pack; its paths are where the files are written, or would be with ``write=False``."""
+
+    audit: AuditResult
+    pack: AgentPack
+
+    @property
+    def tasks(self) -> list[dict[str, Any]]:
+        return self.pack.tasks
+
+    @property
+    def markdown(self) -> str:
+        return self.pack.markdown
+
+    @property
+    def runbook(self) -> str:
+        return self.pack.runbook
+
+    @property
+    def markdown_path(self) -> Path:
+        return self.pack.markdown_path
+
+    @property
+    def tasks_path(self) -> Path:
+        return self.pack.tasks_path
+
+    @property
+    def runbook_path(self) -> Path:
+        return self.pack.runbook_path
+
+    @property
+    def prompts_dir(self) -> Path:
+        return self.pack.prompts_dir
+
+
+@dataclass(frozen=True)
+class CoachResult:
+    audit: AuditResult
+    coach_path: Path
+    applied_files: list[Path]
+    markdown: str
+
+
+@dataclass(frozen=True)
+class RoadmapResult:
+    audit: AuditResult
+    roadmap_path: Path
+    markdown: str
+
+
+@dataclass(frozen=True)
+class ShipResult:
+    before: AuditResult
+    after: AuditResult
+    agent_pack: AgentPackResult
+    coach: CoachResult
+    roadmap: RoadmapResult
+    # Checks the incremental re-audit ran again; the rest carry over from the first audit.
+    rerun: list[str]
+    # Wall time in milliseconds of each stage in ``SHIP_STAGES`` and, as ``write.<artifact>``, of
+    # writing each artifact's files. The render stages are ``agent_pack``, ``coach`` and ``roadmap``.
+    timings: dict[str, float]
+
+    @property
+    def improvement(self) -> float:
+        return round(self.after.report.scorecard.overall - self.before.report.scorecard.overall, 2)
+
+
+def _artifact_dir(project_path: Path, output_dir: Path | str | None) -> Path:
+    return Path(output_dir) if output_dir is not None else project_path / ARTIFACT_DIR
+
+
+def audit(
+    project_path: Path | str,
+    options: AuditOptions | None = None,
+    output_dir: Path | str | None = None,
+) -> AuditResult:
+    """Audit ``project_path``; with ``output_dir``, also write ``report.json`` and ``report.md`` there.
+
+    Raises ``ValueError`` for an unknown check id or for ``only`` combined with ``rev``, and
+    ``GitError`` for a bad ``rev``.
+    """
+    options = options or AuditOptions()
+    project_path = Path(project_path).resolve()
+    output = Path(output_dir).resolve() if output_dir is not None else None
+    report, cache_hit = cached_audit(
+        project_path,
+        use_cache=options.use_cache,
+        output_dir=output,
+        rev=options.rev,
+        only=None if options.only is None else select_checks(options.only),
+        include_generated=options.include_generated,
+        fail_fast=options.fail_fast,
+        workers=options.workers,
+    )
+    if output is None:
+        return AuditResult(report, cache_hit)
+    report_json, report_markdown = write_report_files(report, output)
+    return AuditResult(report, cache_hit, report_json, report_markdown)
+
+
+def _written(audited: AuditResult, output_dir: Path) -> AuditResult:
+    report_json, report_markdown = write_report_files(audited.report, output_dir)
+    return replace(audited, report_json=report_json, report_markdown=report_markdown)
+
+
+def _write_files(files: dict[Path, str]) -> None:
+    for directory in {path.parent for path in files}:
+        directory.mkdir(parents=True, exist_ok=True)
+    for path, content in files.items():
+        path.write_text(content, encoding="utf-8")
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def _agent_pack_from(audited: AuditResult, project_path: Path, output_dir: Path) -> AgentPackResult:
+    pack = build_agent_pack(
+        audited.report,
+        output_markdown_path=output_dir / "agent_pack.md",
+        output_json_path=output_dir / "agent_tasks.json",
+        project_path=project_path,
+        runbook_path=output_dir / "agent_runbook.md",
+        prompts_dir=output_dir / "prompts",
+    )
+    return AgentPackResult(audited, pack)
+
+
+def _coach_from(audited: AuditResult, project_path: Path, output_dir: Path, apply_safe: bool) -> CoachResult:
+    markdown, applied = build_coach(audited.report, project_path, apply_safe)
+    return CoachResult(audited, output_dir / "coach.md", applied, markdown)
+
+
+def _roadmap_from(audited: AuditResult, output_dir: Path) -> RoadmapResult:
+    return RoadmapResult(audited, output_dir / "roadmap.md", roadmap_markdown(audited.report.to_dict()))
+
+
+def agent_pack(
+    project_path: Path | str,
+    options: AuditOptions | None = None,
+    output_dir: Path | str | None = None,
+    write: bool = True,
+) -> AgentPackResult:
+    """Audit, then render the agent sprint pack, task JSON, runbook and prompt files.
+
+    With ``write``, the report and the pack are written to ``output_dir`` (default
+    ``<project>/.vibe-sentinel``) as a last step; without it nothing touches disk.
+    """
+    project_path = Path(project_path).resolve()
+    output = _artifact_dir(project_path, output_dir).resolve()
+    result = _agent_pack_from(audit(project_path, options), project_path, output)
+    if not write:
+        return result
+    result.pack.write()
+    return replace(result, audit=_written(result.audit, output))
+
+
+def coach(
+    project_path: Path | str,
+    apply_safe: bool = False,
+    options: AuditOptions | None = None,
+    output_dir: Path | str | None = None,
+    write: bool = True,
+) -> CoachResult:
+    """Audit, then render the beginner fix coach; ``apply_safe`` also creates missing starter files.
+
+    ``write`` works as for ``agent_pack``; the starter files are created either way.
+    """
+    project_path = Path(project_path).resolve()
+    output = _artifact_dir(project_path, output_dir).resolve()
+    result = _coach_from(audit(project_path, options), project_path, output, apply_safe)
+    if not write:
+        return result
+    _write_files({result.coach_path: result.markdown})
+    return replace(result, audit=_written(result.audit, output))
+
+
+def roadmap(
+    project_path: Path | str,
+    options: AuditOptions | None = None,
+    output_dir: Path | str | None = None,
+    write: bool = True,
+) -> RoadmapResult:
+    """Audit, then render the prioritized roadmap; ``write`` works as for ``agent_pack``."""
+    project_path = Path(project_path).resolve()
+    output = _artifact_dir(project_path, output_dir).resolve()
+    result = _roadmap_from(audit(project_path, options), output)
+    if not write:
+        return result
+    _write_files({result.roadmap_path: result.markdown})
+    return replace(result, audit=_written(result.audit, output))
+
+
+def _run_stages(
+    graph: dict[str, tuple[str, ...]],
+    stages: dict[str, Callable[[dict[str, Any]], Any]],
+    executor: Executor,
+) -> tuple[dict[str, Any], dict[str, float]]:
+    """Run each stage on ``executor`` once the stages it reads have finished.
+
+    Each stage gets a snapshot of every result produced so far. Returns the results and each
+    stage's wall time in milliseconds; the first stage to raise stops the run.
+    """
+    sorter = TopologicalSorter(graph)
+    sorter.prepare()
+    done: dict[str, Any] = {}
+    timings: dict[str, float] = {}
+
+    def timed(name: str, inputs: dict[str, Any]) -> tuple[str, Any, float]:
+        started = time.perf_counter()
+        result = stages[name](inputs)
+        return name, result, _elapsed_ms(started)
+
+    running: set[Future[tuple[str, Any, float]]] = set()
+    while sorter.is_active():
+        running.update(executor.submit(timed, name, dict(done)) for name in sorter.get_ready())
+        finished, running = wait(running, return_when=FIRST_COMPLETED)
+        for future in finished:
+            name, done[name], timings[name] = future.result()
+            sorter.done(name)
+    return done, timings
+
+
+def ship(
+    project_path: Path | str,
+    apply_safe: bool = True,
+    options: AuditOptions | None = None,
+    output_dir: Path | str | None = None,
+    write: bool = True,
+) -> ShipResult:
+    """Run the ``SHIP_STAGES`` graph for ``project_path``, like ``vibe-sentinel ship``.
+
+    One full audit feeds the pack and the coach. The re-audit afterwards is incremental: it
+    revisits only the starter files the coach created and re-runs only the checks they affect.
+    The roadmap reads that re-audit, so it leaves out whatever those files fixed. Every artifact
+    is rendered in memory, the agent pack alongside the coach. The final ``write`` stage, skipped
+    without ``write``, writes the re-audit's report and each artifact to ``output_dir``
+    concurrently. ``ShipResult.timings`` records every stage and every artifact write.
+    Ship always audits the working tree with every check and does not read the audit cache.
+    ``only``, ``rev`` and ``fail_fast`` raise ``ValueError``.
+    """
+    options = options or AuditOptions()
+    if options.only is not None or options.rev is not None or options.fail_fast:
+        raise ValueError("ship audits the working tree with every check; only, rev and fail_fast do not apply")
+    project_path = Path(project_path).resolve()
+    output = _artifact_dir(project_path, output_dir).resolve()
+    auditor = IncrementalAuditor(
+        project_path, output, classify=not options.include_generated, workers=options.workers, write=False
+    )
+
+    def reaudit(done: dict[str, Any]) -> WatchUpdate:
+        # Nothing changed (no starter files were needed): the first audit still holds.
+        return auditor.refresh() or replace(done["before"], changed=[], rerun=[], elapsed_ms=0.0)
+
+    write_timings: dict[str, float] = {}
+
+    def write_artifact(name: str, files: dict[Path, str]) -> None:
+        started = time.perf_counter()
+        _write_files(files)
+        write_timings[f"write.{name}"] = _elapsed_ms(started)
+
+    def sink(done: dict[str, Any]) -> AuditResult:
+        after = AuditResult(done["after"].report, False)
+        if not write:
+            return after
+        artifacts = {
+            "report": report_files(after.report, output),
+            "agent_pack": done["agent_pack"].pack.files(),
+            "coach": {done["coach"].coach_path: done["coach"].markdown},
+            "roadmap": {done["roadmap"].roadmap_path: done["roadmap"].markdown},
+        }
+        for future in [pool.submit(write_artifact, name, files) for name, files in artifacts.items()]:
+            future.result()
+        report_json, report_markdown = artifacts["report"]
+        return replace(after, report_json=report_json, report_markdown=report_markdown)
+
+    def before(done: dict[str, Any]) -> AuditResult:
+        return AuditResult(done["before"].report, False)
+
+    # The write stage blocks on the artifact writes it hands to this pool. Even if every other
+    # stage were still running, they and the write stage hold at most len(SHIP_STAGES) threads,
+    # so the extra thread guarantees the writes can always make progress.
+    with ThreadPoolExecutor(max_workers=len(SHIP_STAGES) + 1, thread_name_prefix="vibe-sentinel-ship") as pool:
+        done, timings = _run_stages(
+            SHIP_STAGES,
+            {
+                "before": lambda done: auditor.full(),
+                "agent_pack": lambda done: _agent_pack_from(before(done), project_path, output),
+                "coach": lambda done: _coach_from(before(done), project_path, output, apply_safe),
+                "after": reaudit,
+                "roadmap": lambda done: _roadmap_from(AuditResult(done["after"].report, False), output),
+                "write": sink,
+            },
+            pool,
+        )
+    return ShipResult(
+        before=before(done),
+        after=done["write"],
+        agent_pack=done["agent_pack"],
+        coach=done["coach"],
+        roadmap=done["roadmap"],
+        rerun=done["after"].rerun,
+        timings={**timings, **dict(sorted(write_timings.items()))},
+    )
+
+
+def shared_executor() -> Executor:
+    """The thread pool behind every ``*_async`` call, created on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) + 4),
+                thread_name_prefix="vibe-sentinel",
+            )
+        return _executor
+
+
+async def _in_executor(func: Callable[..., _T], *args: Any) -> _T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(shared_executor(), functools.partial(func, *args))
+
+
+async def audit_async(
+    project_path: Path | str,
+    options: AuditOptions | None = None,
+    output_dir: Path | str | None = None,
+) -> AuditResult:
+    return await _in_executor(audit, project_path, options, output_dir)
+
+
+async def agent_pack_async(
+    project_path: Path | str,
+    options: AuditOptions | None = None,
+    output_dir: Path | str | None = None,
+    write: bool = True,
+) -> AgentPackResult:
+    return await _in_executor(agent_pack, project_path, options, output_dir, write)
+
+
+async def coach_async(
+    project_path: Path | str,
+    apply_safe: bool = False,
+    options: AuditOptions | None = None,
+    output_dir: Path | str | None = None,
+    write: bool = True,
+) -> CoachResult:
+    return await _in_executor(coach, project_path, apply_safe, options, output_dir, write)
+
+
+async def roadmap_async(
+    project_path: Path | str,
+    options: AuditOptions | None = None,
+    output_dir: Path | str | None = None,
+    write: bool = True,
+) -> RoadmapResult:
+    return await _in_executor(roadmap, project_path, options, output_dir, write)
+
+
+async def ship_async(
+    project_path: Path | str,
+    apply_safe: bool = True,
+    options: AuditOptions | None = None,
+    output_dir: Path | str | None = None,
+    write: bool = True,
+) -> ShipResult:
+    return await _in_executor(ship, project_path, apply_safe, options, output_dir, write)
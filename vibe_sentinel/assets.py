@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from pathlib import PurePosixPath
+
+from vibe_sentinel.tree import FileStat
+
+BINARY_SUFFIXES = {
+    # media
+    ".mp4", ".mov", ".avi", ".mkv", ".webm", ".mp3", ".wav", ".m4a", ".flac", ".ogg", ".aac",
+    ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tiff", ".psd", ".webp", ".ico",
+    # archives and packages
+    ".zip", ".tar", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar", ".whl", ".jar", ".dmg", ".iso",
+    # compiled and data blobs
+    ".exe", ".dll", ".so", ".dylib", ".bin", ".o", ".a", ".pdf",
+    ".pt", ".pth", ".ckpt", ".onnx", ".h5", ".safetensors", ".npy", ".npz", ".parquet", ".sqlite", ".db",
+}
+
+LARGE_BINARY_BYTES = 1 << 20
+FILE_WARN_BYTES = 5 << 20
+DIRECTORY_WARN_BYTES = 10 << 20
+
+
+@dataclass(frozen=True)
+class BinaryWeight:
+    """Binary files at or above ``LARGE_BINARY_BYTES`` and total binary bytes per directory."""
+
+    large: list[tuple[str, int]]
+    by_directory: dict[str, int]
+    total_bytes: int
+    lfs_tracked: int = 0
+
+    @property
+    def heavy_directories(self) -> list[tuple[str, int]]:
+        heavy = [(directory, size) for directory, size in self.by_directory.items() if size >= DIRECTORY_WARN_BYTES]
+        return sorted(heavy, key=lambda item: (-item[1], item[0]))
+
+    @property
+    def oversized(self) -> list[tuple[str, int]]:
+        return [(path, size) for path, size in self.large if size >= FILE_WARN_BYTES]
+
+
+def parse_lfs_patterns(gitattributes: str) -> list[str]:
+    """Return the ``.gitattributes`` patterns routed through Git LFS."""
+    patterns: list[str] = []
+    for line in gitattributes.splitlines():
+        parts = line.split()
+        if len(parts) >= 2 and not parts[0].startswith("#") and "filter=lfs" in parts[1:]:
+            patterns.append(parts[0])
+    return patterns
+
+
+def _lfs_tracked(relative_path: str, patterns: list[str]) -> bool:
+    name = PurePosixPath(relative_path).name
+    for pattern in patterns:
+        # Like gitattributes: slash-free patterns match the file name at any depth.
+        if "/" in pattern.strip("/"):
+            if fnmatchcase(relative_path, pattern.lstrip("/")):
+                return True
+        elif fnmatchcase(name, pattern.strip("/")):
+            return True
+    return False
+
+
+def binary_weight(index: dict[str, FileStat], lfs_patterns: list[str] | None = None) -> BinaryWeight:
+    """Tally binary files by suffix from stat sizes alone, in one pass and without reading content."""
+    large: list[tuple[str, int]] = []
+    by_directory: dict[str, int] = defaultdict(int)
+    total = 0
+    tracked = 0
+    for rel_path, file_stat in index.items():
+        if PurePosixPath(rel_path).suffix.lower() not in BINARY_SUFFIXES:
+            continue
+        if lfs_patterns and _lfs_tracked(rel_path, lfs_patterns):
+            tracked += 1
+            continue
+        total += file_stat.size
+        by_directory[rel_path.rpartition("/")[0] or "."] += file_stat.size
+        if file_stat.size >= LARGE_BINARY_BYTES:
+            large.append((rel_path, file_stat.size))
+    large.sort(key=lambda item: (-item[1], item[0]))
+    return BinaryWeight(large=large, by_directory=dict(by_directory), total_bytes=total, lfs_tracked=tracked)
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Callable, Iterable
+from dataclasses import replace
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from vibe_sentinel import __version__
+from vibe_sentinel.checks import (
+    CHECK_SPECS,
+    CONTENT_RULES,
+    EXCLUDED_DIRS,
+    SECRET_PATTERN_SOURCES,
+    TEXT_SUFFIXES,
+    AuditContext,
+    FileStat,
+    build_context,
+    compute_scorecard,
+    evaluate_checks,
+    lazy_context,
+    scan_project,
+    secret_candidates,
+)
+from vibe_sentinel.gitstore import GitRepository, blob_text, revision_files
+from vibe_sentinel.languages import collect_language_stats
+from vibe_sentinel.models import AuditReport, CheckResult
+from vibe_sentinel.report import build_audit_report
+from vibe_sentinel.sampling import estimate_leak_rate, plan_sample
+from vibe_sentinel.storage import cache_root, evict_lru, write_json_atomic
+
+DEFAULT_MAX_ENTRIES = 256
+
+# Bump when check logic changes in a way the spec and rule tables below do not capture.
+RULES_VERSION = 4
+
+REPORT_ARTIFACTS = ("report.json", "report.md")
+
+
+def default_cache_dir() -> Path:
+    return cache_root() / "audits"
+
+
+@lru_cache(maxsize=1)
+def rules_fingerprint() -> str:
+    digest = hashlib.sha256()
+    digest.update(f"{__version__}:{RULES_VERSION}".encode("utf-8"))
+    digest.update(repr(CHECK_SPECS).encode("utf-8"))
+    digest.update(repr(sorted(rule.rule_id for rule in CONTENT_RULES)).encode("utf-8"))
+    digest.update(repr(list(SECRET_PATTERN_SOURCES)).encode("utf-8"))
+    digest.update(repr((sorted(TEXT_SUFFIXES), sorted(EXCLUDED_DIRS))).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def tree_fingerprint(root: Path, tree_digest: str, include_generated: bool = False) -> str:
+    """Combine the project path, the Merkle root digest of its files, and the rules version."""
+    payload = f"{rules_fingerprint()}\0{root.resolve()}\0{tree_digest}\0{int(include_generated)}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AuditCache:
+    """A directory of report payloads keyed by tree fingerprint, evicted least-recently-used first."""
+
+    def __init__(self, directory: Path | None = None, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.directory = directory or default_cache_dir()
+        self.max_entries = max(1, max_entries)
+
+    def _entry_path(self, fingerprint: str) -> Path:
+        return self.directory / f"{fingerprint}.json"
+
+    def get(self, fingerprint: str) -> dict[str, Any] | None:
+        path = self._entry_path(fingerprint)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            # Touch the entry so eviction order follows last use, not creation.
+            os.utime(path)
+        except (OSError, json.JSONDecodeError):
+            return None
+        return payload if isinstance(payload, dict) else None
+
+    def put(self, fingerprint: str, payload: dict[str, Any]) -> None:
+        try:
+            write_json_atomic(self._entry_path(fingerprint), payload)
+            evict_lru(self.directory, self.max_entries)
+        except OSError:
+            return
+
+
+def report_ignores(project_path: Path, output_dir: Path | None) -> list[str]:
+    """Return the ignore patterns for the audit's own report files, so they never invalidate the next audit."""
+    output_dir = (output_dir or project_path / ".vibe-sentinel").resolve()
+    try:
+        relative = output_dir.relative_to(project_path.resolve()).as_posix()
+    except ValueError:
+        return []
+    prefix = "" if relative == "." else f"{relative}/"
+    return [f"{prefix}{name}" for name in REPORT_ARTIFACTS]
+
+
+def _load_cached_report(cache: AuditCache, fingerprint: str) -> AuditReport | None:
+    payload = cache.get(fingerprint)
+    if payload is None:
+        return None
+    try:
+        report = AuditReport.from_dict(payload)
+    except (KeyError, TypeError, ValueError):
+        return None
+    return replace(report, generated_at=datetime.now(timezone.utc).isoformat())
+
+
+def _replay(report: AuditReport, on_check: Callable[[CheckResult], None] | None) -> None:
+    if on_check is not None:
+        for check in report.checks:
+            on_check(check)
+
+
+def revision_context(
+    project_path: Path,
+    repo: GitRepository,
+    commit_sha: str,
+    prefix: str = "",
+    classify: bool = True,
+    fail_fast: bool = False,
+) -> AuditContext:
+    """Build an audit context for ``project_path`` as of a commit, reading blobs from the object store."""
+    commit = repo.commit(commit_sha)
+    entries = revision_files(repo, commit_sha, prefix, EXCLUDED_DIRS)
+    committed_ns = commit.timestamp * 1_000_000_000
+    index = {path: FileStat(repo.object_size(entry.sha), committed_ns) for path, entry in entries.items()}
+    return build_context(
+        project_path,
+        index=index,
+        read_text=lambda rel_path: blob_text(repo, entries[rel_path].sha),
+        classify=classify,
+        blob_ids={path: entry.sha for path, entry in entries.items()},
+        fail_fast=fail_fast,
+    )
+
+
+def cached_audit(
+    project_path: Path,
+    use_cache: bool = True,
+    cache: AuditCache | None = None,
+    output_dir: Path | None = None,
+    rev: str | None = None,
+    only: Iterable[str] | None = None,
+    include_generated: bool = False,
+    sample_rate: float | None = None,
+    sample_budget: int | None = None,
+    sample_seed: int = 0,
+    fail_fast: bool = False,
+    workers: int | None = None,
+    on_check: Callable[[CheckResult], None] | None = None,
+) -> tuple[AuditReport, bool]:
+    """Audit ``project_path``, reusing a stored report when the tree fingerprint is unchanged.
+
+    With ``rev``, the project is read from that git revision instead of the working tree.
+    With ``only``, just those checks run against a lazy context and the audit cache is neither
+    read nor written; the tree is walked only if a selected check needs the full file list.
+    ``include_generated`` lets the broad content checks scan generated, vendored and
+    tool-output files too.
+    ``sample_rate`` or ``sample_budget`` limits the secret scan to a stratified sample; such
+    reports carry a ``sampling`` block, skip language stats, and are never cached.
+    ``fail_fast`` stops the secret scan at its first hit; a cached full report still
+    answers it, but its own (possibly truncated) result is not stored. ``workers`` caps the
+    process pool that counts lines on large trees. ``on_check`` receives each check result as
+    soon as it is ready (cheap checks first), or every cached result at once on a cache hit.
+    Returns the report and whether it came from the cache. ``rev`` cannot be combined with
+    ``only`` or sampling and raises ``ValueError``.
+    """
+    if rev is not None and (only is not None or sample_rate is not None or sample_budget is not None):
+        raise ValueError("rev cannot be combined with only or sampling")
+    if only is not None:
+        ctx = lazy_context(project_path, classify=not include_generated, fail_fast=fail_fast, persist=True)
+        checks = evaluate_checks(ctx, only, on_check)
+        return build_audit_report(project_path, checks, compute_scorecard(checks)), False
+    if rev is not None:
+        return _cached_revision_audit(project_path, rev, use_cache, cache, include_generated, fail_fast, on_check)
+
+    tree = scan_project(project_path, ignore=report_ignores(project_path, output_dir), persist=True)
+    if sample_rate is not None or sample_budget is not None:
+        plan = plan_sample(
+            secret_candidates(tree.index, classify=not include_generated),
+            rate=sample_rate,
+            budget=sample_budget,
+            seed=sample_seed,
+        )
+        ctx = build_context(
+            project_path, tree=tree, classify=not include_generated, sample=plan, defer=True, persist=True
+        )
+        checks = evaluate_checks(ctx, on_check=on_check)
+        sampling = estimate_leak_rate(plan, ctx.content.get("secret_scan", {})).to_dict()
+        return build_audit_report(project_path, checks, compute_scorecard(checks), sampling=sampling), False
+
+    fingerprint = ""
+    if use_cache:
+        cache = cache or AuditCache()
+        fingerprint = tree_fingerprint(project_path, tree.digest, include_generated)
+        report = _load_cached_report(cache, fingerprint)
+        if report is not None:
+            _replay(report, on_check)
+            return report, True
+
+    ctx = build_context(
+        project_path, tree=tree, classify=not include_generated, fail_fast=fail_fast, defer=True, persist=True
+    )
+    checks = evaluate_checks(ctx, on_check=on_check)
+    stats = collect_language_stats(project_path, tree.index, workers=workers, persist=True).to_dict()
+    report = build_audit_report(project_path, checks, compute_scorecard(checks), stats=stats)
+    if use_cache and cache is not None and not fail_fast:
+        cache.put(fingerprint, report.to_dict())
+    return report, False
+
+
+def _cached_revision_audit(
+    project_path: Path,
+    rev: str,
+    use_cache: bool,
+    cache: AuditCache | None,
+    include_generated: bool = False,
+    fail_fast: bool = False,
+    on_check: Callable[[CheckResult], None] | None = None,
+) -> tuple[AuditReport, bool]:
+    repo, prefix = GitRepository.discover(project_path)
+    commit_sha = repo.resolve(rev)
+    tree_sha = repo.subtree(repo.commit(commit_sha).tree, prefix)
+    fingerprint = tree_fingerprint(project_path, f"git-tree:{tree_sha}", include_generated)
+    if use_cache:
+        cache = cache or AuditCache()
+        report = _load_cached_report(cache, fingerprint)
+        if report is not None:
+            _replay(report, on_check)
+            return replace(report, revision=commit_sha), True
+
+    ctx = revision_context(project_path, repo, commit_sha, prefix, classify=not include_generated, fail_fast=fail_fast)
+    checks = evaluate_checks(ctx, on_check=on_check)
+    report = build_audit_report(project_path, checks, compute_scorecard(checks), revision=commit_sha)
+    if use_cache and cache is not None and not fail_fast:
+        cache.put(fingerprint, report.to_dict())
+    return report, False
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import os
 import re
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
+from vibe_sentinel.assets import binary_weight, parse_lfs_patterns
+from vibe_sentinel.classify import FileKind, classify_path, classify_text
+from vibe_sentinel.duplicates import find_duplicates, format_bytes
 from vibe_sentinel.models import CheckResult, CheckSpec, ScoreCard
+from vibe_sentinel.sampling import SamplePlan, estimate_leak_rate, is_risky
+from vibe_sentinel.tree import FileStat, TreeScan, scan_tree
 
 CHECK_SPECS: tuple[CheckSpec, ...] = (
     CheckSpec("problem_statement", "Problem Statement", "usefulness", 12),
@@ -19,6 +28,8 @@ CHECK_SPECS: tuple[CheckSpec, ...] = (
     CheckSpec("submission_template", "Submission Metadata", "impact", 5),
     CheckSpec("innovation_statement", "Innovation Positioning", "innovation", 10),
     CheckSpec("novelty_artifact", "Differentiation Artifact", "innovation", 5),
+    CheckSpec("duplicate_files", "Duplicate Files", "execution", 4),
+    CheckSpec("binary_assets", "Large Binary Assets", "execution", 4),
 )
 
 TEXT_SUFFIXES = {
@@ -51,21 +62,202 @@ EXCLUDED_DIRS = {
     ".pytest_cache",
 }
 
-SECRET_PATTERNS: tuple[re.Pattern[str], ...] = (
-    re.compile(r"sk-[A-Za-z0-9]{20,}"),
-    re.compile(r"AKIA[0-9A-Z]{16}"),
-    re.compile(r"(?i)(api[_-]?key|secret|token)\s*[:=]\s*['\"]?[A-Za-z0-9_\-]{16,}"),
+SECRET_PATTERN_SOURCES: tuple[str, ...] = (
+    r"sk-[A-Za-z0-9]{20,}",
+    r"AKIA[0-9A-Z]{16}",
+    r"(?i)(api[_-]?key|secret|token)\s*[:=]\s*['\"]?[A-Za-z0-9_\-]{16,}",
 )
 
 
-@dataclass(slots=True)
+# `.env`, `.env.local`, `.env.production` and the like: scanned whatever their suffix or generator.
+SECRET_ENV_PREFIX = ".env"
+CONFIG_SUFFIXES = {".yaml", ".yml", ".toml", ".ini", ".cfg", ".json"}
+DEMO_SCRIPT_CANDIDATES = ("DEMO_SCRIPT.md", "docs/DEMO_SCRIPT.md", ".vibe-sentinel/DEMO_SCRIPT.md")
+SUBMISSION_CANDIDATES = ("SUBMISSION.md", ".vibe-sentinel/SUBMISSION.md")
+SUBMISSION_FIELDS = ("discord", "github profile", "github repo", "demo video")
+DUPLICATE_WASTE_LIMIT = 1 << 20
+
+
+@dataclass(frozen=True)
+class ContentRule:
+    """A content check that registers interest in files by exact path, suffix, or predicate.
+
+    ``visit`` receives the relative path and decoded text of each matching file and
+    returns a finding, or ``None`` when the file has nothing to report.
+    """
+
+    rule_id: str
+    visit: Callable[[str, str], Any]
+    paths: frozenset[str] = frozenset()
+    suffixes: frozenset[str] = frozenset()
+    predicate: Callable[[str], bool] | None = None
+
+    def matches(self, relative_path: str) -> bool:
+        if relative_path in self.paths:
+            return True
+        if self.suffixes and Path(relative_path).suffix.lower() in self.suffixes:
+            return True
+        return self.predicate is not None and self.predicate(relative_path)
+
+
 class AuditContext:
-    root: Path
-    files: set[str]
-    readme_text: str
+    """Files and content-rule findings for one audit.
+
+    Given a file index the context is eager. Without one it is lazy and resolves queries in tiers:
+    ``exists`` stats one path, ``list_dir`` lists one directory, and ``finding`` reads only the
+    file a path-registered rule asks about. Only ``files``, ``stats`` and ``content`` walk the
+    whole tree. An index without ``content`` defers just the content pass to first use, and a
+    ``files`` list without ``stats`` stats only those files when sizes are first needed.
+    ``persist`` lets the walk and the duplicate check reuse and update their state under the
+    cache directory; without it the context writes nothing outside the project.
+    """
+
+    __slots__ = (
+        "root",
+        "rules",
+        "_files",
+        "_stats",
+        "_content",
+        "_readme_text",
+        "_read_text",
+        "_found",
+        "_visited",
+        "classify",
+        "file_kinds",
+        "blob_ids",
+        "sample",
+        "fail_fast",
+        "persist",
+    )
+
+    def __init__(
+        self,
+        root: Path,
+        files: set[str] | None = None,
+        readme_text: str | None = None,
+        content: dict[str, dict[str, Any]] | None = None,
+        stats: dict[str, FileStat] | None = None,
+        rules: Iterable[ContentRule] | None = None,
+        read_text: Callable[[str], str] | None = None,
+        classify: bool = True,
+        file_kinds: dict[str, FileKind] | None = None,
+        blob_ids: dict[str, str] | None = None,
+        sample: SamplePlan | None = None,
+        fail_fast: bool = False,
+        persist: bool = False,
+    ) -> None:
+        self.root = root
+        self.persist = persist
+        # Set when the secret scan only read a sample of its candidates.
+        self.sample = sample
+        self.fail_fast = fail_fast
+        # Content ids (git blob ids) the duplicate check uses instead of hashing files.
+        self.blob_ids = blob_ids
+        self.classify = classify
+        self.file_kinds: dict[str, FileKind] = {} if file_kinds is None else file_kinds
+        self.rules = tuple(CONTENT_RULES if rules is None else rules)
+        self._files = files
+        self._stats = stats
+        self._content = content
+        self._readme_text = readme_text
+        self._read_text = read_text or (lambda rel_path: read_text_file(root / rel_path))
+        self._found: dict[str, dict[str, Any]] = {rule.rule_id: {} for rule in self.rules}
+        self._visited: set[str] = set()
+
+    @property
+    def lazy(self) -> bool:
+        return self._files is None
+
+    def _walk(self) -> None:
+        tree = scan_project(self.root, persist=self.persist)
+        self._stats = tree.index
+        self._files = set(tree.index)
+
+    @property
+    def files(self) -> set[str]:
+        if self._files is None:
+            self._walk()
+        return self._files  # type: ignore[return-value]
+
+    @property
+    def stats(self) -> dict[str, FileStat]:
+        if self._stats is None:
+            if self._files is None:
+                self._walk()
+            else:
+                # A caller-supplied file list without stats: stat just those files instead of walking.
+                self._stats = _stat_files(self.root, self._files)
+        return self._stats  # type: ignore[return-value]
+
+    @property
+    def content(self) -> dict[str, dict[str, Any]]:
+        if self._content is None:
+            # Files already read for targeted findings are not read again.
+            content = visit_files(
+                self.root,
+                self.files - self._visited,
+                self.rules,
+                self._read_text,
+                self.classify,
+                self.file_kinds,
+                stats=self.stats,
+                fail_fast=self.fail_fast,
+            )
+            for rule_id, found in self._found.items():
+                content.setdefault(rule_id, {}).update(found)
+            self._content = content
+        return self._content
+
+    @property
+    def readme_text(self) -> str:
+        if self._readme_text is None:
+            self._readme_text = self.finding("readme", "README.md") or ""
+        return self._readme_text
 
     def exists(self, relative_path: str) -> bool:
-        return relative_path in self.files
+        if self._files is not None:
+            return relative_path in self._files
+        parts = relative_path.split("/")
+        if any(part in EXCLUDED_DIRS for part in parts[:-1]):
+            return False
+        # The walk does not follow directory symlinks, so neither does a targeted lookup.
+        for depth in range(1, len(parts)):
+            if os.path.islink(os.path.join(self.root, *parts[:depth])):
+                return False
+        return os.path.isfile(os.path.join(self.root, *parts))
+
+    def list_dir(self, directory: str) -> list[str]:
+        """Return every indexed file below ``directory``, recursively, without walking the rest of the tree."""
+        prefix = f"{directory.rstrip('/')}/"
+        if self._files is not None:
+            return sorted(path for path in self._files if path.startswith(prefix))
+        base = self.root / directory
+        if any(part in EXCLUDED_DIRS for part in prefix.split("/")) or base.is_symlink():
+            return []
+        listed: list[str] = []
+        for current, dirnames, filenames in os.walk(base):
+            dirnames[:] = [name for name in dirnames if name not in EXCLUDED_DIRS]
+            rel_dir = Path(current).relative_to(self.root).as_posix()
+            listed.extend(
+                f"{rel_dir}/{name}" for name in filenames if os.path.isfile(os.path.join(current, name))
+            )
+        return sorted(listed)
+
+    def finding(self, rule_id: str, relative_path: str) -> Any:
+        """Return ``rule_id``'s finding for one file, or ``None`` if the file is absent or clean."""
+        if self._content is not None:
+            return self._content.get(rule_id, {}).get(relative_path)
+        if not any(rule.rule_id == rule_id and relative_path in rule.paths for rule in self.rules):
+            return self.content.get(rule_id, {}).get(relative_path)
+        if relative_path not in self._visited:
+            self._visited.add(relative_path)
+            if self.exists(relative_path):
+                found, kind = visit_file(relative_path, self.rules, self._read_text, self.classify)
+                for found_rule_id, finding in found.items():
+                    self._found[found_rule_id][relative_path] = finding
+                if kind is not None:
+                    self.file_kinds[relative_path] = kind
+        return self._found.get(rule_id, {}).get(relative_path)
 
     def find_glob(self, pattern: str) -> list[str]:
         matched: list[str] = []
@@ -75,19 +267,24 @@ class AuditContext:
         return sorted(matched)
 
 
-def _collect_files(root: Path) -> set[str]:
-    files: set[str] = set()
-    for path in root.rglob("*"):
-        if any(part in EXCLUDED_DIRS for part in path.parts):
-            continue
-        if not path.is_file():
+def scan_project(root: Path, ignore: Iterable[str] = (), persist: bool = False) -> TreeScan:
+    """Index ``root``; ``persist`` reuses the stored Merkle tree so unchanged directories are not re-listed."""
+    return scan_tree(root, EXCLUDED_DIRS, ignore=ignore, persist=persist)
+
+
+def _stat_files(root: Path, files: Iterable[str]) -> dict[str, FileStat]:
+    stats: dict[str, FileStat] = {}
+    for rel_path in files:
+        try:
+            result = (root / rel_path).stat()
+        except OSError:
             continue
-        rel = path.relative_to(root).as_posix()
-        files.add(rel)
-    return files
+        stats[rel_path] = FileStat(result.st_size, result.st_mtime_ns)
+    return stats
 
 
-def _read_text_file(path: Path) -> str:
+def read_text_file(path: Path) -> str:
+    """Return a file's text, or ``""`` when it is missing, over 1 MB or unreadable."""
     if not path.exists() or not path.is_file():
         return ""
     try:
@@ -101,11 +298,212 @@ def _read_text_file(path: Path) -> str:
         return ""
 
 
-def build_context(root: Path) -> AuditContext:
-    files = _collect_files(root)
-    readme_path = root / "README.md"
-    readme_text = _read_text_file(readme_path)
-    return AuditContext(root=root, files=files, readme_text=readme_text)
+def _is_env_file(relative_path: str) -> bool:
+    return Path(relative_path).name.startswith(SECRET_ENV_PREFIX)
+
+
+def _is_secret_candidate(relative_path: str) -> bool:
+    # Test fixtures often contain fake keys. Prioritize source and config paths.
+    if relative_path.startswith("tests/") or relative_path.startswith("docs/"):
+        return False
+    path = Path(relative_path)
+    return path.suffix.lower() in TEXT_SUFFIXES or _is_env_file(relative_path)
+
+
+def secret_candidates(files: Iterable[str], classify: bool = True) -> list[str]:
+    """Return the files the secret scan would read, leaving out path-tagged files when ``classify``."""
+    return sorted(
+        rel_path
+        for rel_path in files
+        if _is_secret_candidate(rel_path)
+        and not (classify and not _is_env_file(rel_path) and classify_path(rel_path))
+    )
+
+
+def secret_risk(relative_path: str, mtime_ns: int = 0) -> tuple[int, int, str]:
+    """Sort key that puts likely leaks first: env files, config-named files, config formats, then the rest.
+
+    Within a tier, recently modified files come first.
+    """
+    name = Path(relative_path).name.lower()
+    if name.startswith(".env"):
+        tier = 0
+    elif is_risky(relative_path):
+        tier = 1
+    elif Path(name).suffix in CONFIG_SUFFIXES:
+        tier = 2
+    else:
+        tier = 3
+    return tier, -mtime_ns, relative_path
+
+
+@lru_cache(maxsize=1)
+def secret_patterns() -> tuple[re.Pattern[str], ...]:
+    """Compile ``SECRET_PATTERN_SOURCES`` on first use rather than at import time."""
+    return tuple(re.compile(source) for source in SECRET_PATTERN_SOURCES)
+
+
+def _visit_secret(relative_path: str, content: str) -> bool | None:
+    if not content or "vibe-sentinel: allow-secret" in content:
+        return None
+    for pattern in secret_patterns():
+        if pattern.search(content):
+            return True
+    return None
+
+
+def _visit_pyproject(relative_path: str, content: str) -> bool:
+    lowered = content.lower()
+    return "[project]" in lowered and "dependencies" not in lowered
+
+
+def _visit_submission(relative_path: str, content: str) -> list[str]:
+    lowered = content.lower()
+    return [item for item in SUBMISSION_FIELDS if item not in lowered]
+
+
+CONTENT_RULES: tuple[ContentRule, ...] = (
+    ContentRule("readme", lambda _, content: content, paths=frozenset({"README.md"})),
+    ContentRule(
+        "requirements",
+        lambda _, content: bool(content) and _requirements_are_pinned(content),
+        paths=frozenset({"requirements.txt"}),
+    ),
+    ContentRule("pyproject", _visit_pyproject, paths=frozenset({"pyproject.toml"})),
+    ContentRule("demo_script", lambda _, content: len(content.split()), paths=frozenset(DEMO_SCRIPT_CANDIDATES)),
+    ContentRule("submission_template", _visit_submission, paths=frozenset(SUBMISSION_CANDIDATES)),
+    ContentRule("gitattributes", lambda _, content: parse_lfs_patterns(content), paths=frozenset({".gitattributes"})),
+    ContentRule("secret_scan", _visit_secret, predicate=_is_secret_candidate),
+)
+
+
+def visit_file(
+    relative_path: str,
+    rules: Iterable[ContentRule],
+    read_text: Callable[[str], str],
+    classify: bool = True,
+) -> tuple[dict[str, Any], FileKind | None]:
+    """Run the rules interested in one file and return their findings plus the file's classifier tag.
+
+    Generated, vendored and tool-output files are only visited by rules that registered their
+    exact path; suffix and predicate rules skip them. Path signals are checked before reading,
+    header markers and minification on the text that is read anyway.
+    """
+    interested = [rule for rule in rules if rule.matches(relative_path)]
+    if not interested:
+        return {}, None
+    # Env files are where real secrets live, whatever tool wrote them.
+    classify = classify and not _is_env_file(relative_path)
+    kind = classify_path(relative_path) if classify else None
+    if kind is not None:
+        interested = [rule for rule in interested if relative_path in rule.paths]
+        if not interested:
+            return {}, kind
+    content = read_text(relative_path)
+    if classify and kind is None:
+        kind = classify_text(content)
+        if kind is not None:
+            interested = [rule for rule in interested if relative_path in rule.paths]
+    found: dict[str, Any] = {}
+    for rule in interested:
+        finding = rule.visit(relative_path, content)
+        if finding is not None:
+            found[rule.rule_id] = finding
+    return found, kind
+
+
+def visit_files(
+    root: Path,
+    files: Iterable[str],
+    rules: Iterable[ContentRule] = CONTENT_RULES,
+    read_text: Callable[[str], str] | None = None,
+    classify: bool = True,
+    kinds: dict[str, FileKind] | None = None,
+    stats: dict[str, FileStat] | None = None,
+    fail_fast: bool = False,
+) -> dict[str, dict[str, Any]]:
+    """Read every file wanted by at least one rule exactly once and fan its text out to those rules.
+
+    ``read_text`` maps a relative path to its text; it defaults to reading from the working tree.
+    Classifier tags of the files considered are recorded into ``kinds`` when it is given.
+    Files are visited in ``secret_risk`` order, using mtimes from ``stats`` when given. With
+    ``fail_fast`` the secret scan stops at its first hit while the other rules keep reading.
+    """
+    if read_text is None:
+        read_text = lambda rel_path: read_text_file(root / rel_path)  # noqa: E731
+    rules = tuple(rules)
+    results: dict[str, dict[str, Any]] = {rule.rule_id: {} for rule in rules}
+    stats = stats or {}
+
+    def risk(rel_path: str) -> tuple[int, int, str]:
+        file_stat = stats.get(rel_path)
+        return secret_risk(rel_path, file_stat.mtime_ns if file_stat else 0)
+
+    for rel_path in sorted(files, key=risk):
+        found, kind = visit_file(rel_path, rules, read_text, classify)
+        for rule_id, finding in found.items():
+            results[rule_id][rel_path] = finding
+        if kind is not None and kinds is not None:
+            kinds[rel_path] = kind
+        if fail_fast and "secret_scan" in found:
+            rules = tuple(rule for rule in rules if rule.rule_id != "secret_scan")
+    return results
+
+
+def build_context(
+    root: Path,
+    rules: Iterable[ContentRule] = CONTENT_RULES,
+    index: dict[str, FileStat] | None = None,
+    tree: TreeScan | None = None,
+    read_text: Callable[[str], str] | None = None,
+    scope: Iterable[str] | None = None,
+    content: dict[str, dict[str, Any]] | None = None,
+    classify: bool = True,
+    blob_ids: dict[str, str] | None = None,
+    sample: SamplePlan | None = None,
+    fail_fast: bool = False,
+    defer: bool = False,
+    persist: bool = False,
+) -> AuditContext:
+    """Build the audit context from a pre-collected file index, a tree scan, or a fresh scan of ``root``.
+
+    With ``scope``, content rules only read those files; existence checks still see the full index.
+    With ``sample``, the secret scan reads only the sampled candidates and reports an estimate.
+    With ``fail_fast``, the secret scan stops at its first hit.
+    Callers that already hold per-rule findings pass them as ``content`` to skip the visit entirely.
+    ``classify=False`` lets broad content rules see generated, vendored and tool-output files too.
+    ``blob_ids`` supplies content ids (git blob ids), so the duplicate check hashes nothing.
+    With ``defer``, the content rules run when a check first needs them instead of up front.
+    ``persist`` is as for ``AuditContext``.
+    """
+    if index is None:
+        tree = tree or scan_project(root, persist=persist)
+        index = tree.index
+    files = set(index)
+    kinds: dict[str, FileKind] = {}
+    if sample is not None:
+        rules = tuple(
+            replace(rule, predicate=sample.selected.__contains__) if rule.rule_id == "secret_scan" else rule
+            for rule in rules
+        )
+    if content is None and not defer:
+        scoped = files if scope is None else files.intersection(scope)
+        content = visit_files(root, scoped, rules, read_text, classify, kinds, stats=index, fail_fast=fail_fast)
+    readme_text = None if content is None else content.get("readme", {}).get("README.md", "")
+    return AuditContext(
+        root=root,
+        files=files,
+        rules=rules,
+        readme_text=readme_text,
+        content=content,
+        stats=index,
+        classify=classify,
+        file_kinds=kinds,
+        blob_ids=blob_ids,
+        sample=sample,
+        fail_fast=fail_fast,
+        persist=persist,
+    )
 
 
 def _check_problem_statement(ctx: AuditContext, spec: CheckSpec) -> CheckResult:
@@ -256,11 +654,7 @@ def _check_tests_present(ctx: AuditContext, spec: CheckSpec) -> CheckResult:
 
 
 def _check_ci_present(ctx: AuditContext, spec: CheckSpec) -> CheckResult:
-    workflows = [
-        path
-        for path in ctx.files
-        if path.startswith(".github/workflows/") and (path.endswith(".yml") or path.endswith(".yaml"))
-    ]
+    workflows = [path for path in ctx.list_dir(".github/workflows") if path.endswith(".yml") or path.endswith(".yaml")]
     if workflows:
         return CheckResult(
             spec.check_id,
@@ -307,7 +701,7 @@ def _check_dependency_lock(ctx: AuditContext, spec: CheckSpec) -> CheckResult:
         "yarn.lock",
         "bun.lockb",
     }
-    if any(lockfile in ctx.files for lockfile in lockfiles):
+    if any(ctx.exists(lockfile) for lockfile in lockfiles):
         return CheckResult(
             spec.check_id,
             spec.title,
@@ -318,9 +712,7 @@ def _check_dependency_lock(ctx: AuditContext, spec: CheckSpec) -> CheckResult:
             "Dependency lockfile detected.",
             "No action required.",
         )
-    req_path = ctx.root / "requirements.txt"
-    req_content = _read_text_file(req_path)
-    if req_content and _requirements_are_pinned(req_content):
+    if ctx.finding("requirements", "requirements.txt"):
         return CheckResult(
             spec.check_id,
             spec.title,
@@ -331,20 +723,17 @@ def _check_dependency_lock(ctx: AuditContext, spec: CheckSpec) -> CheckResult:
             "requirements.txt appears version-pinned.",
             "No action required.",
         )
-    pyproject = _read_text_file(ctx.root / "pyproject.toml")
-    if pyproject:
-        lowered = pyproject.lower()
-        if "[project]" in lowered and "dependencies" not in lowered:
-            return CheckResult(
-                spec.check_id,
-                spec.title,
-                spec.category,
-                spec.weight,
-                "pass",
-                "low",
-                "No runtime dependencies declared in pyproject.toml.",
-                "No action required.",
-            )
+    if ctx.finding("pyproject", "pyproject.toml"):
+        return CheckResult(
+            spec.check_id,
+            spec.title,
+            spec.category,
+            spec.weight,
+            "pass",
+            "low",
+            "No runtime dependencies declared in pyproject.toml.",
+            "No action required.",
+        )
     return CheckResult(
         spec.check_id,
         spec.title,
@@ -358,11 +747,9 @@ def _check_dependency_lock(ctx: AuditContext, spec: CheckSpec) -> CheckResult:
 
 
 def _check_demo_script(ctx: AuditContext, spec: CheckSpec) -> CheckResult:
-    candidates = ["DEMO_SCRIPT.md", "docs/DEMO_SCRIPT.md", ".vibe-sentinel/DEMO_SCRIPT.md"]
-    for relative in candidates:
-        if relative in ctx.files:
-            content = _read_text_file(ctx.root / relative)
-            words = len(content.split())
+    for relative in DEMO_SCRIPT_CANDIDATES:
+        words = ctx.finding("demo_script", relative)
+        if words is not None:
             if 300 <= words <= 900:
                 return CheckResult(
                     spec.check_id,
@@ -397,31 +784,23 @@ def _check_demo_script(ctx: AuditContext, spec: CheckSpec) -> CheckResult:
 
 
 def _scan_for_secrets(ctx: AuditContext) -> list[str]:
-    hits: list[str] = []
-    for rel_path in sorted(ctx.files):
-        # Test fixtures often contain fake keys. Prioritize source and config paths.
-        if rel_path.startswith("tests/") or rel_path.startswith("docs/"):
-            continue
-        suffix = Path(rel_path).suffix.lower()
-        if suffix not in TEXT_SUFFIXES and Path(rel_path).name not in {".env", ".env.local"}:
-            continue
-        content = _read_text_file(ctx.root / rel_path)
-        if not content:
-            continue
-        if "vibe-sentinel: allow-secret" in content:
-            continue
-        for pattern in SECRET_PATTERNS:
-            if pattern.search(content):
-                hits.append(rel_path)
-                break
-    return hits
+    return sorted(ctx.content.get("secret_scan", {}))
 
 
 def _check_secret_scan(ctx: AuditContext, spec: CheckSpec) -> CheckResult:
     hits = _scan_for_secrets(ctx)
+    sampled = ""
+    if ctx.sample is not None:
+        estimate = estimate_leak_rate(ctx.sample, hits)
+        sampled = (
+            f"SAMPLED scan of {len(ctx.sample.selected)} of {ctx.sample.population} candidate files; "
+            f"estimated leak rate {estimate.leak_rate:.2%} (below {estimate.upper_bound:.2%} at 95% confidence). "
+        )
     if hits:
         listed = ", ".join(hits[:3])
         more = "" if len(hits) <= 3 else f" (+{len(hits) - 3} more)"
+        if ctx.fail_fast:
+            more += " (scan stopped at the first hit; run without --fail-fast to list every file)"
         return CheckResult(
             spec.check_id,
             spec.title,
@@ -429,9 +808,21 @@ def _check_secret_scan(ctx: AuditContext, spec: CheckSpec) -> CheckResult:
             spec.weight,
             "fail",
             "high",
-            f"Potential secrets detected in: {listed}{more}.",
+            f"{sampled}Potential secrets detected in: {listed}{more}.",
             "Remove hard-coded secrets and rotate any compromised credentials immediately.",
         )
+    if sampled:
+        # A clean sample is not a clean repository; never let it read as a pass.
+        return CheckResult(
+            spec.check_id,
+            spec.title,
+            spec.category,
+            spec.weight,
+            "warn",
+            "medium",
+            f"{sampled}No secret patterns in the scanned files.",
+            "Run a full audit without --sample-rate or --sample-budget before shipping.",
+        )
     return CheckResult(
         spec.check_id,
         spec.title,
@@ -445,7 +836,7 @@ def _check_secret_scan(ctx: AuditContext, spec: CheckSpec) -> CheckResult:
 
 
 def _check_license_present(ctx: AuditContext, spec: CheckSpec) -> CheckResult:
-    has_license = any(name in ctx.files for name in {"LICENSE", "LICENSE.md", "LICENSE.txt"})
+    has_license = any(ctx.exists(name) for name in ("LICENSE", "LICENSE.md", "LICENSE.txt"))
     if has_license:
         return CheckResult(
             spec.check_id,
@@ -470,17 +861,9 @@ def _check_license_present(ctx: AuditContext, spec: CheckSpec) -> CheckResult:
 
 
 def _check_submission_template(ctx: AuditContext, spec: CheckSpec) -> CheckResult:
-    candidates = ["SUBMISSION.md", ".vibe-sentinel/SUBMISSION.md"]
-    for relative in candidates:
-        if relative in ctx.files:
-            content = _read_text_file(ctx.root / relative).lower()
-            required = [
-                "discord",
-                "github profile",
-                "github repo",
-                "demo video",
-            ]
-            missing = [item for item in required if item not in content]
+    for relative in SUBMISSION_CANDIDATES:
+        missing = ctx.finding("submission_template", relative)
+        if missing is not None:
             if not missing:
                 return CheckResult(
                     spec.check_id,
@@ -552,7 +935,7 @@ def _check_innovation_statement(ctx: AuditContext, spec: CheckSpec) -> CheckResu
 
 
 def _check_novelty_artifact(ctx: AuditContext, spec: CheckSpec) -> CheckResult:
-    if any(name in ctx.files for name in {"UNIQUE_EDGE.md", "docs/ARCHITECTURE.md", "docs/DIFFERENTIATION.md"}):
+    if any(ctx.exists(name) for name in ("UNIQUE_EDGE.md", "docs/ARCHITECTURE.md", "docs/DIFFERENTIATION.md")):
         return CheckResult(
             spec.check_id,
             spec.title,
@@ -586,23 +969,176 @@ def _check_novelty_artifact(ctx: AuditContext, spec: CheckSpec) -> CheckResult:
     )
 
 
+def _check_duplicate_files(ctx: AuditContext, spec: CheckSpec) -> CheckResult:
+    # Audit output is expected to mirror project files, so it is not counted.
+    index = {path: file_stat for path, file_stat in ctx.stats.items() if classify_path(path) != "tool_output"}
+    found = find_duplicates(ctx.root, index, content_ids=ctx.blob_ids, persist=ctx.persist)
+    wasted = format_bytes(found.wasted_bytes)
+    if found.subtrees or found.wasted_bytes >= DUPLICATE_WASTE_LIMIT:
+        copies = [" = ".join(group) for group in found.subtrees[:2]]
+        more = "" if len(found.subtrees) <= 2 else f" (+{len(found.subtrees) - 2} more)"
+        where = f"Duplicated directories: {'; '.join(copies)}{more}. " if copies else ""
+        return CheckResult(
+            spec.check_id,
+            spec.title,
+            spec.category,
+            spec.weight,
+            "warn",
+            "medium",
+            f"{where}{wasted} wasted across {len(found.groups)} duplicate file group(s).",
+            "Remove copied directories and files, or share them through a package, submodule or symlink.",
+        )
+    if found.groups:
+        return CheckResult(
+            spec.check_id,
+            spec.title,
+            spec.category,
+            spec.weight,
+            "pass",
+            "low",
+            f"{len(found.groups)} small duplicate file group(s) ({wasted} wasted).",
+            "No action required.",
+        )
+    return CheckResult(
+        spec.check_id,
+        spec.title,
+        spec.category,
+        spec.weight,
+        "pass",
+        "low",
+        "No duplicate files detected.",
+        "No action required.",
+    )
+
+
+def _check_binary_assets(ctx: AuditContext, spec: CheckSpec) -> CheckResult:
+    weight = binary_weight(ctx.stats, ctx.finding("gitattributes", ".gitattributes"))
+    heavy = weight.heavy_directories
+    oversized = weight.oversized
+    if heavy or oversized:
+        parts = [f"{directory}/ holds {format_bytes(size)} of binaries" for directory, size in heavy[:2]]
+        parts += [f"{path} is {format_bytes(size)}" for path, size in oversized[:2]]
+        return CheckResult(
+            spec.check_id,
+            spec.title,
+            spec.category,
+            spec.weight,
+            "warn",
+            "medium",
+            f"{'; '.join(parts)}. {format_bytes(weight.total_bytes)} of binaries in total slow every clone and CI run.",
+            "Move large media and build artifacts to Git LFS or release assets and keep only small previews in git.",
+        )
+    if weight.large:
+        return CheckResult(
+            spec.check_id,
+            spec.title,
+            spec.category,
+            spec.weight,
+            "pass",
+            "low",
+            f"{len(weight.large)} binary file(s) over 1 MB ({format_bytes(weight.total_bytes)} of binaries in total).",
+            "No action required.",
+        )
+    return CheckResult(
+        spec.check_id,
+        spec.title,
+        spec.category,
+        spec.weight,
+        "pass",
+        "low",
+        "No large binary files detected.",
+        "No action required.",
+    )
+
+
 def run_checks(root: Path) -> list[CheckResult]:
-    ctx = build_context(root)
-    checks = [
-        _check_problem_statement(ctx, CHECK_SPECS[0]),
-        _check_quickstart(ctx, CHECK_SPECS[1]),
-        _check_usage_examples(ctx, CHECK_SPECS[2]),
-        _check_tests_present(ctx, CHECK_SPECS[3]),
-        _check_ci_present(ctx, CHECK_SPECS[4]),
-        _check_dependency_lock(ctx, CHECK_SPECS[5]),
-        _check_demo_script(ctx, CHECK_SPECS[6]),
-        _check_secret_scan(ctx, CHECK_SPECS[7]),
-        _check_license_present(ctx, CHECK_SPECS[8]),
-        _check_submission_template(ctx, CHECK_SPECS[9]),
-        _check_innovation_statement(ctx, CHECK_SPECS[10]),
-        _check_novelty_artifact(ctx, CHECK_SPECS[11]),
-    ]
-    return checks
+    return evaluate_checks(build_context(root))
+
+
+CHECK_FUNCTIONS: dict[str, Callable[[AuditContext, CheckSpec], CheckResult]] = {
+    "problem_statement": _check_problem_statement,
+    "quickstart": _check_quickstart,
+    "usage_examples": _check_usage_examples,
+    "tests_present": _check_tests_present,
+    "ci_present": _check_ci_present,
+    "dependency_lock": _check_dependency_lock,
+    "demo_script": _check_demo_script,
+    "secret_scan": _check_secret_scan,
+    "license_present": _check_license_present,
+    "submission_template": _check_submission_template,
+    "innovation_statement": _check_innovation_statement,
+    "novelty_artifact": _check_novelty_artifact,
+    "duplicate_files": _check_duplicate_files,
+    "binary_assets": _check_binary_assets,
+}
+
+# Checks that need the full recursive walk; everything else is answered with targeted stats and reads.
+WALK_CHECKS = frozenset({"tests_present", "secret_scan", "duplicate_files", "binary_assets"})
+
+# Content-rule findings each check reads, so incremental re-audits re-run only checks whose inputs changed.
+CHECK_RULES: dict[str, frozenset[str]] = {
+    "problem_statement": frozenset({"readme"}),
+    "quickstart": frozenset({"readme"}),
+    "usage_examples": frozenset({"readme"}),
+    "dependency_lock": frozenset({"requirements", "pyproject"}),
+    "demo_script": frozenset({"demo_script"}),
+    "secret_scan": frozenset({"secret_scan"}),
+    "submission_template": frozenset({"submission_template"}),
+    "innovation_statement": frozenset({"readme"}),
+    "novelty_artifact": frozenset({"readme"}),
+    "binary_assets": frozenset({"gitattributes"}),
+}
+# Checks that depend on which files exist, so adding or removing any file can change them.
+LISTING_CHECKS = frozenset({"tests_present", "ci_present", "dependency_lock", "license_present", "novelty_artifact"})
+# Checks over the size or content of every file.
+TREE_CHECKS = frozenset({"duplicate_files", "binary_assets"})
+
+
+def select_checks(names: Iterable[str]) -> set[str]:
+    """Resolve check ids to a selection; ``"fast"`` expands to every check outside ``WALK_CHECKS``."""
+    known = {spec.check_id for spec in CHECK_SPECS}
+    selected: set[str] = set()
+    for name in names:
+        if name == "fast":
+            selected |= known - WALK_CHECKS
+        elif name in known:
+            selected.add(name)
+        elif name:
+            raise ValueError(f"unknown check id {name!r}; choose from fast, {', '.join(sorted(known))}")
+    if not selected:
+        raise ValueError("at least one check id is required")
+    return selected
+
+
+def lazy_context(
+    root: Path,
+    rules: Iterable[ContentRule] = CONTENT_RULES,
+    classify: bool = True,
+    fail_fast: bool = False,
+    persist: bool = False,
+) -> AuditContext:
+    """Return a context that touches the filesystem only as far as the evaluated checks require."""
+    return AuditContext(root, rules=rules, classify=classify, fail_fast=fail_fast, persist=persist)
+
+
+def evaluate_checks(
+    ctx: AuditContext,
+    only: Iterable[str] | None = None,
+    on_check: Callable[[CheckResult], None] | None = None,
+) -> list[CheckResult]:
+    """Run every check, or just the ``only`` subset, and return the results in ``CHECK_SPECS`` order.
+
+    ``WALK_CHECKS`` run last, so on a lazy or deferred context the cheap checks finish before the
+    walk and content pass start. ``on_check`` receives each result as soon as it is ready.
+    """
+    selected = None if only is None else set(only)
+    specs = [spec for spec in CHECK_SPECS if selected is None or spec.check_id in selected]
+    results: dict[str, CheckResult] = {}
+    for spec in sorted(specs, key=lambda spec: spec.check_id in WALK_CHECKS):
+        results[spec.check_id] = CHECK_FUNCTIONS[spec.check_id](ctx, spec)
+        if on_check is not None:
+            on_check(results[spec.check_id])
+    return [results[spec.check_id] for spec in specs]
 
 
 def compute_scorecard(checks: list[CheckResult]) -> ScoreCard:
@@ -623,7 +1159,13 @@ def compute_scorecard(checks: list[CheckResult]) -> ScoreCard:
     impact = percentage("impact")
     execution = percentage("execution")
     innovation = percentage("innovation")
-    overall = (usefulness * 0.40) + (impact * 0.25) + (execution * 0.20) + (innovation * 0.15)
+    blend = {"usefulness": 0.40, "impact": 0.25, "execution": 0.20, "innovation": 0.15}
+    # A partial audit (``--only``) blends just the categories it evaluated.
+    present = {category: share for category, share in blend.items() if category_max[category] > 0}
+    total_share = sum(present.values())
+    overall = 0.0
+    if total_share:
+        overall = sum(percentage(category) * share for category, share in present.items()) / total_share
 
     return ScoreCard(
         usefulness=usefulness,
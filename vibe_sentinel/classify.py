@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from pathlib import PurePosixPath
+from typing import Literal
+
+FileKind = Literal["generated", "vendored", "tool_output"]
+
+TOOL_OUTPUT_DIRS = {".vibe-sentinel"}
+VENDORED_DIRS = {"vendor", "vendored", "third_party", "third-party", "bower_components", "site-packages", "_vendor"}
+GENERATED_NAMES = {
+    "package-lock.json",
+    "npm-shrinkwrap.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+    "poetry.lock",
+    "Pipfile.lock",
+    "uv.lock",
+    "Cargo.lock",
+    "composer.lock",
+    "Gemfile.lock",
+}
+GENERATED_SUFFIXES = (".min.js", ".min.css", ".map", "_pb2.py", "_pb2_grpc.py", ".pb.go", ".g.dart")
+GENERATED_MARKERS = (
+    "@generated",
+    "code generated",
+    "generated by",
+    "auto-generated",
+    "autogenerated",
+    "automatically generated",
+    "this file is generated",
+    "this file was generated",
+)
+COMMENT_LEADERS = "#/*<!-;\"' "
+
+# Generators stamp the first few lines; prose further down that mentions generation is ignored.
+HEADER_LINES = 5
+MINIFIED_LINE_LENGTH = 1000
+
+
+def classify_path(relative_path: str) -> FileKind | None:
+    """Tag a file from its path alone, without touching the filesystem."""
+    path = PurePosixPath(relative_path)
+    directories = path.parts[:-1]
+    if any(part in TOOL_OUTPUT_DIRS for part in directories):
+        return "tool_output"
+    if any(part in VENDORED_DIRS for part in directories):
+        return "vendored"
+    if path.name in GENERATED_NAMES or path.name.endswith(GENERATED_SUFFIXES) or ".generated." in path.name:
+        return "generated"
+    return None
+
+
+def classify_text(content: str) -> FileKind | None:
+    """Tag a file as generated from a header marker or minified-looking line lengths."""
+    for line in content[:4096].splitlines()[:HEADER_LINES]:
+        lowered = line.strip().lower()
+        text = lowered.lstrip(COMMENT_LEADERS)
+        if text == lowered:
+            # Markers only count inside comments or docstrings.
+            continue
+        if text.startswith(GENERATED_MARKERS) or ("do not edit" in text and "generated" in text):
+            return "generated"
+    lines = content.count("\n") + 1
+    if len(content) > MINIFIED_LINE_LENGTH and len(content) / lines > MINIFIED_LINE_LENGTH:
+        return "generated"
+    return None
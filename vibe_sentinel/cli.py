@@ -1,17 +1,25 @@
 from __future__ import annotations
 
 import argparse
+import json
+import os
+import sys
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from vibe_sentinel.agent_pack import write_agent_pack
-from vibe_sentinel.checks import compute_scorecard, run_checks
-from vibe_sentinel.coach import write_coach
-from vibe_sentinel.gui import StudioConfig, launch_studio, run_ship_flow
-from vibe_sentinel.report import build_audit_report, console_summary, write_report_files, write_roadmap
-from vibe_sentinel.templates import scaffold
+# Only the import-free defaults load eagerly; each handler imports what its command needs so
+# `--help` and `init` do not pay for the daemon, the audit engine or studio.
+from vibe_sentinel.defaults import DEBOUNCE_SECONDS, POLL_SECONDS
+
+if TYPE_CHECKING:
+    from vibe_sentinel.models import CheckResult
+    from vibe_sentinel.watch import WatchUpdate
 
 
 def _cmd_init(args: argparse.Namespace) -> int:
+    from vibe_sentinel.templates import scaffold
+
     output_dir = Path(args.output).resolve()
     written = scaffold(output_dir, force=args.force)
 
@@ -26,27 +34,395 @@ def _cmd_init(args: argparse.Namespace) -> int:
 
 
 def _cmd_audit(args: argparse.Namespace) -> int:
+    if args.format != "ndjson":
+        return _run_audit(args)
+    try:
+        return _run_audit(args)
+    except BrokenPipeError:
+        # The reader stopped early (`| head -1`); send the rest to devnull so exit does not flush into the pipe.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
+        return 1
+
+
+def _run_audit(args: argparse.Namespace) -> int:
+    from vibe_sentinel.cache import cached_audit
+    from vibe_sentinel.checks import CHECK_SPECS
+    from vibe_sentinel.gitstore import GitError
+    from vibe_sentinel.report import console_summary, write_report_files
+
     project_path = Path(args.path).resolve()
     if not project_path.exists() or not project_path.is_dir():
-        print(f"Error: project path does not exist or is not a directory: {project_path}")
-        return 2
-
-    checks = run_checks(project_path)
-    scorecard = compute_scorecard(checks)
-    report = build_audit_report(project_path, checks, scorecard)
+        return _audit_error(args, f"project path does not exist or is not a directory: {project_path}")
+
+    sampled = args.sample_rate is not None or args.sample_budget is not None
+    if sampled and (args.monorepo or args.rev or args.since or args.only):
+        return _audit_error(
+            args, "--sample-rate and --sample-budget cannot be combined with --monorepo, --rev, --since or --only"
+        )
+    if args.fail_fast and (sampled or args.monorepo or args.since):
+        return _audit_error(args, "--fail-fast cannot be combined with sampling, --monorepo or --since")
+    streaming = args.format == "ndjson"
+    if streaming and (args.monorepo or args.since):
+        return _audit_error(args, "--format ndjson cannot be combined with --monorepo or --since")
+
+    if args.monorepo:
+        if args.rev or args.since or args.only:
+            return _audit_error(args, "--monorepo cannot be combined with --rev, --since or --only")
+        return _audit_monorepo(project_path, Path(args.output_dir).resolve())
 
     output_dir = Path(args.output_dir).resolve()
+    if args.since:
+        if args.rev or args.only:
+            return _audit_error(args, "--since cannot be combined with --rev or --only")
+        return _audit_since(project_path, args.since, output_dir, args.include_generated)
+
+    only = None
+    if args.only:
+        if args.rev:
+            return _audit_error(args, "--only cannot be combined with --rev")
+        try:
+            only = _parse_only(args.only)
+        except ValueError as exc:
+            return _audit_error(args, str(exc))
+
+    # Inside the daemon, a plain working-tree audit reuses the project's in-memory index.
+    warm = None
+    if not (args.no_cache or args.rev or only is not None or sampled or args.fail_fast or streaming):
+        from vibe_sentinel.daemon import warm_audit
+
+        warm = warm_audit(project_path, output_dir, args.include_generated)
+    try:
+        report, cache_hit = warm or cached_audit(
+            project_path,
+            use_cache=not args.no_cache,
+            output_dir=output_dir,
+            rev=args.rev,
+            only=only,
+            include_generated=args.include_generated,
+            sample_rate=args.sample_rate,
+            sample_budget=args.sample_budget,
+            sample_seed=args.sample_seed,
+            fail_fast=args.fail_fast,
+            on_check=_emit_check if streaming else None,
+        )
+    except (GitError, ValueError) as exc:
+        return _audit_error(args, str(exc))
     json_path, markdown_path = write_report_files(report, output_dir)
+    leaked = any(check.check_id == "secret_scan" and check.status == "fail" for check in report.checks)
+
+    if streaming:
+        summary = {
+            "type": "scorecard",
+            "scorecard": report.scorecard.to_dict(),
+            "cache_hit": cache_hit,
+            "report_json": str(json_path),
+            "report_markdown": str(markdown_path),
+        }
+        print(json.dumps(summary), flush=True)
+        return 1 if args.fail_fast and leaked else 0
 
     print(console_summary(report))
     print("")
+    if report.revision:
+        print(f"Audited revision {report.revision} from the git object store")
+    if only is not None:
+        print(f"Partial audit: ran {len(report.checks)} of {len(CHECK_SPECS)} checks")
+    if cache_hit:
+        print("Tree unchanged since the last audit; reused cached results (pass --no-cache to force a rescan).")
     print(f"Wrote JSON report to {json_path}")
     print(f"Wrote Markdown report to {markdown_path}")
 
+    if args.fail_fast and leaked:
+        return 1
+    return 0
+
+
+def _audit_error(args: argparse.Namespace, message: str) -> int:
+    if args.format == "ndjson":
+        print(json.dumps({"type": "error", "message": message}), flush=True)
+    else:
+        print(f"Error: {message}")
+    return 2
+
+
+def _emit_check(check: CheckResult) -> None:
+    # One line per finished check, flushed so CI can react before the slower checks complete.
+    print(json.dumps({"type": "check", **check.to_dict()}), flush=True)
+
+
+def _parse_only(value: str) -> set[str]:
+    from vibe_sentinel.checks import select_checks
+
+    try:
+        return select_checks(part.strip() for part in value.split(","))
+    except ValueError as exc:
+        raise ValueError(f"--only: {exc}") from None
+
+
+def _audit_since(project_path: Path, since: str, output_dir: Path, include_generated: bool) -> int:
+    from vibe_sentinel.diff import differential_audit
+    from vibe_sentinel.gitstore import GitError
+    from vibe_sentinel.report import console_summary, write_report_files
+
+    try:
+        report = differential_audit(project_path, since, output_dir=output_dir, include_generated=include_generated)
+    except GitError as exc:
+        print(f"Error: {exc}")
+        return 2
+    json_path, markdown_path = write_report_files(report, output_dir)
+    diff = report.diff or {}
+    by_id = {check.check_id: check for check in report.checks}
+
+    print(console_summary(report))
+    print("")
+    print(f"Compared {len(diff['changed_files'])} changed file(s) against {diff['base']}")
+    for key, label in (("introduced", "New findings introduced"), ("pre_existing", "Pre-existing findings")):
+        print(f"{label}: {len(diff[key])}")
+        for check_id in diff[key]:
+            check = by_id[check_id]
+            print(f"- [{check.status}] {check.title}: {check.detail}")
+    if diff["resolved"]:
+        print(f"Resolved since base: {', '.join(by_id[check_id].title for check_id in diff['resolved'])}")
+    print(f"Wrote JSON report to {json_path}")
+    print(f"Wrote Markdown report to {markdown_path}")
+
+    return 1 if diff["introduced"] else 0
+
+
+def _audit_monorepo(project_path: Path, output_dir: Path) -> int:
+    from vibe_sentinel.monorepo import audit_monorepo, write_monorepo_reports
+
+    monorepo = audit_monorepo(project_path)
+    if not monorepo.packages:
+        print(f"Error: no pyproject.toml or package.json found under {project_path}")
+        return 2
+
+    summary_path = write_monorepo_reports(monorepo, output_dir)
+    for package, report in monorepo.packages.items():
+        failing = sum(1 for check in report.checks if check.status == "fail")
+        print(f"- {package}: {report.scorecard.overall:.1f}/100 ({failing} fail)")
+    print("")
+    print(f"Roll-up projected score across {len(monorepo.packages)} package(s): {monorepo.rollup.overall:.1f}/100")
+    print(f"Wrote per-package reports to {output_dir / 'packages'}")
+    print(f"Wrote monorepo summary to {summary_path}")
+    return 0
+
+
+def _cmd_audit_many(args: argparse.Namespace) -> int:
+    from vibe_sentinel.fleet import discover_projects, run_fleet_audit
+
+    source = Path(args.source).resolve()
+    if not source.exists():
+        print(f"Error: project directory or list file does not exist: {source}")
+        return 2
+
+    projects = discover_projects(source)
+    if not projects:
+        print(f"Error: no projects found in {source}")
+        return 2
+
+    output_dir = Path(args.output_dir).resolve()
+    result = run_fleet_audit(
+        projects,
+        output_dir,
+        workers=args.workers,
+        shard=args.shard,
+        resume=args.resume,
+    )
+
+    for row in result.rows[:10]:
+        if "error" in row:
+            print(f"{row['rank']:>3}. {row['project']}: error: {row['error']}")
+        else:
+            print(f"{row['rank']:>3}. {row['project']}: {float(row['overall']):.1f}/100")
+    if len(result.rows) > 10:
+        print(f"... {len(result.rows) - 10} more in leaderboard")
+    print("")
+    print(
+        f"Audited {result.audited} project(s) in {result.elapsed_seconds:.2f}s "
+        f"({result.projects_per_second:.1f} projects/sec)"
+    )
+    if result.skipped:
+        print(f"Skipped {result.skipped} project(s) already in the checkpoint log")
+    print(f"Wrote leaderboard JSON to {result.leaderboard_json}")
+    print(f"Wrote leaderboard CSV to {result.leaderboard_csv}")
+    return 0
+
+
+def _cmd_merge(args: argparse.Namespace) -> int:
+    from vibe_sentinel.fleet import merge_leaderboards
+
+    sources = [Path(source).resolve() for source in args.sources]
+    missing = [source for source in sources if not source.exists()]
+    if missing:
+        print(f"Error: shard output not found: {missing[0]}")
+        return 2
+
+    output_dir = Path(args.output_dir).resolve()
+    rows, json_path, csv_path = merge_leaderboards(sources, output_dir)
+    print(f"Merged {len(rows)} project(s) from {len(sources)} shard(s)")
+    print(f"Wrote leaderboard JSON to {json_path}")
+    print(f"Wrote leaderboard CSV to {csv_path}")
+    return 0
+
+
+def _cmd_history(args: argparse.Namespace) -> int:
+    from vibe_sentinel.gitstore import GitError
+    from vibe_sentinel.history import score_history, write_history
+
+    project_path = Path(args.path).resolve()
+    if not project_path.exists() or not project_path.is_dir():
+        print(f"Error: project path does not exist or is not a directory: {project_path}")
+        return 2
+
+    try:
+        history = score_history(project_path, commits=args.commits, rev=args.rev)
+    except GitError as exc:
+        print(f"Error: {exc}")
+        return 2
+    if not history.points:
+        print(f"Error: no commits contain {project_path}")
+        return 2
+
+    json_path, csv_path = write_history(history, Path(args.output_dir).resolve())
+    for point in history.points:
+        print(f"{point.commit[:10]}  {point.scorecard.overall:5.1f}/100  {point.subject}")
+    print("")
+    print(
+        f"Scored {len(history.points)} commit(s) from {history.unique_trees} unique tree(s) "
+        f"and {history.unique_blobs} unique blob(s)"
+    )
+    print(f"Wrote score history JSON to {json_path}")
+    print(f"Wrote score history CSV to {csv_path}")
+    return 0
+
+
+def _cmd_hook(args: argparse.Namespace) -> int:
+    from vibe_sentinel.gitstore import GitError
+    from vibe_sentinel.hooks import install_hook
+
+    project_path = Path(args.path).resolve()
+    try:
+        hook_path = install_hook(project_path, force=args.force)
+    except (GitError, FileExistsError) as exc:
+        print(f"Error: {exc}")
+        return 2
+    print(f"Installed pre-commit hook at {hook_path}")
+    print("Each commit now runs `vibe-sentinel precommit` on the staged files.")
+    return 0
+
+
+def _cmd_precommit(args: argparse.Namespace) -> int:
+    from vibe_sentinel.gitstore import GitError
+    from vibe_sentinel.hooks import precommit_audit
+
+    project_path = Path(args.path).resolve()
+    started = time.perf_counter()
+    try:
+        result = precommit_audit(project_path)
+    except GitError as exc:
+        print(f"Error: {exc}")
+        return 2
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    for check in result.checks:
+        if check.status != "pass":
+            # Only the secret scan can block; the existence checks are reminders.
+            label = check.status if check.check_id == "secret_scan" else "note"
+            print(f"- [{label}] {check.title}: {check.detail}")
+    if result.blocked:
+        print("vibe-sentinel: commit blocked by the secret scan (bypass once with `git commit --no-verify`).")
+        return 1
+    print(f"vibe-sentinel: checked {len(result.staged)} staged file(s) in {elapsed_ms:.0f} ms")
+    return 0
+
+
+def _cmd_watch(args: argparse.Namespace) -> int:
+    from vibe_sentinel.watch import watch
+
+    project_path = Path(args.path).resolve()
+    if not project_path.exists() or not project_path.is_dir():
+        print(f"Error: project path does not exist or is not a directory: {project_path}")
+        return 2
+    output_dir = Path(args.output_dir).resolve()
+
+    def started(backend: str) -> None:
+        print(f"Watching {project_path} ({backend}); press Ctrl+C to stop.", flush=True)
+
+    updates = 0
+
+    def updated(update: WatchUpdate) -> None:
+        nonlocal updates
+        cause = "initial audit" if not updates else f"{len(update.changed)} file(s) changed"
+        updates += 1
+        print(
+            f"[{time.strftime('%H:%M:%S')}] {cause}, ran {len(update.rerun)} check(s) "
+            f"in {update.elapsed_ms:.0f} ms: {update.report.scorecard.overall:.1f}/100",
+            flush=True,
+        )
+
+    try:
+        watch(
+            project_path,
+            output_dir,
+            updated,
+            debounce=args.debounce,
+            interval=args.interval,
+            poll=args.poll,
+            on_start=started,
+        )
+    except KeyboardInterrupt:
+        print("Stopped watching.")
     return 0
 
 
+def _cmd_daemon(args: argparse.Namespace) -> int:
+    from vibe_sentinel.daemon import serve
+    from vibe_sentinel.daemon_client import daemon_status, socket_path, stop_daemon
+
+    path = socket_path()
+    if args.status:
+        status = daemon_status(path)
+        if status is None:
+            print(f"No daemon is listening on {path}")
+            return 1
+        print(
+            f"Daemon pid {status['pid']} (version {status['version']}) has served {status['served']} command(s)"
+            f" and keeps {status.get('warm_projects', 0)} project(s) warm"
+        )
+        return 0
+    if args.stop:
+        if not stop_daemon(path):
+            print(f"No daemon is listening on {path}")
+            return 1
+        print("Daemon stopped.")
+        return 0
+
+    print(f"Serving audit, coach, agent-pack and roadmap on {path}; stop with `vibe-sentinel daemon --stop`.", flush=True)
+    try:
+        serve(run, path)
+    except FileExistsError as exc:
+        print(f"Error: {exc}")
+        return 2
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _shard_arg(value: str) -> tuple[int, int]:
+    from vibe_sentinel.fleet import parse_shard
+
+    try:
+        return parse_shard(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
 def _cmd_roadmap(args: argparse.Namespace) -> int:
+    from vibe_sentinel.report import write_roadmap
+
     report_path = Path(args.report).resolve()
     if not report_path.exists():
         print(f"Error: report file not found: {report_path}")
@@ -59,6 +435,8 @@ def _cmd_roadmap(args: argparse.Namespace) -> int:
 
 
 def _cmd_coach(args: argparse.Namespace) -> int:
+    from vibe_sentinel.coach import write_coach
+
     report_path = Path(args.report).resolve()
     if not report_path.exists():
         print(f"Error: report file not found: {report_path}")
@@ -85,6 +463,8 @@ def _cmd_coach(args: argparse.Namespace) -> int:
 
 
 def _cmd_studio(args: argparse.Namespace) -> int:
+    from vibe_sentinel.gui import StudioConfig, launch_studio
+
     openclaw_key = args.openclaw_key.strip() if isinstance(args.openclaw_key, str) else ""
     config = StudioConfig(
         host=args.host,
@@ -97,6 +477,8 @@ def _cmd_studio(args: argparse.Namespace) -> int:
 
 
 def _cmd_agent_pack(args: argparse.Namespace) -> int:
+    from vibe_sentinel.agent_pack import write_agent_pack
+
     report_path = Path(args.report).resolve()
     if not report_path.exists():
         print(f"Error: report file not found: {report_path}")
@@ -128,6 +510,8 @@ def _cmd_agent_pack(args: argparse.Namespace) -> int:
 
 
 def _cmd_ship(args: argparse.Namespace) -> int:
+    from vibe_sentinel.gui import run_ship_flow
+
     project_path = Path(args.path).resolve()
     if not project_path.exists() or not project_path.is_dir():
         print(f"Error: project path does not exist or is not a directory: {project_path}")
@@ -149,6 +533,9 @@ def _cmd_ship(args: argparse.Namespace) -> int:
     print("Artifacts:")
     for key, value in result.get("artifacts", {}).items():
         print(f"- {key}: {value}")
+    print("Timings:")
+    for key, value in result.get("timings", {}).items():
+        print(f"- {key}: {value:.1f} ms")
     return 0
 
 
@@ -174,8 +561,173 @@ def build_parser() -> argparse.ArgumentParser:
         default=".vibe-sentinel",
         help="Directory for generated report artifacts",
     )
+    audit_parser.add_argument(
+        "--monorepo",
+        action="store_true",
+        help="Audit every sub-project with a pyproject.toml or package.json and report a roll-up",
+    )
+    audit_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and do not update the audit result cache",
+    )
+    audit_parser.add_argument(
+        "--rev",
+        default=None,
+        help="Audit a git revision (branch, tag or commit) straight from the object store, not the working tree",
+    )
+    audit_parser.add_argument(
+        "--since",
+        default=None,
+        metavar="REF",
+        help="Only audit content changed since REF and report introduced vs pre-existing findings (exit 1 on new ones)",
+    )
+    audit_parser.add_argument(
+        "--only",
+        default=None,
+        metavar="CHECKS",
+        help="Comma-separated check ids to run; 'fast' selects every check that needs no full tree walk",
+    )
+    audit_parser.add_argument(
+        "--include-generated",
+        action="store_true",
+        help="Also scan generated, vendored and .vibe-sentinel output files in content checks",
+    )
+    audit_parser.add_argument(
+        "--sample-rate",
+        type=float,
+        default=None,
+        metavar="FRACTION",
+        help="Secret-scan only this fraction of files, stratified by directory and suffix (risky names always)",
+    )
+    audit_parser.add_argument(
+        "--sample-budget",
+        type=int,
+        default=None,
+        metavar="FILES",
+        help="Secret-scan at most this many files, risky names first, the rest stratified",
+    )
+    audit_parser.add_argument("--sample-seed", type=int, default=0, help="Random seed for --sample-rate/--sample-budget")
+    audit_parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop the secret scan at the first hit (riskiest files are scanned first) and exit 1 if it fails",
+    )
+    audit_parser.add_argument(
+        "--format",
+        choices=["text", "ndjson"],
+        default="text",
+        help="ndjson streams one JSON line per check as it completes, then a final scorecard line",
+    )
     audit_parser.set_defaults(func=_cmd_audit)
 
+    audit_many_parser = subparsers.add_parser(
+        "audit-many",
+        help="Audit many projects in parallel and write a ranked leaderboard",
+    )
+    audit_many_parser.add_argument(
+        "source",
+        help="Directory whose subdirectories are projects, or a text file with one project path per line",
+    )
+    audit_many_parser.add_argument(
+        "--output-dir",
+        default=".vibe-sentinel/fleet",
+        help="Directory for per-project reports and the aggregated leaderboard",
+    )
+    audit_many_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count)",
+    )
+    audit_many_parser.add_argument(
+        "--shard",
+        type=_shard_arg,
+        default=None,
+        metavar="I/N",
+        help="Audit only shard I of N (1-based), split deterministically by project name",
+    )
+    audit_many_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip projects already recorded in the output directory's checkpoint log",
+    )
+    audit_many_parser.set_defaults(func=_cmd_audit_many)
+
+    merge_parser = subparsers.add_parser(
+        "merge",
+        help="Merge sharded audit-many outputs into one leaderboard",
+    )
+    merge_parser.add_argument(
+        "sources",
+        nargs="+",
+        help="Shard output directories (or checkpoint.jsonl files) from `vibe-sentinel audit-many`",
+    )
+    merge_parser.add_argument(
+        "--output-dir",
+        default=".vibe-sentinel/fleet",
+        help="Directory for the merged leaderboard",
+    )
+    merge_parser.set_defaults(func=_cmd_merge)
+
+    history_parser = subparsers.add_parser(
+        "history",
+        help="Replay the projected score across recent commits from the git object store",
+    )
+    history_parser.add_argument("path", nargs="?", default=".", help="Project directory inside a git repository")
+    history_parser.add_argument("--commits", type=int, default=20, help="Number of first-parent commits to score")
+    history_parser.add_argument("--rev", default="HEAD", help="Newest revision to start walking back from")
+    history_parser.add_argument(
+        "--output-dir",
+        default=".vibe-sentinel",
+        help="Directory for history.json and history.csv",
+    )
+    history_parser.set_defaults(func=_cmd_history)
+
+    watch_parser = subparsers.add_parser("watch", help="Re-audit incrementally whenever project files change")
+    watch_parser.add_argument("path", nargs="?", default=".", help="Project directory to watch")
+    watch_parser.add_argument(
+        "--output-dir",
+        default=".vibe-sentinel",
+        help="Directory where report.json and report.md are rewritten",
+    )
+    watch_parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEBOUNCE_SECONDS,
+        help="Seconds of quiet to wait for before re-auditing a burst of changes (default: %(default)s)",
+    )
+    watch_parser.add_argument(
+        "--interval",
+        type=float,
+        default=POLL_SECONDS,
+        help="Polling interval in seconds when inotify is unavailable (default: %(default)s)",
+    )
+    watch_parser.add_argument("--poll", action="store_true", help="Poll file mtimes even where inotify is available")
+    watch_parser.set_defaults(func=_cmd_watch)
+
+    daemon_parser = subparsers.add_parser(
+        "daemon",
+        help="Keep a warm process that audit, coach, agent-pack and roadmap use over a Unix socket",
+    )
+    daemon_control = daemon_parser.add_mutually_exclusive_group()
+    daemon_control.add_argument("--stop", action="store_true", help="Stop the running daemon")
+    daemon_control.add_argument("--status", action="store_true", help="Report whether a daemon is running")
+    daemon_parser.set_defaults(func=_cmd_daemon)
+
+    hook_parser = subparsers.add_parser("hook", help="Manage the git pre-commit hook")
+    hook_parser.add_argument("action", choices=["install"], help="Hook action to run")
+    hook_parser.add_argument("path", nargs="?", default=".", help="Project directory inside a git repository")
+    hook_parser.add_argument("--force", action="store_true", help="Replace a pre-commit hook written by another tool")
+    hook_parser.set_defaults(func=_cmd_hook)
+
+    precommit_parser = subparsers.add_parser(
+        "precommit",
+        help="Secret-scan the staged changes from the git index (run by the pre-commit hook)",
+    )
+    precommit_parser.add_argument("path", nargs="?", default=".", help="Project directory inside a git repository")
+    precommit_parser.set_defaults(func=_cmd_precommit)
+
     roadmap_parser = subparsers.add_parser("roadmap", help="Generate prioritized roadmap from report JSON")
     roadmap_parser.add_argument(
         "--report",
@@ -284,11 +836,17 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main(argv: list[str] | None = None) -> int:
+def run(argv: list[str]) -> int:
+    """Parse and run one command in this process."""
     parser = build_parser()
     args = parser.parse_args(argv)
     return args.func(args)
 
 
+def main(argv: list[str] | None = None) -> int:
+    """Run one command in this process; only the ``vibe-sentinel`` entry point tries the daemon first."""
+    return run(sys.argv[1:] if argv is None else argv)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
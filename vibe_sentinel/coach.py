@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
-from vibe_sentinel.report import SEVERITY_ORDER
+from vibe_sentinel.models import AuditReport
+from vibe_sentinel.report import SEVERITY_ORDER, report_payload
 from vibe_sentinel.templates import scaffold
 
 PLAYBOOK: dict[str, dict[str, Any]] = {
@@ -125,6 +125,24 @@ PLAYBOOK: dict[str, dict[str, Any]] = {
         ],
         "verify": "Ensure `UNIQUE_EDGE.md` is committed and linked.",
     },
+    "duplicate_files": {
+        "plain": "The repository ships copies of the same files or folders.",
+        "why": "Copies bloat clones and drift apart when only one of them gets fixed.",
+        "steps": [
+            "Keep one copy of each duplicated folder named in the audit.",
+            "Share common code through a package, submodule or symlink instead of copying it.",
+        ],
+        "verify": "Re-run `vibe-sentinel audit` and confirm Duplicate Files passes.",
+    },
+    "binary_assets": {
+        "plain": "Large videos, images or archives are committed straight into git.",
+        "why": "Every clone and CI run downloads them, which slows down judges and contributors.",
+        "steps": [
+            "Track media with Git LFS (`git lfs track \"*.mp4\"`) or upload it as a release asset.",
+            "Keep only small previews or links to the hosted files in the repository.",
+        ],
+        "verify": "Re-run `vibe-sentinel audit` and confirm Large Binary Assets passes.",
+    },
 }
 
 BASE_README = """# Your Project Name
@@ -309,19 +327,28 @@ def coach_markdown(
     return "\n".join(lines) + "\n"
 
 
-def write_coach(
-    report_json_path: Path,
-    output_path: Path,
+def build_coach(
+    report: AuditReport | dict[str, Any] | Path,
     project_path: Path,
     apply_safe: bool = False,
-) -> tuple[Path, list[Path]]:
-    payload = json.loads(report_json_path.read_text(encoding="utf-8"))
+) -> tuple[str, list[Path]]:
+    """Render the coach markdown in memory; ``apply_safe`` still writes the starter files it lists."""
+    payload = report_payload(report)
     issues = _sorted_issues(payload)
 
     applied: list[Path] = []
     if apply_safe:
         applied = _apply_safe_starters(project_path, issues)
+    return coach_markdown(payload, issues, applied), applied
+
 
+def write_coach(
+    report_json_path: AuditReport | dict[str, Any] | Path,
+    output_path: Path,
+    project_path: Path,
+    apply_safe: bool = False,
+) -> tuple[Path, list[Path]]:
+    markdown, applied = build_coach(report_json_path, project_path, apply_safe)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(coach_markdown(payload, issues, applied), encoding="utf-8")
+    output_path.write_text(markdown, encoding="utf-8")
     return output_path, applied
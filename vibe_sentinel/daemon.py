@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from vibe_sentinel import __version__
+from vibe_sentinel.daemon_client import (
+    FORWARDED_COMMANDS,
+    FORWARDED_ENV,
+    FORWARDED_ENV_PREFIX,
+    daemon_status,
+    socket_path,
+)
+from vibe_sentinel.storage import cache_root
+
+if TYPE_CHECKING:
+    from vibe_sentinel.models import AuditReport
+    from vibe_sentinel.watch import IncrementalAuditor
+
+MAX_WARM_PROJECTS = 16
+
+# The warm audits of the daemon serving the current request, if any.
+_serving = threading.local()
+
+
+class WarmAudits:
+    """One in-memory ``IncrementalAuditor`` per project, so a repeat audit re-reads only changed files.
+
+    The least recently audited projects are dropped beyond ``limit``.
+    """
+
+    def __init__(self, limit: int = MAX_WARM_PROJECTS) -> None:
+        self.limit = limit
+        self.auditors: OrderedDict[tuple[str, str, bool, str], IncrementalAuditor] = OrderedDict()
+
+    def audit(self, project_path: Path, output_dir: Path, include_generated: bool) -> tuple[AuditReport, bool]:
+        """Return the project's report and whether nothing changed since this daemon last audited it."""
+        from vibe_sentinel.watch import IncrementalAuditor
+
+        key = (str(project_path), str(output_dir), include_generated, str(cache_root()))
+        auditor = self.auditors.pop(key, None)
+        if auditor is None:
+            auditor = IncrementalAuditor(project_path, output_dir, classify=not include_generated, write=False)
+            update = auditor.full()
+        else:
+            update = auditor.refresh()
+        self.auditors[key] = auditor
+        while len(self.auditors) > self.limit:
+            self.auditors.popitem(last=False)
+        if update is None:
+            assert auditor.report is not None
+            return auditor.report, True
+        return update.report, False
+
+
+def warm_audit(project_path: Path, output_dir: Path, include_generated: bool) -> tuple[AuditReport, bool] | None:
+    """Audit through the serving daemon's in-memory index; ``None`` outside a daemon request."""
+    warm: WarmAudits | None = getattr(_serving, "warm", None)
+    if warm is None:
+        return None
+    return warm.audit(project_path, output_dir, include_generated)
+
+
+@contextmanager
+def _applied_env(env: dict[str, str]) -> Iterator[None]:
+    """Replace the forwarded variables with the client's for the duration of one request."""
+    keys = {key for key in os.environ if key.startswith(FORWARDED_ENV_PREFIX) or key in FORWARDED_ENV} | set(env)
+    saved = {key: os.environ.get(key) for key in keys}
+    for key in keys:
+        if key in env:
+            os.environ[key] = env[key]
+        else:
+            os.environ.pop(key, None)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _run_captured(
+    run: Callable[[list[str]], int],
+    argv: list[str],
+    cwd: str,
+    env: dict[str, str] | None = None,
+    warm: WarmAudits | None = None,
+) -> dict[str, Any]:
+    stdout, stderr = io.StringIO(), io.StringIO()
+    previous = os.getcwd()
+    _serving.warm = warm
+    try:
+        os.chdir(cwd)
+        with redirect_stdout(stdout), redirect_stderr(stderr), _applied_env(env or {}):
+            try:
+                code = run(argv)
+            except SystemExit as exc:
+                # argparse errors and --help exit; report them like the process would.
+                if isinstance(exc.code, str):
+                    print(exc.code, file=sys.stderr)
+                code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+            except Exception:
+                import traceback
+
+                traceback.print_exc()
+                code = 1
+    finally:
+        _serving.warm = None
+        os.chdir(previous)
+    return {"exit": code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+class DaemonState:
+    """What the daemon keeps between requests: the command runner, a request count and the warm audits."""
+
+    def __init__(self, run: Callable[[list[str]], int]) -> None:
+        self.run = run
+        self.served = 0
+        self.warm = WarmAudits()
+        self.stop: Callable[[], None] = lambda: None
+
+
+def _respond(state: DaemonState, line: bytes) -> dict[str, Any] | None:
+    try:
+        request = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(request, dict):
+        return {"exit": None}
+    command = request.get("command")
+    if command == "status":
+        return {
+            "pid": os.getpid(),
+            "version": __version__,
+            "served": state.served,
+            "warm_projects": len(state.warm.auditors),
+        }
+    if command == "stop":
+        threading.Thread(target=state.stop, daemon=True).start()
+        return {"stopping": True}
+    argv = request.get("argv")
+    if (
+        request.get("version") != __version__
+        or not isinstance(argv, list)
+        or not all(isinstance(arg, str) for arg in argv)
+        or not argv
+        or argv[0] not in FORWARDED_COMMANDS
+    ):
+        # Only the short commands the client forwards; `watch` or `studio` would block the serial server.
+        return {"exit": None}
+    env = request.get("env")
+    response = _run_captured(
+        state.run,
+        argv,
+        request.get("cwd") or "/",
+        env if isinstance(env, dict) else {},
+        state.warm,
+    )
+    state.served += 1
+    return response
+
+
+def serve(run: Callable[[list[str]], int], path: Path | None = None, ready: threading.Event | None = None) -> None:
+    """Listen on ``path`` until a stop request arrives; a stale socket from a dead daemon is replaced.
+
+    Requests are handled serially because each one changes the working directory, environment and
+    stdout. Imports, compiled rules and each audited project's file index and content findings
+    (``WarmAudits``) stay in memory between requests.
+    """
+    import socketserver
+
+    state = DaemonState(run)
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            try:
+                line = self.rfile.readline()
+            except OSError:
+                return
+            response = _respond(state, line)
+            if response is not None:
+                self.wfile.write(json.dumps(response).encode("utf-8"))
+
+    path = path or socket_path()
+    if path.exists():
+        if daemon_status(path) is not None:
+            raise FileExistsError(f"a daemon is already listening on {path}")
+        path.unlink()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Create the socket owner-only from the start rather than chmod-ing it after bind.
+    previous_umask = os.umask(0o077)
+    try:
+        server = socketserver.UnixStreamServer(str(path), Handler)
+    finally:
+        os.umask(previous_umask)
+    state.stop = server.shutdown
+    try:
+        if ready is not None:
+            ready.set()
+        server.serve_forever()
+    finally:
+        server.server_close()
+        try:
+            path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any
+
+from vibe_sentinel import __version__
+from vibe_sentinel.storage import cache_root
+
+# The client runs before the CLI loads anything else, so this module imports only the socket and
+# json modules; the server side lives in ``vibe_sentinel.daemon``.
+FORWARDED_COMMANDS = frozenset({"audit", "coach", "agent-pack", "roadmap"})
+NO_DAEMON_ENV = "VIBE_SENTINEL_NO_DAEMON"
+CONNECT_TIMEOUT = 0.2
+# The server is serial, so a wedged or busy daemon must not hang every client; past this the command fails.
+FORWARD_TIMEOUT = 60.0
+# Client environment that changes what a command reads or writes, applied for each request.
+FORWARDED_ENV_PREFIX = "VIBE_SENTINEL_"
+FORWARDED_ENV = frozenset({"XDG_CACHE_HOME"})
+
+
+def socket_path() -> Path:
+    return cache_root() / "daemon.sock"
+
+
+def _send(path: Path, payload: dict[str, Any]) -> socket.socket:
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.settimeout(CONNECT_TIMEOUT)
+        conn.connect(str(path))
+        conn.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+    except BaseException:
+        conn.close()
+        raise
+    return conn
+
+
+def _receive(conn: socket.socket, timeout: float | None) -> dict[str, Any]:
+    conn.settimeout(timeout)
+    chunks: list[bytes] = []
+    while chunk := conn.recv(1 << 16):
+        chunks.append(chunk)
+    response = json.loads(b"".join(chunks) or b"{}")
+    if not isinstance(response, dict):
+        raise ValueError("malformed daemon response")
+    return response
+
+
+def send_request(path: Path, payload: dict[str, Any], timeout: float | None = None) -> dict[str, Any]:
+    """Send one JSON request to the daemon at ``path`` and return its JSON reply."""
+    with _send(path, payload) as conn:
+        return _receive(conn, timeout)
+
+
+def _streams(argv: list[str]) -> bool:
+    return "--format=ndjson" in argv or any(
+        arg == "--format" and value == "ndjson" for arg, value in zip(argv, argv[1:])
+    )
+
+
+def client_env() -> dict[str, str]:
+    """The variables of this process that are applied to a forwarded command."""
+    return {
+        key: value
+        for key, value in os.environ.items()
+        if key.startswith(FORWARDED_ENV_PREFIX) or key in FORWARDED_ENV
+    }
+
+
+def forward(argv: list[str]) -> int | None:
+    """Run ``argv`` in a running daemon and relay its output; ``None`` means run it in-process instead.
+
+    The command only falls back to running in-process when the daemon cannot be reached or declines
+    it. Once the request is sent, the daemon may already be running it, so a missing reply is an
+    error rather than a reason to run the command a second time.
+    """
+    if not argv or argv[0] not in FORWARDED_COMMANDS or os.environ.get(NO_DAEMON_ENV):
+        return None
+    if _streams(argv):
+        # The daemon replies only when the command finishes, which would defeat streamed output.
+        return None
+    path = socket_path()
+    if not path.exists():
+        return None
+    try:
+        conn = _send(path, {"argv": argv, "cwd": os.getcwd(), "env": client_env(), "version": __version__})
+    except OSError:
+        return None
+    try:
+        with conn:
+            response = _receive(conn, FORWARD_TIMEOUT)
+    except (OSError, ValueError) as exc:
+        # socket.timeout is an OSError too: a busy or wedged daemon may still finish the command.
+        print(
+            f"Error: the daemon on {path} did not answer ({exc or type(exc).__name__}); it may still be "
+            f"running the command. Set {NO_DAEMON_ENV}=1 to run it in this process.",
+            file=sys.stderr,
+        )
+        return 2
+    if not isinstance(response.get("exit"), int):
+        # A daemon from another version, or one that could not run the command.
+        return None
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    return response["exit"]
+
+
+def daemon_status(path: Path | None = None) -> dict[str, Any] | None:
+    try:
+        return send_request(path or socket_path(), {"command": "status"}, timeout=5)
+    except (OSError, ValueError):
+        return None
+
+
+def stop_daemon(path: Path | None = None) -> bool:
+    try:
+        send_request(path or socket_path(), {"command": "stop"}, timeout=5)
+    except (OSError, ValueError):
+        return False
+    return True
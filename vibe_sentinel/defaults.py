@@ -0,0 +1,9 @@
+"""Tunable defaults shared by the CLI parser and the engine.
+
+This module imports nothing, so the parser can show real defaults without loading the engine.
+"""
+
+# Seconds of quiet `watch` waits for before re-auditing a burst of changes.
+DEBOUNCE_SECONDS = 0.2
+# Seconds between mtime scans when `watch` polls instead of using inotify.
+POLL_SECONDS = 1.0
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+from vibe_sentinel.cache import report_ignores
+from vibe_sentinel.checks import (
+    CONTENT_RULES,
+    EXCLUDED_DIRS,
+    FileStat,
+    build_context,
+    compute_scorecard,
+    evaluate_checks,
+    read_text_file,
+    scan_project,
+)
+from vibe_sentinel.gitstore import GitRepository, TreeEntry, blob_text, hash_blob, revision_files
+from vibe_sentinel.models import AuditReport, CheckResult
+from vibe_sentinel.report import build_audit_report
+
+STATUS_RANK = {"pass": 0, "warn": 1, "fail": 2}
+
+
+def changed_paths(
+    project_path: Path,
+    repo: GitRepository,
+    prefix: str,
+    base: dict[str, TreeEntry],
+    index: dict[str, FileStat],
+    hashed: dict[str, str] | None = None,
+) -> set[str]:
+    """Return project-relative paths whose working-tree content differs from ``base``, including deletions.
+
+    The git index doubles as a stat cache: a file whose size and mtime match its index entry, and
+    whose staged blob equals the base blob, is unchanged without being read. Only files with
+    stale stat data are hashed; ``hashed`` collects the blob ids computed along the way.
+    """
+    staged = repo.read_index()
+    repo_prefix = f"{prefix}/" if prefix else ""
+    changed = set(base) - set(index)
+    for rel_path, file_stat in index.items():
+        entry = base.get(rel_path)
+        if entry is None:
+            changed.add(rel_path)
+            continue
+        cached = staged.get(f"{repo_prefix}{rel_path}")
+        if (
+            cached is not None
+            and cached.sha == entry.sha
+            and cached.size == file_stat.size & 0xFFFFFFFF
+            and cached.mtime_ns == file_stat.mtime_ns
+        ):
+            continue
+        try:
+            blob_id = hash_blob(project_path / rel_path)
+        except OSError:
+            changed.add(rel_path)
+            continue
+        if hashed is not None:
+            hashed[rel_path] = blob_id
+        if blob_id != entry.sha:
+            changed.add(rel_path)
+    return changed
+
+
+def _head_blob_ids(
+    project_path: Path,
+    base: dict[str, TreeEntry],
+    index: dict[str, FileStat],
+    changed: set[str],
+    hashed: dict[str, str],
+) -> dict[str, str]:
+    # Unchanged files still have their base blob; only changed files that were not hashed yet are read.
+    blob_ids = {path: entry.sha for path, entry in base.items() if path in index and path not in changed}
+    for rel_path in changed:
+        if rel_path not in index:
+            continue
+        if rel_path not in hashed:
+            try:
+                hashed[rel_path] = hash_blob(project_path / rel_path)
+            except OSError:
+                continue
+        blob_ids[rel_path] = hashed[rel_path]
+    return blob_ids
+
+
+def _classify(
+    head: list[CheckResult],
+    base: list[CheckResult],
+    head_hits: set[str],
+    base_hits: set[str],
+) -> dict[str, list[str]]:
+    base_by_id = {check.check_id: check for check in base}
+    buckets: dict[str, list[str]] = {"introduced": [], "pre_existing": [], "resolved": []}
+    for check in head:
+        before = base_by_id.get(check.check_id)
+        before_rank = STATUS_RANK[before.status] if before else 0
+        if check.status == "pass":
+            if before_rank:
+                buckets["resolved"].append(check.check_id)
+        elif check.check_id == "secret_scan":
+            buckets["introduced" if head_hits - base_hits else "pre_existing"].append(check.check_id)
+        elif STATUS_RANK[check.status] > before_rank:
+            buckets["introduced"].append(check.check_id)
+        else:
+            buckets["pre_existing"].append(check.check_id)
+    return buckets
+
+
+def differential_audit(
+    project_path: Path,
+    since: str,
+    output_dir: Path | None = None,
+    include_generated: bool = False,
+) -> AuditReport:
+    """Audit only what changed since the ``since`` revision and split findings into introduced and pre-existing.
+
+    Existence checks see the full file index on both sides. The secret scan reads only the changed
+    files, and document checks re-read their handful of inputs, sharing unchanged text between
+    the base and head evaluations. The duplicate check compares git blob ids, so only changed files
+    are hashed. ``include_generated`` is as for ``cached_audit``.
+    """
+    repo, prefix = GitRepository.discover(project_path)
+    base_sha = repo.resolve(since)
+    base_entries = revision_files(repo, base_sha, prefix, EXCLUDED_DIRS)
+    ignored = set(report_ignores(project_path, output_dir))
+    index = {
+        path: file_stat
+        for path, file_stat in scan_project(project_path, ignore=ignored, persist=True).index.items()
+        if path not in ignored
+    }
+    hashed: dict[str, str] = {}
+    changed = changed_paths(project_path, repo, prefix, base_entries, index, hashed)
+
+    doc_rules = [rule for rule in CONTENT_RULES if rule.rule_id != "secret_scan"]
+    doc_paths = {path for path in set(index) | set(base_entries) if any(rule.matches(path) for rule in doc_rules)}
+    scope = changed | doc_paths
+
+    head_text: dict[str, str] = {}
+
+    def read_head(rel_path: str) -> str:
+        head_text[rel_path] = read_text_file(project_path / rel_path)
+        return head_text[rel_path]
+
+    def read_base(rel_path: str) -> str:
+        if rel_path not in changed and rel_path in head_text:
+            return head_text[rel_path]
+        return blob_text(repo, base_entries[rel_path].sha)
+
+    committed_ns = repo.commit(base_sha).timestamp * 1_000_000_000
+    base_index = {
+        path: index[path] if path not in changed else FileStat(repo.object_size(entry.sha), committed_ns)
+        for path, entry in base_entries.items()
+    }
+
+    classify = not include_generated
+    head_ctx = build_context(
+        project_path,
+        index=index,
+        read_text=read_head,
+        scope=scope,
+        classify=classify,
+        blob_ids=_head_blob_ids(project_path, base_entries, index, changed, hashed),
+    )
+    base_ctx = build_context(
+        project_path,
+        index=base_index,
+        read_text=read_base,
+        scope=scope,
+        classify=classify,
+        blob_ids={path: entry.sha for path, entry in base_entries.items()},
+    )
+    head_checks = evaluate_checks(head_ctx)
+    base_checks = evaluate_checks(base_ctx)
+
+    buckets = _classify(
+        head_checks,
+        base_checks,
+        set(head_ctx.content.get("secret_scan", {})),
+        set(base_ctx.content.get("secret_scan", {})),
+    )
+    report = build_audit_report(project_path, head_checks, compute_scorecard(head_checks))
+    return replace(report, diff={"base": base_sha, "changed_files": sorted(changed), **buckets})
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from vibe_sentinel.storage import cache_root, evict_lru, write_json_atomic
+from vibe_sentinel.tree import FileStat
+
+EDGE_BYTES = 4096
+MAX_HASH_STATES = 64
+# Every empty file has the same content; it never counts as a duplicate, only towards copied directories.
+EMPTY_CONTENT_ID = "0:"
+
+
+@dataclass(frozen=True)
+class DuplicateReport:
+    """Identical-content file groups, the largest duplicated directories, and the bytes they waste."""
+
+    groups: list[list[str]]
+    subtrees: list[list[str]]
+    wasted_bytes: int
+
+
+def hash_state_path(root: Path) -> Path:
+    key = hashlib.sha256(str(root.resolve()).encode("utf-8")).hexdigest()[:32]
+    return cache_root() / "hashes" / f"{key}.json"
+
+
+class HashCache:
+    """Partial and full content hashes keyed by path, valid while the file's size and mtime hold."""
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self.entries: dict[str, list[Any]] = {}
+        self.changed = False
+        if path is None:
+            return
+        try:
+            loaded = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if isinstance(loaded, dict):
+            self.entries = loaded
+
+    def _entry(self, rel_path: str, file_stat: FileStat) -> list[Any]:
+        entry = self.entries.get(rel_path)
+        if not entry or entry[:2] != [file_stat.size, file_stat.mtime_ns]:
+            entry = [file_stat.size, file_stat.mtime_ns, None, None]
+            self.entries[rel_path] = entry
+        return entry
+
+    def get(self, rel_path: str, file_stat: FileStat, slot: int) -> str | None:
+        return self._entry(rel_path, file_stat)[slot]
+
+    def put(self, rel_path: str, file_stat: FileStat, slot: int, digest: str) -> None:
+        self._entry(rel_path, file_stat)[slot] = digest
+        self.changed = True
+
+    def save(self, live_paths: Iterable[str]) -> None:
+        if self.path is None or not self.changed:
+            return
+        live = set(live_paths)
+        try:
+            write_json_atomic(self.path, {path: entry for path, entry in self.entries.items() if path in live})
+            evict_lru(self.path.parent, MAX_HASH_STATES)
+        except OSError:
+            pass
+
+
+def _partial_hash(path: Path, size: int) -> str:
+    digest = hashlib.sha1()
+    with path.open("rb") as handle:
+        digest.update(handle.read(EDGE_BYTES))
+        if size > EDGE_BYTES:
+            handle.seek(max(EDGE_BYTES, size - EDGE_BYTES))
+            digest.update(handle.read(EDGE_BYTES))
+    return digest.hexdigest()
+
+
+def _full_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _content_ids(root: Path, index: dict[str, FileStat], cache: HashCache) -> dict[str, str]:
+    """Hash only files whose size collides, and fully hash only those whose edges also collide."""
+    by_size: dict[int, list[str]] = defaultdict(list)
+    for rel_path, file_stat in index.items():
+        if file_stat.size > 0:
+            by_size[file_stat.size].append(rel_path)
+
+    content_ids: dict[str, str] = {}
+    for size, paths in by_size.items():
+        if len(paths) < 2:
+            continue
+        by_edges: dict[str, list[str]] = defaultdict(list)
+        for rel_path in paths:
+            file_stat = index[rel_path]
+            partial = cache.get(rel_path, file_stat, 2)
+            if partial is None:
+                try:
+                    partial = _partial_hash(root / rel_path, size)
+                except OSError:
+                    continue
+                cache.put(rel_path, file_stat, 2, partial)
+            by_edges[partial].append(rel_path)
+        for partial, survivors in by_edges.items():
+            if len(survivors) < 2:
+                continue
+            for rel_path in survivors:
+                if size <= 2 * EDGE_BYTES:
+                    # The edges already cover the whole file.
+                    content_ids[rel_path] = partial
+                    continue
+                file_stat = index[rel_path]
+                full = cache.get(rel_path, file_stat, 3)
+                if full is None:
+                    try:
+                        full = _full_hash(root / rel_path)
+                    except OSError:
+                        continue
+                    cache.put(rel_path, file_stat, 3, full)
+                content_ids[rel_path] = f"{size}:{full}"
+    return content_ids
+
+
+def _duplicated_subtrees(files: Iterable[str], content_ids: dict[str, str]) -> list[list[str]]:
+    # A directory can only be a copy when every file below it has a duplicate somewhere.
+    children: dict[str, list[tuple[str, str]]] = defaultdict(list)
+    complete: dict[str, bool] = defaultdict(lambda: True)
+    for rel_path in files:
+        parts = rel_path.split("/")
+        for depth in range(1, len(parts)):
+            directory = "/".join(parts[:depth])
+            remainder = "/".join(parts[depth:])
+            if rel_path in content_ids:
+                children[directory].append((remainder, content_ids[rel_path]))
+            else:
+                complete[directory] = False
+
+    by_signature: dict[str, list[str]] = defaultdict(list)
+    for directory, entries in children.items():
+        if complete[directory]:
+            signature = hashlib.sha256(repr(sorted(entries)).encode("utf-8")).hexdigest()
+            by_signature[signature].append(directory)
+
+    duplicated = [sorted(group) for group in by_signature.values() if len(group) > 1]
+    in_group = {directory for group in duplicated for directory in group}
+    # Report only the outermost copies; a group whose members all sit inside reported copies is implied.
+    outermost = [
+        group
+        for group in duplicated
+        if not all("/" in directory and directory.rpartition("/")[0] in in_group for directory in group)
+    ]
+    return sorted(outermost)
+
+
+def find_duplicates(
+    root: Path,
+    index: dict[str, FileStat],
+    content_ids: dict[str, str] | None = None,
+    persist: bool = False,
+) -> DuplicateReport:
+    """Group identical files by size, then edge hash, then full hash.
+
+    ``content_ids`` (for example git blob ids) skips hashing entirely. Otherwise, with ``persist``,
+    hashes are stored per project and reused while a file's size and mtime are unchanged.
+    """
+    if content_ids is None:
+        cache = HashCache(hash_state_path(root) if persist else None)
+        content_ids = _content_ids(root, index, cache)
+        cache.save(index)
+    else:
+        content_ids = {path: content_ids[path] for path in index if path in content_ids and index[path].size > 0}
+
+    by_content: dict[str, list[str]] = defaultdict(list)
+    for rel_path, content_id in content_ids.items():
+        by_content[content_id].append(rel_path)
+    groups = sorted(sorted(paths) for paths in by_content.values() if len(paths) > 1)
+    duplicated = {path: content_ids[path] for group in groups for path in group}
+    duplicated.update((path, EMPTY_CONTENT_ID) for path, file_stat in index.items() if file_stat.size == 0)
+    wasted = sum(index[group[0]].size * (len(group) - 1) for group in groups)
+    return DuplicateReport(
+        groups=groups,
+        subtrees=_duplicated_subtrees(index, duplicated),
+        wasted_bytes=wasted,
+    )
+
+
+def format_bytes(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KB", "MB", "GB"):
+        if value < 1024 or unit == "GB":
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{size} B"
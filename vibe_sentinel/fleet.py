@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from vibe_sentinel.checks import compute_scorecard, run_checks
+from vibe_sentinel.report import build_audit_report, write_report_files
+
+LEADERBOARD_FIELDS = (
+    "rank",
+    "project",
+    "overall",
+    "usefulness",
+    "impact",
+    "execution",
+    "innovation",
+    "fail",
+    "warn",
+    "project_path",
+    "report_json",
+    "error",
+)
+
+CHECKPOINT_NAME = "checkpoint.jsonl"
+
+
+@dataclass(frozen=True)
+class FleetResult:
+    rows: list[dict[str, Any]]
+    leaderboard_json: Path
+    leaderboard_csv: Path
+    elapsed_seconds: float
+    audited: int
+    skipped: int = 0
+
+    @property
+    def projects_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return float(self.audited)
+        return self.audited / self.elapsed_seconds
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """Parse a 1-based ``i/N`` shard selector."""
+    index_text, sep, count_text = value.partition("/")
+    try:
+        index = int(index_text)
+        count = int(count_text)
+    except ValueError:
+        raise ValueError(f"Shard must look like i/N, got: {value}") from None
+    if not sep or count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Shard index must be between 1 and N, got: {value}")
+    return index, count
+
+
+def in_shard(project_key: str, index: int, count: int) -> bool:
+    # Hash the stable project key so every machine derives the same split from the same list.
+    digest = hashlib.sha1(project_key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count == index - 1
+
+
+def discover_projects(source: Path) -> list[Path]:
+    """Return project directories from a parent directory or a newline-separated list file."""
+    if source.is_dir():
+        return sorted(
+            child.resolve()
+            for child in source.iterdir()
+            if child.is_dir() and not child.name.startswith(".")
+        )
+
+    projects: list[Path] = []
+    for line in source.read_text(encoding="utf-8").splitlines():
+        entry = line.strip()
+        if not entry or entry.startswith("#"):
+            continue
+        candidate = Path(entry).expanduser()
+        if not candidate.is_absolute():
+            candidate = source.parent / candidate
+        projects.append(candidate.resolve())
+    return projects
+
+
+def _report_slugs(projects: list[Path]) -> dict[Path, str]:
+    slugs: dict[Path, str] = {}
+    used: set[str] = set()
+    for project in projects:
+        slug = project.name or "project"
+        suffix = 2
+        while slug in used:
+            slug = f"{project.name}-{suffix}"
+            suffix += 1
+        used.add(slug)
+        slugs[project] = slug
+    return slugs
+
+
+def audit_project(project_path: Path, report_dir: Path) -> dict[str, Any]:
+    """Audit one project and write its report files. Runs inside pool workers."""
+    row: dict[str, Any] = {"project": report_dir.name, "project_path": str(project_path)}
+    if not project_path.is_dir():
+        row["error"] = f"project path does not exist or is not a directory: {project_path}"
+        return row
+
+    try:
+        checks = run_checks(project_path)
+        scorecard = compute_scorecard(checks)
+        report = build_audit_report(project_path, checks, scorecard)
+        json_path, _ = write_report_files(report, report_dir)
+    except Exception as exc:  # noqa: BLE001
+        row["error"] = str(exc)
+        return row
+
+    row.update(scorecard.to_dict())
+    row["fail"] = sum(1 for check in checks if check.status == "fail")
+    row["warn"] = sum(1 for check in checks if check.status == "warn")
+    row["report_json"] = str(json_path)
+    return row
+
+
+def rank_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    ranked = sorted(
+        rows,
+        key=lambda row: ("error" in row, -float(row.get("overall", 0.0)), row.get("project", "")),
+    )
+    for idx, row in enumerate(ranked, start=1):
+        row["rank"] = idx
+    return ranked
+
+
+def write_leaderboard(rows: list[dict[str, Any]], output_dir: Path) -> tuple[Path, Path]:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    json_path = output_dir / "leaderboard.json"
+    csv_path = output_dir / "leaderboard.csv"
+
+    json_path.write_text(json.dumps({"projects": rows}, indent=2) + "\n", encoding="utf-8")
+    with csv_path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=LEADERBOARD_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+
+    return json_path, csv_path
+
+
+def read_checkpoint(path: Path) -> list[dict[str, Any]]:
+    """Load completed rows from an append-only checkpoint log, ignoring a torn final line."""
+    if not path.exists():
+        return []
+    rows: list[dict[str, Any]] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(row, dict) and "project_path" in row:
+            rows.append(row)
+    return rows
+
+
+def _append_checkpoint(handle: Any, row: dict[str, Any]) -> None:
+    handle.write(json.dumps(row) + "\n")
+    handle.flush()
+    os.fsync(handle.fileno())
+
+
+def _dedupe_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    # Later rows win, except that an error never replaces a successful audit.
+    latest: dict[str, dict[str, Any]] = {}
+    for row in rows:
+        key = str(row["project_path"])
+        previous = latest.get(key)
+        if previous is not None and "error" not in previous and "error" in row:
+            continue
+        latest[key] = row
+    return list(latest.values())
+
+
+def run_fleet_audit(
+    projects: list[Path],
+    output_dir: Path,
+    workers: int | None = None,
+    shard: tuple[int, int] | None = None,
+    resume: bool = False,
+) -> FleetResult:
+    workers = workers or os.cpu_count() or 1
+    slugs = _report_slugs(projects)
+    reports_dir = output_dir / "reports"
+    if shard is not None:
+        projects = [project for project in projects if in_shard(slugs[project], *shard)]
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    checkpoint_path = output_dir / CHECKPOINT_NAME
+    done: list[dict[str, Any]] = []
+    if resume:
+        done = [row for row in _dedupe_rows(read_checkpoint(checkpoint_path)) if "error" not in row]
+    done_paths = {str(row["project_path"]) for row in done}
+    selected_paths = {str(project) for project in projects}
+    done = [row for row in done if str(row["project_path"]) in selected_paths]
+    pending = [project for project in projects if str(project) not in done_paths]
+
+    started = time.perf_counter()
+    rows: list[dict[str, Any]] = []
+    with checkpoint_path.open("a" if resume else "w", encoding="utf-8") as checkpoint:
+        if resume and checkpoint.tell() > 0 and not checkpoint_path.read_bytes().endswith(b"\n"):
+            # Terminate a line torn by a crash so the next row starts cleanly.
+            checkpoint.write("\n")
+        if workers == 1 or len(pending) <= 1:
+            for project in pending:
+                row = audit_project(project, reports_dir / slugs[project])
+                _append_checkpoint(checkpoint, row)
+                rows.append(row)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(audit_project, project, reports_dir / slugs[project]) for project in pending]
+                for future in as_completed(futures):
+                    row = future.result()
+                    _append_checkpoint(checkpoint, row)
+                    rows.append(row)
+    elapsed = time.perf_counter() - started
+
+    ranked = rank_rows(done + rows)
+    json_path, csv_path = write_leaderboard(ranked, output_dir)
+    return FleetResult(
+        rows=ranked,
+        leaderboard_json=json_path,
+        leaderboard_csv=csv_path,
+        elapsed_seconds=elapsed,
+        audited=len(rows),
+        skipped=len(done),
+    )
+
+
+def merge_leaderboards(sources: list[Path], output_dir: Path) -> tuple[list[dict[str, Any]], Path, Path]:
+    """Combine shard output directories (or their checkpoint logs) into one ranked leaderboard."""
+    rows: list[dict[str, Any]] = []
+    for source in sources:
+        checkpoint_path = source / CHECKPOINT_NAME if source.is_dir() else source
+        rows.extend(read_checkpoint(checkpoint_path))
+    ranked = rank_rows(_dedupe_rows(rows))
+    json_path, csv_path = write_leaderboard(ranked, output_dir)
+    return ranked, json_path, csv_path
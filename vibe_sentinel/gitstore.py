@@ -0,0 +1,528 @@
+from __future__ import annotations
+
+import hashlib
+import mmap
+import re
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+OBJECT_TYPES = {1: "commit", 2: "tree", 3: "blob", 4: "tag"}
+OFS_DELTA = 6
+REF_DELTA = 7
+CHUNK_SIZE = 64 * 1024
+
+_HEX_RE = re.compile(r"^[0-9a-f]{4,40}$")
+_SUFFIX_RE = re.compile(r"(\^\d*|~\d*)$")
+_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
+# Pseudo-refs such as HEAD and FETCH_HEAD live at the top of the git dir; everything else is under refs/.
+_PSEUDO_REF_RE = re.compile(r"^[A-Z_]*HEAD$")
+
+
+class GitError(Exception):
+    """Raised when a repository, revision or object cannot be read."""
+
+
+@dataclass(frozen=True)
+class Commit:
+    sha: str
+    tree: str
+    parents: tuple[str, ...]
+    timestamp: int
+    message: str
+
+
+@dataclass(frozen=True)
+class TreeEntry:
+    path: str
+    mode: str
+    sha: str
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    sha: str
+    mode: int
+    size: int
+    mtime_ns: int
+
+
+def hash_blob(path: Path) -> str:
+    """Compute the git blob id of a working-tree file."""
+    data = path.read_bytes()
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def _offset_varint(data: bytes, pos: int) -> tuple[int, int]:
+    byte = data[pos]
+    pos += 1
+    value = byte & 0x7F
+    while byte & 0x80:
+        byte = data[pos]
+        pos += 1
+        value = ((value + 1) << 7) | (byte & 0x7F)
+    return value, pos
+
+
+def _varint(data: bytes, pos: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return value, pos
+
+
+def _delta_target_size(delta: bytes) -> int:
+    _, pos = _varint(delta, 0)
+    return _varint(delta, pos)[0]
+
+
+def _apply_delta(base: bytes, delta: bytes) -> bytes:
+    _, pos = _varint(delta, 0)
+    target_size, pos = _varint(delta, pos)
+    out = bytearray()
+    while pos < len(delta):
+        op = delta[pos]
+        pos += 1
+        if op & 0x80:
+            offset = size = 0
+            for bit in range(4):
+                if op & (1 << bit):
+                    offset |= delta[pos] << (8 * bit)
+                    pos += 1
+            for bit in range(3):
+                if op & (1 << (4 + bit)):
+                    size |= delta[pos] << (8 * bit)
+                    pos += 1
+            out += base[offset : offset + (size or 0x10000)]
+        elif op:
+            out += delta[pos : pos + op]
+            pos += op
+        else:
+            raise GitError("Invalid delta opcode 0")
+    if len(out) != target_size:
+        raise GitError("Delta produced an object of the wrong size")
+    return bytes(out)
+
+
+class _Pack:
+    """A version 2 pack index plus its memory-mapped pack file."""
+
+    def __init__(self, idx_path: Path) -> None:
+        self.idx = idx_path.read_bytes()
+        if self.idx[:8] != b"\xfftOc\x00\x00\x00\x02":
+            raise GitError(f"Unsupported pack index version: {idx_path}")
+        self.count = int.from_bytes(self.idx[8 + 255 * 4 : 8 + 256 * 4], "big")
+        self._shas_at = 8 + 256 * 4
+        self._offsets_at = self._shas_at + self.count * 24
+        self._large_at = self._offsets_at + self.count * 4
+        with idx_path.with_suffix(".pack").open("rb") as handle:
+            self.data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _fanout(self, first_byte: int) -> tuple[int, int]:
+        start = 0 if first_byte == 0 else int.from_bytes(self.idx[8 + (first_byte - 1) * 4 : 8 + first_byte * 4], "big")
+        end = int.from_bytes(self.idx[8 + first_byte * 4 : 12 + first_byte * 4], "big")
+        return start, end
+
+    def _sha(self, position: int) -> bytes:
+        return self.idx[self._shas_at + position * 20 : self._shas_at + position * 20 + 20]
+
+    def find(self, sha: bytes) -> int | None:
+        low, high = self._fanout(sha[0])
+        while low < high:
+            mid = (low + high) // 2
+            candidate = self._sha(mid)
+            if candidate < sha:
+                low = mid + 1
+            elif candidate > sha:
+                high = mid
+            else:
+                return self._offset(mid)
+        return None
+
+    def find_prefix(self, prefix: str) -> set[str]:
+        matches: set[str] = set()
+        low, high = self._fanout(int(prefix[:2], 16))
+        for position in range(low, high):
+            candidate = self._sha(position).hex()
+            if candidate.startswith(prefix):
+                matches.add(candidate)
+        return matches
+
+    def _offset(self, position: int) -> int:
+        raw = int.from_bytes(self.idx[self._offsets_at + position * 4 : self._offsets_at + position * 4 + 4], "big")
+        if raw & 0x80000000:
+            large = self._large_at + (raw & 0x7FFFFFFF) * 8
+            return int.from_bytes(self.idx[large : large + 8], "big")
+        return raw
+
+    def header(self, offset: int) -> tuple[int, int, int]:
+        """Return ``(type, size, data_offset)`` for the pack entry at ``offset``."""
+        byte = self.data[offset]
+        offset += 1
+        kind = (byte >> 4) & 0x7
+        size = byte & 0x0F
+        shift = 4
+        while byte & 0x80:
+            byte = self.data[offset]
+            offset += 1
+            size |= (byte & 0x7F) << shift
+            shift += 7
+        return kind, size, offset
+
+    def inflate(self, offset: int, size: int) -> bytes:
+        decompressor = zlib.decompressobj()
+        out = bytearray()
+        while not decompressor.eof and len(out) <= size:
+            chunk = self.data[offset : offset + CHUNK_SIZE]
+            if not chunk:
+                break
+            out += decompressor.decompress(chunk)
+            offset += CHUNK_SIZE
+        return bytes(out[:size])
+
+
+class GitRepository:
+    """Read-only access to a repository's objects and refs without touching its working tree."""
+
+    def __init__(self, git_dir: Path) -> None:
+        self.git_dir = git_dir
+        common = git_dir / "commondir"
+        self.common_dir = (git_dir / common.read_text(encoding="utf-8").strip()).resolve() if common.exists() else git_dir
+        self.object_dirs = [self.common_dir / "objects"]
+        alternates = self.common_dir / "objects" / "info" / "alternates"
+        if alternates.exists():
+            for line in alternates.read_text(encoding="utf-8").splitlines():
+                if line.strip() and not line.startswith("#"):
+                    self.object_dirs.append((self.common_dir / "objects" / line.strip()).resolve())
+        self._packs: list[_Pack] | None = None
+        # Trees, commits and delta bases are re-read constantly; keep a small working set decoded.
+        self.read_object = lru_cache(maxsize=256)(self._read_object)
+
+    @classmethod
+    def discover(cls, path: Path) -> tuple[GitRepository, str]:
+        """Find the repository containing ``path`` and return it with ``path``'s prefix inside the worktree."""
+        path = path.resolve()
+        for candidate in (path, *path.parents):
+            dot_git = candidate / ".git"
+            if dot_git.is_dir():
+                git_dir = dot_git
+            elif dot_git.is_file():
+                pointer = dot_git.read_text(encoding="utf-8").strip()
+                if not pointer.startswith("gitdir:"):
+                    continue
+                git_dir = (candidate / pointer[len("gitdir:") :].strip()).resolve()
+            elif (candidate / "HEAD").is_file() and (candidate / "objects").is_dir():
+                git_dir = candidate
+            else:
+                continue
+            prefix = "" if candidate == path else path.relative_to(candidate).as_posix()
+            return cls(git_dir), prefix
+        raise GitError(f"Not inside a git repository: {path}")
+
+    @property
+    def packs(self) -> list[_Pack]:
+        if self._packs is None:
+            self._packs = []
+            for object_dir in self.object_dirs:
+                for idx_path in sorted((object_dir / "pack").glob("*.idx")):
+                    if idx_path.with_suffix(".pack").exists():
+                        self._packs.append(_Pack(idx_path))
+        return self._packs
+
+    def _loose_path(self, sha: str) -> Path | None:
+        for object_dir in self.object_dirs:
+            path = object_dir / sha[:2] / sha[2:]
+            if path.exists():
+                return path
+        return None
+
+    def _read_packed(self, pack: _Pack, offset: int) -> tuple[str, bytes]:
+        kind, size, data_offset = pack.header(offset)
+        if kind in OBJECT_TYPES:
+            return OBJECT_TYPES[kind], pack.inflate(data_offset, size)
+        if kind == OFS_DELTA:
+            byte = pack.data[data_offset]
+            data_offset += 1
+            distance = byte & 0x7F
+            while byte & 0x80:
+                byte = pack.data[data_offset]
+                data_offset += 1
+                distance = ((distance + 1) << 7) | (byte & 0x7F)
+            base_type, base = self._read_packed(pack, offset - distance)
+        elif kind == REF_DELTA:
+            base_sha = bytes(pack.data[data_offset : data_offset + 20]).hex()
+            data_offset += 20
+            base_type, base = self.read_object(base_sha)
+        else:
+            raise GitError(f"Unknown pack object type {kind}")
+        return base_type, _apply_delta(base, pack.inflate(data_offset, size))
+
+    def _read_object(self, sha: str) -> tuple[str, bytes]:
+        loose = self._loose_path(sha)
+        if loose is not None:
+            raw = zlib.decompress(loose.read_bytes())
+            header, _, body = raw.partition(b"\0")
+            kind, _, _ = header.decode("ascii").partition(" ")
+            return kind, body
+        binary = bytes.fromhex(sha)
+        for pack in self.packs:
+            offset = pack.find(binary)
+            if offset is not None:
+                return self._read_packed(pack, offset)
+        raise GitError(f"Object not found: {sha}")
+
+    def object_size(self, sha: str) -> int:
+        """Return an object's size from its header without inflating the whole object."""
+        loose = self._loose_path(sha)
+        if loose is not None:
+            with loose.open("rb") as handle:
+                head = zlib.decompressobj().decompress(handle.read(CHUNK_SIZE), 64)
+            return int(head.partition(b"\0")[0].split(b" ")[1])
+        binary = bytes.fromhex(sha)
+        for pack in self.packs:
+            offset = pack.find(binary)
+            if offset is None:
+                continue
+            kind, size, data_offset = pack.header(offset)
+            if kind in OBJECT_TYPES:
+                return size
+            if kind == OFS_DELTA:
+                while pack.data[data_offset] & 0x80:
+                    data_offset += 1
+                data_offset += 1
+            else:
+                data_offset += 20
+            delta_head = pack.inflate(data_offset, min(size, 32))
+            return _delta_target_size(delta_head)
+        raise GitError(f"Object not found: {sha}")
+
+    def read_index(self, path: Path | None = None) -> dict[str, IndexEntry]:
+        """Parse the stage-0 entries of an index file (versions 2-4), keyed by repository-relative path.
+
+        ``path`` defaults to ``.git/index``; pass another file to read a temporary index.
+        """
+        path = path or self.git_dir / "index"
+        if not path.exists():
+            return {}
+        data = path.read_bytes()
+        if data[:4] != b"DIRC":
+            raise GitError(f"Not a git index file: {path}")
+        version = int.from_bytes(data[4:8], "big")
+        if version not in {2, 3, 4}:
+            raise GitError(f"Unsupported git index version {version}")
+        count = int.from_bytes(data[8:12], "big")
+
+        entries: dict[str, IndexEntry] = {}
+        pos = 12
+        previous_name = b""
+        for _ in range(count):
+            start = pos
+            mtime_ns = int.from_bytes(data[pos + 8 : pos + 12], "big") * 1_000_000_000 + int.from_bytes(
+                data[pos + 12 : pos + 16], "big"
+            )
+            mode = int.from_bytes(data[pos + 24 : pos + 28], "big")
+            size = int.from_bytes(data[pos + 36 : pos + 40], "big")
+            sha = data[pos + 40 : pos + 60].hex()
+            flags = int.from_bytes(data[pos + 60 : pos + 62], "big")
+            pos += 62
+            if version >= 3 and flags & 0x4000:
+                pos += 2
+            if version == 4:
+                strip, pos = _offset_varint(data, pos)
+                end = data.index(b"\0", pos)
+                name = previous_name[: len(previous_name) - strip] + data[pos:end]
+                pos = end + 1
+            else:
+                end = data.index(b"\0", pos)
+                name = data[pos:end]
+                # Entries are NUL-padded to a multiple of eight bytes.
+                pos = start + ((end - start + 8) // 8) * 8
+            previous_name = name
+            if (flags >> 12) & 0x3:
+                continue
+            entries[name.decode("utf-8", errors="surrogateescape")] = IndexEntry(sha, mode, size, mtime_ns)
+        return entries
+
+    def _read_ref(self, name: str) -> str | None:
+        if not _PSEUDO_REF_RE.match(name) and not (name.startswith("refs/") and ".." not in name.split("/")):
+            # Other files under .git (config, description, ...) are not refs.
+            return None
+        for base in (self.git_dir, self.common_dir):
+            path = base / name
+            if path.is_file():
+                value = path.read_text(encoding="utf-8").strip()
+                if value.startswith("ref:"):
+                    return self._read_ref(value[4:].strip())
+                # FETCH_HEAD lines carry the branch and remote after the object id.
+                return value.split(None, 1)[0] if value else None
+        packed = self.common_dir / "packed-refs"
+        if packed.exists():
+            for line in packed.read_text(encoding="utf-8").splitlines():
+                if line.startswith(("#", "^")):
+                    continue
+                sha, _, ref = line.partition(" ")
+                if ref.strip() == name:
+                    return sha
+        return None
+
+    def _expand_prefix(self, prefix: str) -> str | None:
+        matches: set[str] = set()
+        for object_dir in self.object_dirs:
+            bucket = object_dir / prefix[:2]
+            if bucket.is_dir():
+                matches.update(prefix[:2] + entry.name for entry in bucket.iterdir() if (prefix[:2] + entry.name).startswith(prefix))
+        for pack in self.packs:
+            matches.update(pack.find_prefix(prefix))
+        if len(matches) > 1:
+            raise GitError(f"Ambiguous short object id: {prefix}")
+        return matches.pop() if matches else None
+
+    def peel_commit(self, sha: str) -> str:
+        kind, body = self.read_object(sha)
+        while kind == "tag":
+            sha = body.split(b"\n", 1)[0].split(b" ", 1)[1].decode("ascii")
+            kind, body = self.read_object(sha)
+        if kind != "commit":
+            raise GitError(f"Object {sha} is a {kind}, not a commit")
+        return sha
+
+    def resolve(self, rev: str) -> str:
+        """Resolve a ref name, full or short object id, with optional ``~N``/``^N`` suffixes, to a commit."""
+        rev = rev.strip()
+        suffix = _SUFFIX_RE.search(rev)
+        if suffix and suffix.start() > 0:
+            base = self.resolve(rev[: suffix.start()])
+            token = suffix.group(0)
+            count = int(token[1:] or "1")
+            if token[0] == "~":
+                for _ in range(count):
+                    parents = self.commit(base).parents
+                    if not parents:
+                        raise GitError(f"Revision has no ancestor: {rev}")
+                    base = parents[0]
+                return base
+            if count == 0:
+                return base
+            parents = self.commit(base).parents
+            if len(parents) < count:
+                raise GitError(f"Revision has no parent {count}: {rev}")
+            return parents[count - 1]
+
+        for name in (rev, f"refs/{rev}", f"refs/tags/{rev}", f"refs/heads/{rev}", f"refs/remotes/{rev}", f"refs/remotes/{rev}/HEAD"):
+            sha = self._read_ref(name)
+            if sha:
+                if not _SHA_RE.match(sha):
+                    raise GitError(f"Unknown revision: {rev}")
+                return self.peel_commit(sha)
+        if _HEX_RE.match(rev):
+            sha = rev if len(rev) == 40 else self._expand_prefix(rev)
+            if sha:
+                return self.peel_commit(sha)
+        raise GitError(f"Unknown revision: {rev}")
+
+    def commit(self, sha: str) -> Commit:
+        kind, body = self.read_object(sha)
+        if kind != "commit":
+            raise GitError(f"Object {sha} is a {kind}, not a commit")
+        headers, _, message = body.decode("utf-8", errors="replace").partition("\n\n")
+        tree = ""
+        parents: list[str] = []
+        timestamp = 0
+        for line in headers.splitlines():
+            key, _, value = line.partition(" ")
+            if key == "tree":
+                tree = value
+            elif key == "parent":
+                parents.append(value)
+            elif key == "committer":
+                parts = value.rsplit(" ", 2)
+                timestamp = int(parts[-2]) if len(parts) == 3 and parts[-2].isdigit() else 0
+        return Commit(sha=sha, tree=tree, parents=tuple(parents), timestamp=timestamp, message=message)
+
+    def iter_tree(self, tree_sha: str, prefix: str = "", excluded_dirs: set[str] | None = None) -> Iterator[TreeEntry]:
+        """Yield regular-file blobs under ``tree_sha`` recursively, skipping excluded directory names."""
+        for entry in self._tree_children(tree_sha):
+            path = f"{prefix}{entry.path}"
+            if entry.mode == "40000":
+                if excluded_dirs is None or entry.path not in excluded_dirs:
+                    yield from self.iter_tree(entry.sha, f"{path}/", excluded_dirs)
+            elif entry.mode in {"100644", "100755"}:
+                yield TreeEntry(path=path, mode=entry.mode, sha=entry.sha)
+
+    def list_tree(
+        self,
+        tree_sha: str,
+        excluded_dirs: set[str] | None = None,
+        memo: dict[str, list[TreeEntry]] | None = None,
+    ) -> list[TreeEntry]:
+        """Like :meth:`iter_tree`, but materialised; ``memo`` shares listings of identical subtrees across calls."""
+        if memo is None:
+            return list(self.iter_tree(tree_sha, "", excluded_dirs))
+        cached = memo.get(tree_sha)
+        if cached is not None:
+            return cached
+        entries: list[TreeEntry] = []
+        for entry in self._tree_children(tree_sha):
+            if entry.mode == "40000":
+                if excluded_dirs is None or entry.path not in excluded_dirs:
+                    entries.extend(
+                        TreeEntry(path=f"{entry.path}/{child.path}", mode=child.mode, sha=child.sha)
+                        for child in self.list_tree(entry.sha, excluded_dirs, memo)
+                    )
+            elif entry.mode in {"100644", "100755"}:
+                entries.append(entry)
+        memo[tree_sha] = entries
+        return entries
+
+    def subtree(self, tree_sha: str, prefix: str) -> str:
+        """Return the tree object id for directory ``prefix`` inside ``tree_sha``."""
+        for part in [part for part in prefix.split("/") if part]:
+            for entry in self._tree_children(tree_sha):
+                if entry.path == part and entry.mode == "40000":
+                    tree_sha = entry.sha
+                    break
+            else:
+                raise GitError(f"Path not found in revision: {prefix}")
+        return tree_sha
+
+    def _tree_children(self, tree_sha: str) -> Iterator[TreeEntry]:
+        kind, body = self.read_object(tree_sha)
+        if kind != "tree":
+            raise GitError(f"Object {tree_sha} is a {kind}, not a tree")
+        pos = 0
+        while pos < len(body):
+            space = body.index(b" ", pos)
+            nul = body.index(b"\0", space)
+            yield TreeEntry(
+                path=body[space + 1 : nul].decode("utf-8", errors="surrogateescape"),
+                mode=body[pos:space].decode("ascii"),
+                sha=body[nul + 1 : nul + 21].hex(),
+            )
+            pos = nul + 21
+
+
+def revision_files(
+    repo: GitRepository,
+    commit_sha: str,
+    prefix: str = "",
+    excluded_dirs: set[str] | None = None,
+) -> dict[str, TreeEntry]:
+    """Map project-relative paths to blob entries for the project directory ``prefix`` at a commit."""
+    tree_sha = repo.subtree(repo.commit(commit_sha).tree, prefix)
+    return {entry.path: entry for entry in repo.iter_tree(tree_sha, "", excluded_dirs)}
+
+
+def blob_text(repo: GitRepository, sha: str, max_bytes: int = 1_000_000) -> str:
+    """Decode a blob the way working-tree files are read: UTF-8 only, skipping oversized files."""
+    if repo.object_size(sha) > max_bytes:
+        return ""
+    try:
+        return repo.read_object(sha)[1].decode("utf-8")
+    except UnicodeDecodeError:
+        return ""
@@ -9,10 +9,7 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
-from vibe_sentinel.agent_pack import write_agent_pack
-from vibe_sentinel.checks import compute_scorecard, run_checks
-from vibe_sentinel.coach import write_coach
-from vibe_sentinel.report import build_audit_report, write_report_files, write_roadmap
+from vibe_sentinel import api
 
 
 @dataclass(frozen=True)
@@ -23,19 +20,6 @@ class StudioConfig:
     openclaw_api_key: str | None = None
 
 
-def _artifact_dir(project_path: Path) -> Path:
-    return project_path / ".vibe-sentinel"
-
-
-def _audit(project_path: Path) -> tuple[dict[str, Any], Path, Path]:
-    checks = run_checks(project_path)
-    scorecard = compute_scorecard(checks)
-    report = build_audit_report(project_path, checks, scorecard)
-    output_dir = _artifact_dir(project_path)
-    report_json_path, report_markdown_path = write_report_files(report, output_dir)
-    return report.to_dict(), report_json_path, report_markdown_path
-
-
 def _open_findings(report_payload: dict[str, Any]) -> list[dict[str, Any]]:
     checks = report_payload.get("checks", [])
     findings = [check for check in checks if check.get("status") != "pass"]
@@ -96,127 +80,97 @@ def _derive_insights(report_payload: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def run_audit_flow(project_path: Path) -> dict[str, Any]:
-    report_payload, report_json_path, report_markdown_path = _audit(project_path)
+def _pack_artifacts(pack: api.AgentPackResult) -> dict[str, str]:
+    return {
+        "agent_pack_markdown": str(pack.markdown_path),
+        "agent_tasks_json": str(pack.tasks_path),
+        "agent_runbook_markdown": str(pack.runbook_path),
+        "agent_prompts_dir": str(pack.prompts_dir),
+    }
+
+
+def run_audit_flow(project_path: Path, use_cache: bool = True) -> dict[str, Any]:
+    audited = api.audit(project_path, api.AuditOptions(use_cache=use_cache), project_path / api.ARTIFACT_DIR)
+    report_payload = audited.report.to_dict()
     return {
         "report": report_payload,
         "insights": _derive_insights(report_payload),
         "artifacts": {
-            "report_json": str(report_json_path),
-            "report_markdown": str(report_markdown_path),
+            "report_json": str(audited.report_json),
+            "report_markdown": str(audited.report_markdown),
         },
     }
 
 
 def run_roadmap_flow(project_path: Path) -> dict[str, Any]:
-    report_payload, report_json_path, _ = _audit(project_path)
-    roadmap_path = _artifact_dir(project_path) / "roadmap.md"
-    write_roadmap(report_json_path, roadmap_path)
-    content = roadmap_path.read_text(encoding="utf-8")
+    result = api.roadmap(project_path)
+    report_payload = result.audit.report.to_dict()
     return {
         "report": report_payload,
         "insights": _derive_insights(report_payload),
-        "roadmap_markdown": content,
+        "roadmap_markdown": result.markdown,
         "artifacts": {
-            "roadmap_markdown": str(roadmap_path),
-            "report_json": str(report_json_path),
+            "roadmap_markdown": str(result.roadmap_path),
+            "report_json": str(result.audit.report_json),
         },
     }
 
 
 def run_coach_flow(project_path: Path, apply_safe: bool) -> dict[str, Any]:
-    report_payload, report_json_path, _ = _audit(project_path)
-    coach_path = _artifact_dir(project_path) / "coach.md"
-    _, applied_files = write_coach(
-        report_json_path=report_json_path,
-        output_path=coach_path,
-        project_path=project_path,
-        apply_safe=apply_safe,
-    )
-    content = coach_path.read_text(encoding="utf-8")
+    result = api.coach(project_path, apply_safe=apply_safe)
+    report_payload = result.audit.report.to_dict()
     return {
         "report": report_payload,
         "insights": _derive_insights(report_payload),
-        "coach_markdown": content,
-        "applied_files": [str(path) for path in applied_files],
+        "coach_markdown": result.markdown,
+        "applied_files": [str(path) for path in result.applied_files],
         "artifacts": {
-            "coach_markdown": str(coach_path),
-            "report_json": str(report_json_path),
+            "coach_markdown": str(result.coach_path),
+            "report_json": str(result.audit.report_json),
         },
     }
 
 
 def run_agent_pack_flow(project_path: Path) -> dict[str, Any]:
-    report_payload, report_json_path, _ = _audit(project_path)
-    output_dir = _artifact_dir(project_path)
-    pack_path = output_dir / "agent_pack.md"
-    tasks_path = output_dir / "agent_tasks.json"
-    runbook_path = output_dir / "agent_runbook.md"
-    prompts_dir = output_dir / "prompts"
-
-    _, _, _, task_count, tasks = write_agent_pack(
-        report_json_path=report_json_path,
-        output_markdown_path=pack_path,
-        output_json_path=tasks_path,
-        project_path=project_path,
-        runbook_path=runbook_path,
-        prompts_dir=prompts_dir,
-    )
-    content = pack_path.read_text(encoding="utf-8")
+    result = api.agent_pack(project_path)
+    report_payload = result.audit.report.to_dict()
     return {
         "report": report_payload,
         "insights": _derive_insights(report_payload),
-        "agent_pack_markdown": content,
-        "agent_tasks": tasks,
-        "task_count": task_count,
-        "artifacts": {
-            "agent_pack_markdown": str(pack_path),
-            "agent_tasks_json": str(tasks_path),
-            "agent_runbook_markdown": str(runbook_path),
-            "agent_prompts_dir": str(prompts_dir),
-            "report_json": str(report_json_path),
-        },
+        "agent_pack_markdown": result.markdown,
+        "agent_tasks": result.tasks,
+        "task_count": len(result.tasks),
+        "artifacts": {**_pack_artifacts(result), "report_json": str(result.audit.report_json)},
     }
 
 
 def run_ship_flow(project_path: Path, apply_safe: bool = True) -> dict[str, Any]:
-    before = run_audit_flow(project_path)
-    before_report = before["report"]
-    before_score = before_report.get("scorecard", {}).get("overall", 0.0)
-
-    pack = run_agent_pack_flow(project_path)
-    coach = run_coach_flow(project_path, apply_safe=apply_safe)
-    roadmap = run_roadmap_flow(project_path)
-
-    after = run_audit_flow(project_path)
-    after_report = after["report"]
-    after_score = after_report.get("scorecard", {}).get("overall", 0.0)
-
-    improvement = round(float(after_score) - float(before_score), 2)
+    result = api.ship(project_path, apply_safe=apply_safe)
+    before_report = result.before.report.to_dict()
+    after_report = result.after.report.to_dict()
+    improvement = round(float(after_report["scorecard"]["overall"]) - float(before_report["scorecard"]["overall"]), 2)
 
     return {
         "before": before_report,
-        "before_insights": before["insights"],
+        "before_insights": _derive_insights(before_report),
         "after": after_report,
-        "after_insights": after["insights"],
+        "after_insights": _derive_insights(after_report),
         "improvement": improvement,
-        "applied_files": coach.get("applied_files", []),
-        "task_count": pack.get("task_count", 0),
-        "agent_tasks": pack.get("agent_tasks", []),
+        "applied_files": [str(path) for path in result.coach.applied_files],
+        "task_count": len(result.agent_pack.tasks),
+        "agent_tasks": result.agent_pack.tasks,
         "remaining_findings": _open_findings(after_report),
-        "agent_pack_markdown": pack.get("agent_pack_markdown", ""),
-        "coach_markdown": coach.get("coach_markdown", ""),
-        "roadmap_markdown": roadmap.get("roadmap_markdown", ""),
+        "agent_pack_markdown": result.agent_pack.markdown,
+        "coach_markdown": result.coach.markdown,
+        "roadmap_markdown": result.roadmap.markdown,
         "artifacts": {
-            "report_json": after["artifacts"]["report_json"],
-            "report_markdown": after["artifacts"]["report_markdown"],
-            "coach_markdown": coach["artifacts"]["coach_markdown"],
-            "agent_pack_markdown": pack["artifacts"]["agent_pack_markdown"],
-            "agent_tasks_json": pack["artifacts"]["agent_tasks_json"],
-            "agent_runbook_markdown": pack["artifacts"]["agent_runbook_markdown"],
-            "agent_prompts_dir": pack["artifacts"]["agent_prompts_dir"],
-            "roadmap_markdown": roadmap["artifacts"]["roadmap_markdown"],
+            "report_json": str(result.after.report_json),
+            "report_markdown": str(result.after.report_markdown),
+            "coach_markdown": str(result.coach.coach_path),
+            **_pack_artifacts(result.agent_pack),
+            "roadmap_markdown": str(result.roadmap.roadmap_path),
         },
+        "timings": result.timings,
     }
 
 
@@ -321,7 +275,8 @@ def _openclaw_execute(project_path: Path, payload: dict[str, Any]) -> dict[str,
         raise ValueError("`action` is required for /api/openclaw/execute")
 
     if action == "audit":
-        return {"action": action, "result": run_audit_flow(project_path)}
+        use_cache = not bool(payload.get("no_cache", False))
+        return {"action": action, "result": run_audit_flow(project_path, use_cache=use_cache)}
     if action == "roadmap":
         return {"action": action, "result": run_roadmap_flow(project_path)}
     if action == "coach":
@@ -451,7 +406,7 @@ def create_handler(config: StudioConfig) -> type[BaseHTTPRequestHandler]:
                         _json_response(self, HTTPStatus.BAD_REQUEST, {"error": project_error})
                         return
                     assert project_path is not None
-                    result = run_audit_flow(project_path)
+                    result = run_audit_flow(project_path, use_cache=not bool(payload.get("no_cache", False)))
                 elif path == "/api/roadmap":
                     project_path, project_error = _project_path_from_payload(payload)
                     if project_error:
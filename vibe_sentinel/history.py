@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import csv
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from vibe_sentinel.checks import (
+    CONTENT_RULES,
+    EXCLUDED_DIRS,
+    ContentRule,
+    FileStat,
+    build_context,
+    compute_scorecard,
+    evaluate_checks,
+    visit_file,
+)
+from vibe_sentinel.gitstore import GitError, GitRepository, TreeEntry, blob_text
+from vibe_sentinel.models import ScoreCard
+
+HISTORY_FIELDS = ["commit", "committed_at", "overall", "usefulness", "impact", "execution", "innovation", "subject"]
+
+
+@dataclass(frozen=True)
+class HistoryPoint:
+    commit: str
+    timestamp: int
+    subject: str
+    scorecard: ScoreCard
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "commit": self.commit,
+            "committed_at": datetime.fromtimestamp(self.timestamp, timezone.utc).isoformat(),
+            "subject": self.subject,
+            **self.scorecard.to_dict(),
+        }
+
+
+@dataclass(frozen=True)
+class ScoreHistory:
+    points: list[HistoryPoint]
+    unique_blobs: int
+    unique_trees: int
+
+
+class _BlobFindings:
+    """Per-blob content rule results shared across every commit of one history walk.
+
+    Findings are keyed by path and blob id because rules select files by path, so a blob is
+    read once per path it appears under, however many commits contain it.
+    """
+
+    def __init__(self, repo: GitRepository, rules: tuple[ContentRule, ...]) -> None:
+        self.repo = repo
+        self.rules = rules
+        self.findings: dict[tuple[str, str], dict[str, Any]] = {}
+        self.sizes: dict[str, int] = {}
+
+    def size(self, sha: str) -> int:
+        if sha not in self.sizes:
+            self.sizes[sha] = self.repo.object_size(sha)
+        return self.sizes[sha]
+
+    def content(self, entries: list[TreeEntry]) -> dict[str, dict[str, Any]]:
+        content: dict[str, dict[str, Any]] = {rule.rule_id: {} for rule in self.rules}
+        for entry in entries:
+            key = (entry.path, entry.sha)
+            found = self.findings.get(key)
+            if found is None:
+                found, _ = visit_file(entry.path, self.rules, lambda _, sha=entry.sha: blob_text(self.repo, sha))
+                self.findings[key] = found
+            for rule_id, finding in found.items():
+                content[rule_id][entry.path] = finding
+        return content
+
+
+def _first_parent_chain(repo: GitRepository, head: str, limit: int) -> list[str]:
+    chain: list[str] = []
+    sha: str | None = head
+    while sha is not None and len(chain) < limit:
+        chain.append(sha)
+        parents = repo.commit(sha).parents
+        sha = parents[0] if parents else None
+    return chain
+
+
+def score_history(
+    project_path: Path,
+    commits: int = 20,
+    rev: str = "HEAD",
+    rules: tuple[ContentRule, ...] = CONTENT_RULES,
+) -> ScoreHistory:
+    """Score the last ``commits`` first-parent commits up to ``rev``, oldest first.
+
+    Subtree listings, blob reads and rule findings are memoised across commits, and a commit
+    whose project tree matches an already scored one reuses its scorecard, so the cost follows
+    the number of unique trees and blobs rather than commits times files.
+    """
+    repo, prefix = GitRepository.discover(project_path)
+    blobs = _BlobFindings(repo, rules)
+    listings: dict[str, list[TreeEntry]] = {}
+    scored: dict[str, ScoreCard] = {}
+    points: list[HistoryPoint] = []
+
+    for sha in reversed(_first_parent_chain(repo, repo.resolve(rev), max(1, commits))):
+        commit = repo.commit(sha)
+        try:
+            tree_sha = repo.subtree(commit.tree, prefix)
+        except GitError:
+            # The project directory did not exist yet at this commit.
+            continue
+        scorecard = scored.get(tree_sha)
+        if scorecard is None:
+            entries = repo.list_tree(tree_sha, EXCLUDED_DIRS, listings)
+            committed_ns = commit.timestamp * 1_000_000_000
+            index = {entry.path: FileStat(blobs.size(entry.sha), committed_ns) for entry in entries}
+            ctx = build_context(
+                project_path,
+                rules,
+                index=index,
+                content=blobs.content(entries),
+                blob_ids={entry.path: entry.sha for entry in entries},
+            )
+            scorecard = compute_scorecard(evaluate_checks(ctx))
+            scored[tree_sha] = scorecard
+        subject = commit.message.strip().splitlines()[0] if commit.message.strip() else ""
+        points.append(HistoryPoint(commit=sha, timestamp=commit.timestamp, subject=subject, scorecard=scorecard))
+
+    return ScoreHistory(points=points, unique_blobs=len(blobs.sizes), unique_trees=len(scored))
+
+
+def write_history(history: ScoreHistory, output_dir: Path) -> tuple[Path, Path]:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    rows = [point.to_dict() for point in history.points]
+
+    json_path = output_dir / "history.json"
+    json_path.write_text(json.dumps(rows, indent=2) + "\n", encoding="utf-8")
+
+    csv_path = output_dir / "history.csv"
+    with csv_path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=HISTORY_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    return json_path, csv_path
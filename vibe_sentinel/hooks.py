@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import os
+import shlex
+import stat
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from vibe_sentinel.checks import EXCLUDED_DIRS, FileStat, build_context, evaluate_checks
+from vibe_sentinel.gitstore import GitError, GitRepository, blob_text
+from vibe_sentinel.models import CheckResult
+
+HOOK_MARKER = "# Installed by vibe-sentinel hook install."
+REGULAR_FILE_MODES = {0o100644, 0o100755}
+# The secret scan gates the commit; the existence checks are advisory and answered from the index alone.
+PRECOMMIT_CHECKS = ("secret_scan", "tests_present", "ci_present", "license_present")
+
+
+@dataclass(frozen=True)
+class PrecommitResult:
+    """Staged files that differ from HEAD and the checks run against the staged tree."""
+
+    staged: list[str]
+    checks: list[CheckResult]
+
+    @property
+    def blocked(self) -> bool:
+        return any(check.check_id == "secret_scan" and check.status == "fail" for check in self.checks)
+
+
+def _hooks_dir(repo: GitRepository) -> Path:
+    # Honour core.hooksPath; git config indents keys, which configparser would read as continuations.
+    config = repo.common_dir / "config"
+    section = ""
+    try:
+        lines = config.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        lines = []
+    for line in lines:
+        line = line.strip()
+        if line.startswith("["):
+            section = line.strip("[]").strip().lower()
+        elif section == "core" and "=" in line:
+            key, _, value = line.partition("=")
+            if key.strip().lower() == "hookspath":
+                hooks_path = Path(os.path.expanduser(value.strip().strip('"')))
+                if not hooks_path.is_absolute():
+                    # Relative hook paths resolve against the worktree root.
+                    hooks_path = repo.common_dir.parent / hooks_path
+                return hooks_path
+    return repo.common_dir / "hooks"
+
+
+def hook_script(prefix: str, python: str | None = None) -> str:
+    """Return a pre-commit hook that runs ``precommit`` on the project directory ``prefix``."""
+    python = python or sys.executable
+    project = shlex.quote(prefix or ".")
+    return (
+        "#!/bin/sh\n"
+        f"{HOOK_MARKER}\n"
+        "# Delete this file to uninstall; bypass once with `git commit --no-verify`.\n"
+        'cd "$(git rev-parse --show-toplevel)" || exit 1\n'
+        f"exec {shlex.quote(python)} -m vibe_sentinel precommit {project}\n"
+    )
+
+
+def install_hook(project_path: Path, force: bool = False) -> Path:
+    """Write the pre-commit hook for the repository containing ``project_path``.
+
+    An existing hook that vibe-sentinel did not write is only replaced with ``force``.
+    """
+    repo, prefix = GitRepository.discover(project_path)
+    hook_path = _hooks_dir(repo) / "pre-commit"
+    if hook_path.exists() and not force:
+        try:
+            existing = hook_path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            existing = ""
+        if HOOK_MARKER not in existing:
+            raise FileExistsError(f"{hook_path} already exists and was not written by vibe-sentinel; pass --force")
+    hook_path.parent.mkdir(parents=True, exist_ok=True)
+    hook_path.write_text(hook_script(prefix), encoding="utf-8")
+    mode = hook_path.stat().st_mode
+    hook_path.chmod(mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return hook_path
+
+
+def precommit_audit(project_path: Path) -> PrecommitResult:
+    """Check the staged tree without touching the working tree.
+
+    File listings and sizes come from the index; content comes from the staged blobs, and
+    only blobs that differ from HEAD are read. Nothing is walked, hashed or written.
+    ``git commit -a`` and ``git commit <path>`` stage into a temporary index that git names in
+    ``$GIT_INDEX_FILE``, so that file is read when set.
+    """
+    repo, prefix = GitRepository.discover(project_path)
+    repo_prefix = f"{prefix}/" if prefix else ""
+    index_file = os.environ.get("GIT_INDEX_FILE")
+    # A relative $GIT_INDEX_FILE is relative to the hook's cwd, the worktree top-level.
+    index_path = Path(index_file).resolve() if index_file else None
+    entries = {
+        path[len(repo_prefix) :]: entry
+        for path, entry in repo.read_index(index_path).items()
+        if path.startswith(repo_prefix)
+        and entry.mode in REGULAR_FILE_MODES
+        and not any(part in EXCLUDED_DIRS for part in path[len(repo_prefix) :].split("/")[:-1])
+    }
+
+    try:
+        head_tree = repo.subtree(repo.commit(repo.resolve("HEAD")).tree, prefix)
+        committed = {entry.path: entry.sha for entry in repo.list_tree(head_tree, EXCLUDED_DIRS)}
+    except GitError:
+        # Initial commit, or the project directory is new: everything staged is a change.
+        committed = {}
+    staged = sorted(path for path, entry in entries.items() if committed.get(path) != entry.sha)
+
+    ctx = build_context(
+        project_path,
+        index={path: FileStat(entry.size, entry.mtime_ns) for path, entry in entries.items()},
+        read_text=lambda rel_path: blob_text(repo, entries[rel_path].sha),
+        scope=staged,
+        blob_ids={path: entry.sha for path, entry in entries.items()},
+    )
+    return PrecommitResult(staged=staged, checks=evaluate_checks(ctx, only=PRECOMMIT_CHECKS))
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+from vibe_sentinel.assets import BINARY_SUFFIXES
+from vibe_sentinel.classify import classify_path
+from vibe_sentinel.storage import cache_root, evict_lru, write_json_atomic
+from vibe_sentinel.tree import FileStat
+
+LANGUAGE_SUFFIXES = {
+    ".py": "Python",
+    ".pyi": "Python",
+    ".ipynb": "Jupyter",
+    ".js": "JavaScript",
+    ".mjs": "JavaScript",
+    ".cjs": "JavaScript",
+    ".jsx": "JavaScript",
+    ".ts": "TypeScript",
+    ".tsx": "TypeScript",
+    ".go": "Go",
+    ".rs": "Rust",
+    ".java": "Java",
+    ".kt": "Kotlin",
+    ".swift": "Swift",
+    ".c": "C",
+    ".h": "C",
+    ".cc": "C++",
+    ".cpp": "C++",
+    ".hpp": "C++",
+    ".cs": "C#",
+    ".rb": "Ruby",
+    ".php": "PHP",
+    ".sh": "Shell",
+    ".bash": "Shell",
+    ".html": "HTML",
+    ".css": "CSS",
+    ".scss": "CSS",
+    ".sql": "SQL",
+    ".md": "Markdown",
+    ".rst": "reStructuredText",
+    ".txt": "Text",
+    ".json": "JSON",
+    ".toml": "TOML",
+    ".yaml": "YAML",
+    ".yml": "YAML",
+}
+LANGUAGE_NAMES = {"Dockerfile": "Dockerfile", "Makefile": "Makefile"}
+OTHER = "Other"
+BINARY = "Binary"
+
+CHUNK_BYTES = 1 << 20
+# Below this much unread data a pool costs more to start than it saves.
+POOL_MIN_BYTES = 64 << 20
+MAX_LINE_STATES = 64
+# Bumped when count_lines changes, so counts persisted by an older rule are not reused.
+LINE_COUNT_VERSION = 2
+
+
+@dataclass(frozen=True)
+class LanguageStats:
+    """Files, lines and bytes per language; lines are only counted for recognised text languages."""
+
+    languages: dict[str, dict[str, int]]
+
+    @property
+    def totals(self) -> dict[str, int]:
+        return {
+            key: sum(entry[key] for entry in self.languages.values()) for key in ("files", "lines", "bytes")
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"languages": self.languages, "totals": self.totals}
+
+
+def language_of(relative_path: str) -> str:
+    path = PurePosixPath(relative_path)
+    if path.suffix.lower() in BINARY_SUFFIXES:
+        return BINARY
+    return LANGUAGE_NAMES.get(path.name) or LANGUAGE_SUFFIXES.get(path.suffix.lower(), OTHER)
+
+
+def count_lines(path: str) -> int:
+    """Count lines in fixed-size binary chunks; ``bytes.count`` runs at memory speed.
+
+    A last line without a trailing newline still counts.
+    """
+    lines = 0
+    last = b"\n"
+    try:
+        with open(path, "rb", buffering=0) as handle:
+            for chunk in iter(lambda: handle.read(CHUNK_BYTES), b""):
+                lines += chunk.count(b"\n")
+                last = chunk[-1:]
+    except OSError:
+        return 0
+    return lines if last == b"\n" else lines + 1
+
+
+def _count_many(paths: list[str]) -> list[int]:
+    return [count_lines(path) for path in paths]
+
+
+def line_state_path(root: Path) -> Path:
+    key = hashlib.sha256(f"{LINE_COUNT_VERSION}:{root.resolve()}".encode("utf-8")).hexdigest()[:32]
+    return cache_root() / "lines" / f"{key}.json"
+
+
+def _load_counts(path: Path | None) -> dict[str, list[int]]:
+    if path is None:
+        return {}
+    try:
+        loaded = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return loaded if isinstance(loaded, dict) else {}
+
+
+def collect_language_stats(
+    root: Path,
+    index: dict[str, FileStat],
+    workers: int | None = None,
+    persist: bool = False,
+) -> LanguageStats:
+    """Tally files, lines and bytes per language for ``index``.
+
+    With ``persist``, line counts are cached per file fingerprint (path, size, mtime), so a
+    warm run reads nothing. Cold runs with enough data split the counting across a process pool. Binary and
+    unrecognised files count toward files and bytes only; generated, vendored and tool-output
+    files are left out.
+    """
+    state_path = line_state_path(root) if persist else None
+    cached = _load_counts(state_path)
+    counts: dict[str, int] = {}
+    pending: list[str] = []
+    pending_bytes = 0
+    tallied: dict[str, str] = {}
+    for rel_path, file_stat in index.items():
+        if classify_path(rel_path) is not None:
+            continue
+        language = language_of(rel_path)
+        tallied[rel_path] = language
+        if language in {BINARY, OTHER}:
+            counts[rel_path] = 0
+            continue
+        entry = cached.get(rel_path)
+        if entry and entry[:2] == [file_stat.size, file_stat.mtime_ns]:
+            counts[rel_path] = entry[2]
+        else:
+            pending.append(rel_path)
+            pending_bytes += file_stat.size
+
+    if pending:
+        workers = workers or os.cpu_count() or 1
+        paths = [str(root / rel_path) for rel_path in pending]
+        if workers == 1 or pending_bytes < POOL_MIN_BYTES:
+            results = _count_many(paths)
+        else:
+            batches = [paths[offset::workers] for offset in range(workers)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                counted = list(pool.map(_count_many, batches))
+            results = [0] * len(paths)
+            for offset, batch in enumerate(counted):
+                results[offset::workers] = batch
+        counts.update(zip(pending, results))
+        if state_path is not None:
+            try:
+                write_json_atomic(
+                    state_path,
+                    {
+                        path: [index[path].size, index[path].mtime_ns, counts[path]]
+                        for path, language in tallied.items()
+                        if language not in {BINARY, OTHER}
+                    },
+                )
+                evict_lru(state_path.parent, MAX_LINE_STATES)
+            except OSError:
+                pass
+
+    languages: dict[str, dict[str, int]] = defaultdict(lambda: {"files": 0, "lines": 0, "bytes": 0})
+    for rel_path, language in tallied.items():
+        entry = languages[language]
+        entry["files"] += 1
+        entry["lines"] += counts[rel_path]
+        entry["bytes"] += index[rel_path].size
+    ordered = sorted(languages.items(), key=lambda item: (-item[1]["bytes"], item[0]))
+    return LanguageStats(languages=dict(ordered))
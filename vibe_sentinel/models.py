@@ -36,6 +36,19 @@ class CheckResult:
         payload["points"] = round(self.points(), 2)
         return payload
 
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> CheckResult:
+        return cls(
+            check_id=payload["check_id"],
+            title=payload["title"],
+            category=payload["category"],
+            weight=int(payload["weight"]),
+            status=payload["status"],
+            severity=payload["severity"],
+            detail=payload["detail"],
+            recommendation=payload["recommendation"],
+        )
+
 
 @dataclass(frozen=True)
 class ScoreCard:
@@ -54,6 +67,16 @@ class ScoreCard:
             "overall": round(self.overall, 2),
         }
 
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> ScoreCard:
+        return cls(
+            usefulness=float(payload["usefulness"]),
+            impact=float(payload["impact"]),
+            execution=float(payload["execution"]),
+            innovation=float(payload["innovation"]),
+            overall=float(payload["overall"]),
+        )
+
 
 @dataclass(frozen=True)
 class AuditReport:
@@ -61,11 +84,37 @@ class AuditReport:
     generated_at: str
     scorecard: ScoreCard
     checks: list[CheckResult]
+    revision: str | None = None
+    diff: dict[str, Any] | None = None
+    stats: dict[str, Any] | None = None
+    sampling: dict[str, Any] | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        return {
+        payload: dict[str, Any] = {
             "project_path": self.project_path,
             "generated_at": self.generated_at,
             "scorecard": self.scorecard.to_dict(),
             "checks": [check.to_dict() for check in self.checks],
         }
+        if self.revision:
+            payload["revision"] = self.revision
+        if self.diff is not None:
+            payload["diff"] = self.diff
+        if self.stats is not None:
+            payload["stats"] = self.stats
+        if self.sampling is not None:
+            payload["sampling"] = self.sampling
+        return payload
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> AuditReport:
+        return cls(
+            project_path=payload["project_path"],
+            generated_at=payload["generated_at"],
+            scorecard=ScoreCard.from_dict(payload["scorecard"]),
+            checks=[CheckResult.from_dict(check) for check in payload["checks"]],
+            revision=payload.get("revision"),
+            diff=payload.get("diff"),
+            stats=payload.get("stats"),
+            sampling=payload.get("sampling"),
+        )
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from vibe_sentinel.checks import FileStat, build_context, compute_scorecard, evaluate_checks, scan_project
+from vibe_sentinel.languages import collect_language_stats
+from vibe_sentinel.models import AuditReport, ScoreCard
+from vibe_sentinel.report import build_audit_report, write_report_files
+
+MANIFEST_NAMES = {"pyproject.toml", "package.json"}
+
+
+@dataclass(frozen=True)
+class MonorepoReport:
+    root: Path
+    packages: dict[str, AuditReport]
+    rollup: ScoreCard
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "project_path": str(self.root),
+            "rollup": self.rollup.to_dict(),
+            "packages": [
+                {"package": name, **report.to_dict()} for name, report in self.packages.items()
+            ],
+        }
+
+
+def discover_package_roots(files: Iterable[str]) -> list[str]:
+    """Return sub-project roots (``.`` for the repository root) that hold a package manifest."""
+    roots: set[str] = set()
+    for rel_path in files:
+        parent, _, name = rel_path.rpartition("/")
+        if name in MANIFEST_NAMES:
+            roots.add(parent or ".")
+    return sorted(roots)
+
+
+def _owning_root(rel_path: str, roots: set[str]) -> str | None:
+    parent = rel_path
+    while "/" in parent:
+        parent = parent.rsplit("/", 1)[0]
+        if parent in roots:
+            return parent
+    return "." if "." in roots else None
+
+
+def partition_files(index: dict[str, FileStat], roots: list[str]) -> dict[str, dict[str, FileStat]]:
+    """Assign each file to its nearest enclosing package root, re-rooted to that package."""
+    root_set = set(roots)
+    partitions: dict[str, dict[str, FileStat]] = {root: {} for root in roots}
+    for rel_path, file_stat in index.items():
+        owner = _owning_root(rel_path, root_set)
+        if owner is None:
+            continue
+        partitions[owner][rel_path if owner == "." else rel_path[len(owner) + 1 :]] = file_stat
+    return partitions
+
+
+def rollup_scorecard(scorecards: list[ScoreCard]) -> ScoreCard:
+    if not scorecards:
+        return ScoreCard(usefulness=0.0, impact=0.0, execution=0.0, innovation=0.0, overall=0.0)
+    count = len(scorecards)
+    return ScoreCard(
+        usefulness=sum(card.usefulness for card in scorecards) / count,
+        impact=sum(card.impact for card in scorecards) / count,
+        execution=sum(card.execution for card in scorecards) / count,
+        innovation=sum(card.innovation for card in scorecards) / count,
+        overall=sum(card.overall for card in scorecards) / count,
+    )
+
+
+def _audit_package(root: Path, package: str, index: dict[str, FileStat], workers: int | None = None) -> AuditReport:
+    package_root = root if package == "." else root / package
+    checks = evaluate_checks(build_context(package_root, index=index, persist=True))
+    stats = collect_language_stats(package_root, index, workers=workers, persist=True).to_dict()
+    return build_audit_report(package_root, checks, compute_scorecard(checks), stats=stats)
+
+
+def audit_monorepo(root: Path, workers: int | None = None) -> MonorepoReport:
+    """Walk ``root`` once, split the index per package, and audit packages in parallel processes.
+
+    Package audits are CPU-bound (regex scans and hashing), so they use a process pool like the
+    fleet audit does; ``workers=1`` or a single package runs in-process.
+    """
+    workers = workers or os.cpu_count() or 1
+    index = scan_project(root, persist=True).index
+    roots = discover_package_roots(index)
+    partitions = partition_files(index, roots)
+
+    if workers == 1 or len(roots) <= 1:
+        packages = {package: _audit_package(root, package, partitions[package]) for package in roots}
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(roots))) as pool:
+            # Each package already has its own process; a nested line-counting pool would oversubscribe.
+            futures = {
+                package: pool.submit(_audit_package, root, package, partitions[package], workers=1) for package in roots
+            }
+            packages = {package: future.result() for package, future in futures.items()}
+
+    rollup = rollup_scorecard([report.scorecard for report in packages.values()])
+    return MonorepoReport(root=root.resolve(), packages=packages, rollup=rollup)
+
+
+def _package_slug(package: str) -> str:
+    return "root" if package == "." else package.replace("/", "__")
+
+
+def write_monorepo_reports(report: MonorepoReport, output_dir: Path) -> Path:
+    for package, package_report in report.packages.items():
+        write_report_files(package_report, output_dir / "packages" / _package_slug(package))
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    summary_path = output_dir / "monorepo.json"
+    summary_path.write_text(json.dumps(report.to_dict(), indent=2) + "\n", encoding="utf-8")
+    return summary_path
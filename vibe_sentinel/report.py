@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 from vibe_sentinel.models import AuditReport, CheckResult
 
@@ -10,12 +11,22 @@ SEVERITY_ORDER = {"high": 0, "medium": 1, "low": 2}
 STATUS_ICON = {"pass": "PASS", "warn": "WARN", "fail": "FAIL"}
 
 
-def build_audit_report(project_path: Path, checks: list[CheckResult], scorecard) -> AuditReport:
+def build_audit_report(
+    project_path: Path,
+    checks: list[CheckResult],
+    scorecard,
+    revision: str | None = None,
+    stats: dict | None = None,
+    sampling: dict | None = None,
+) -> AuditReport:
     return AuditReport(
         project_path=str(project_path.resolve()),
         generated_at=datetime.now(timezone.utc).isoformat(),
         scorecard=scorecard,
         checks=checks,
+        revision=revision,
+        stats=stats,
+        sampling=sampling,
     )
 
 
@@ -24,8 +35,13 @@ def markdown_report(report: AuditReport) -> str:
     lines.append("# Vibe Sentinel Audit Report")
     lines.append("")
     lines.append(f"- Project: `{report.project_path}`")
+    if report.revision:
+        lines.append(f"- Revision: `{report.revision}`")
     lines.append(f"- Generated (UTC): `{report.generated_at}`")
     lines.append("")
+    if report.sampling is not None:
+        lines.append(f"> **Sampled secret scan:** {sampling_summary(report.sampling)} This is not a full scan.")
+        lines.append("")
     lines.append("## Scorecard")
     lines.append("")
     lines.append(f"- Usefulness: **{report.scorecard.usefulness:.1f}/100**")
@@ -34,6 +50,25 @@ def markdown_report(report: AuditReport) -> str:
     lines.append(f"- Innovation: **{report.scorecard.innovation:.1f}/100**")
     lines.append(f"- Projected Vibeathon Score: **{report.scorecard.overall:.1f}/100**")
     lines.append("")
+    if report.diff is not None:
+        titles = {check.check_id: check.title for check in report.checks}
+        lines.append("## Changes Since Base")
+        lines.append("")
+        lines.append(f"- Base: `{report.diff['base']}` ({len(report.diff['changed_files'])} changed file(s))")
+        for key, label in (("introduced", "Introduced"), ("pre_existing", "Pre-existing"), ("resolved", "Resolved")):
+            names = ", ".join(titles.get(check_id, check_id) for check_id in report.diff[key]) or "none"
+            lines.append(f"- {label}: {names}")
+        lines.append("")
+    if report.stats:
+        lines.append("## Project Size")
+        lines.append("")
+        lines.append("| Language | Files | Lines | Bytes |")
+        lines.append("|---|---:|---:|---:|")
+        for language, entry in report.stats["languages"].items():
+            lines.append(f"| {language} | {entry['files']} | {entry['lines']} | {entry['bytes']} |")
+        totals = report.stats["totals"]
+        lines.append(f"| **Total** | {totals['files']} | {totals['lines']} | {totals['bytes']} |")
+        lines.append("")
     lines.append("## Checks")
     lines.append("")
     lines.append("| Status | Category | Check | Detail | Recommendation |")
@@ -54,6 +89,15 @@ def markdown_report(report: AuditReport) -> str:
     return "\n".join(lines) + "\n"
 
 
+def sampling_summary(sampling: dict) -> str:
+    return (
+        f"read {sampling['scanned']} of {sampling['population']} candidate files "
+        f"({sampling['risky_scanned']} risky names in full, the rest stratified over {sampling['strata']} strata); "
+        f"estimated leak rate {sampling['estimated_leak_rate']:.2%}, "
+        f"below {sampling['leak_rate_upper_bound']:.2%} at {sampling['confidence']:.0%} confidence."
+    )
+
+
 def console_summary(report: AuditReport) -> str:
     failing = [check for check in report.checks if check.status == "fail"]
     warnings = [check for check in report.checks if check.status == "warn"]
@@ -73,6 +117,8 @@ def console_summary(report: AuditReport) -> str:
         ),
         f"Findings: {len(failing)} fail, {len(warnings)} warn",
     ]
+    if report.sampling is not None:
+        lines.append(f"SAMPLED secret scan: {sampling_summary(report.sampling)}")
 
     if top:
         lines.append("Top fixes:")
@@ -82,14 +128,21 @@ def console_summary(report: AuditReport) -> str:
     return "\n".join(lines)
 
 
+def report_files(report: AuditReport, output_dir: Path) -> dict[Path, str]:
+    """Render ``report.json`` and ``report.md`` in memory, keyed by the paths they belong at."""
+    return {
+        output_dir / "report.json": json.dumps(report.to_dict(), indent=2) + "\n",
+        output_dir / "report.md": markdown_report(report),
+    }
+
+
 def write_report_files(report: AuditReport, output_dir: Path) -> tuple[Path, Path]:
     output_dir.mkdir(parents=True, exist_ok=True)
-    json_path = output_dir / "report.json"
-    markdown_path = output_dir / "report.md"
-
-    json_path.write_text(json.dumps(report.to_dict(), indent=2) + "\n", encoding="utf-8")
-    markdown_path.write_text(markdown_report(report), encoding="utf-8")
+    files = report_files(report, output_dir)
+    for path, content in files.items():
+        path.write_text(content, encoding="utf-8")
 
+    json_path, markdown_path = files
     return json_path, markdown_path
 
 
@@ -103,9 +156,9 @@ def _estimate_effort(check: dict) -> str:
     return "S"
 
 
-def roadmap_markdown(report_payload: dict) -> str:
-    scorecard = report_payload.get("scorecard", {})
-    checks = report_payload.get("checks", [])
+def roadmap_markdown(payload: dict) -> str:
+    scorecard = payload.get("scorecard", {})
+    checks = payload.get("checks", [])
 
     issues = [check for check in checks if check.get("status") != "pass"]
     issues.sort(
@@ -146,8 +199,16 @@ def roadmap_markdown(report_payload: dict) -> str:
     return "\n".join(lines) + "\n"
 
 
-def write_roadmap(report_json_path: Path, output_path: Path) -> Path:
-    payload = json.loads(report_json_path.read_text(encoding="utf-8"))
+def report_payload(report: AuditReport | dict[str, Any] | Path) -> dict[str, Any]:
+    """Return the JSON payload of an in-memory report, an already-decoded payload, or a ``report.json`` path."""
+    if isinstance(report, AuditReport):
+        return report.to_dict()
+    if isinstance(report, Path):
+        return json.loads(report.read_text(encoding="utf-8"))
+    return report
+
+
+def write_roadmap(report_json_path: AuditReport | dict[str, Any] | Path, output_path: Path) -> Path:
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(roadmap_markdown(payload), encoding="utf-8")
+    output_path.write_text(roadmap_markdown(report_payload(report_json_path)), encoding="utf-8")
     return output_path
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import math
+import random
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+from typing import Any
+
+# Files whose names say "credentials live here" are always scanned, whatever the sample size.
+RISKY_PREFIXES = (".env",)
+RISKY_STEMS = {"config", "settings", "local_settings", "secrets", "secret", "credentials", "auth"}
+CONFIDENCE = 0.95
+Z_SCORE = 1.96
+
+
+@dataclass(frozen=True)
+class SamplePlan:
+    """Which secret-scan candidates to read: every risky file plus a stratified sample of the rest."""
+
+    selected: frozenset[str]
+    risky: frozenset[str]
+    population: int
+    strata: dict[str, tuple[int, int]]
+    seed: int
+
+    @property
+    def sampled(self) -> int:
+        return len(self.selected) - len(self.risky)
+
+    @property
+    def unsampled(self) -> int:
+        return self.population - len(self.selected)
+
+
+@dataclass(frozen=True)
+class SampleEstimate:
+    """Sampled secret-scan result: exact hits among scanned files and a leak-rate estimate for the rest."""
+
+    plan: SamplePlan
+    hits: int
+    risky_hits: int
+    leak_rate: float
+    upper_bound: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "sampled": True,
+            "seed": self.plan.seed,
+            "population": self.plan.population,
+            "scanned": len(self.plan.selected),
+            "risky_scanned": len(self.plan.risky),
+            "strata": len(self.plan.strata),
+            "hits": self.hits,
+            "risky_hits": self.risky_hits,
+            "estimated_leak_rate": round(self.leak_rate, 6),
+            "leak_rate_upper_bound": round(self.upper_bound, 6),
+            "confidence": CONFIDENCE,
+            "unscanned_leaks_upper_bound": round(self.upper_bound * self.plan.unsampled, 1),
+        }
+
+
+def is_risky(relative_path: str) -> bool:
+    name = PurePosixPath(relative_path).name.lower()
+    return name.startswith(RISKY_PREFIXES) or name.split(".", 1)[0] in RISKY_STEMS
+
+
+def stratum_of(relative_path: str) -> str:
+    """Group by top-level directory and suffix, so one huge directory cannot crowd out the rest."""
+    directory = relative_path.split("/", 1)[0] if "/" in relative_path else "."
+    return f"{directory}|{PurePosixPath(relative_path).suffix.lower()}"
+
+
+def plan_sample(
+    candidates: Iterable[str],
+    rate: float | None = None,
+    budget: int | None = None,
+    seed: int = 0,
+) -> SamplePlan:
+    """Pick risky files in full plus ``rate`` of the rest, or enough to fill ``budget`` reads in total.
+
+    The non-risky share is split across strata in proportion to their size (largest remainder),
+    and files are drawn within each stratum by a seeded RNG so a run can be reproduced.
+    """
+    if (rate is None) == (budget is None):
+        raise ValueError("give exactly one of a sample rate or a sample budget")
+    if rate is not None and not 0 < rate <= 1:
+        raise ValueError("sample rate must be in (0, 1]")
+    if budget is not None and budget < 1:
+        raise ValueError("sample budget must be at least 1")
+
+    risky: set[str] = set()
+    by_stratum: dict[str, list[str]] = defaultdict(list)
+    for rel_path in candidates:
+        if is_risky(rel_path):
+            risky.add(rel_path)
+        else:
+            by_stratum[stratum_of(rel_path)].append(rel_path)
+    rest = sum(len(paths) for paths in by_stratum.values())
+    if rate is not None:
+        target = round(rest * rate)
+    else:
+        target = max(0, budget - len(risky))  # type: ignore[operator]
+    target = min(target, rest)
+
+    quotas: dict[str, int] = {}
+    remainders: list[tuple[float, str]] = []
+    for stratum, paths in by_stratum.items():
+        exact = target * len(paths) / rest
+        quotas[stratum] = int(exact)
+        remainders.append((exact - int(exact), stratum))
+    leftover = target - sum(quotas.values())
+    for _, stratum in sorted(remainders, key=lambda item: (-item[0], item[1]))[:leftover]:
+        quotas[stratum] += 1
+
+    rng = random.Random(seed)
+    selected = set(risky)
+    strata: dict[str, tuple[int, int]] = {}
+    for stratum in sorted(by_stratum):
+        paths = sorted(by_stratum[stratum])
+        chosen = rng.sample(paths, quotas[stratum])
+        selected.update(chosen)
+        strata[stratum] = (len(paths), len(chosen))
+    return SamplePlan(
+        selected=frozenset(selected),
+        risky=frozenset(risky),
+        population=len(risky) + rest,
+        strata=strata,
+        seed=seed,
+    )
+
+
+def estimate_leak_rate(plan: SamplePlan, hits: Iterable[str]) -> SampleEstimate:
+    """Estimate the share of unscanned candidates that leak, with a Wilson upper bound.
+
+    The point estimate weights each stratum's hit rate by its population. Risky files were read
+    in full, so they are counted exactly and left out of the estimate.
+    """
+    hit_set = set(hits)
+    risky_hits = len(hit_set & plan.risky)
+    sampled_hits: dict[str, int] = defaultdict(int)
+    for rel_path in hit_set - plan.risky:
+        sampled_hits[stratum_of(rel_path)] += 1
+
+    covered = sum(population for population, sampled in plan.strata.values() if sampled)
+    rate = 0.0
+    if covered:
+        rate = sum(
+            population / covered * sampled_hits[stratum] / sampled
+            for stratum, (population, sampled) in plan.strata.items()
+            if sampled
+        )
+    n = plan.sampled
+    upper = 1.0 if plan.unsampled else 0.0
+    if n and plan.unsampled:
+        z2 = Z_SCORE * Z_SCORE
+        centre = rate + z2 / (2 * n)
+        spread = Z_SCORE * math.sqrt(rate * (1 - rate) / n + z2 / (4 * n * n))
+        upper = min(1.0, (centre + spread) / (1 + z2 / n))
+    return SampleEstimate(
+        plan=plan,
+        hits=len(hit_set),
+        risky_hits=risky_hits,
+        leak_rate=rate,
+        upper_bound=upper,
+    )
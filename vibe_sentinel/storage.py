@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR_ENV = "VIBE_SENTINEL_CACHE_DIR"
+
+
+def cache_root() -> Path:
+    """Base directory for persisted caches: ``$VIBE_SENTINEL_CACHE_DIR`` or the XDG cache home."""
+    override = os.environ.get(CACHE_DIR_ENV, "").strip()
+    if override:
+        return Path(override).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME", "").strip()
+    return (Path(base).expanduser() if base else Path.home() / ".cache") / "vibe-sentinel"
+
+
+def write_json_atomic(path: Path, payload: Any) -> None:
+    # Imported here so the daemon client, which only needs ``cache_root``, stays light.
+    import tempfile
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False) as handle:
+        json.dump(payload, handle)
+    os.replace(handle.name, path)
+
+
+def evict_lru(directory: Path, max_entries: int, suffix: str = ".json") -> None:
+    """Delete the least recently touched entries beyond ``max_entries``."""
+    entries: list[tuple[int, str]] = []
+    for entry in os.scandir(directory):
+        if not entry.name.endswith(suffix):
+            continue
+        try:
+            entries.append((entry.stat().st_mtime_ns, entry.path))
+        except OSError:
+            continue
+    if len(entries) <= max_entries:
+        return
+    entries.sort()
+    for _, path in entries[: len(entries) - max_entries]:
+        Path(path).unlink(missing_ok=True)
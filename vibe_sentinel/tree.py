@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import stat
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from vibe_sentinel.storage import cache_root, evict_lru, write_json_atomic
+
+STATE_VERSION = 1
+MAX_TREE_STATES = 64
+EMPTY_DIGEST = hashlib.sha256(b"").hexdigest()
+
+
+class FileStat(NamedTuple):
+    size: int
+    mtime_ns: int
+
+
+@dataclass(frozen=True)
+class TreeScan:
+    """Result of a Merkle walk: the file index, the root digest, and how many listings were reused."""
+
+    index: dict[str, FileStat]
+    digest: str
+    reused_listings: int = 0
+
+
+def tree_state_path(root: Path, ignore: Iterable[str] = ()) -> Path:
+    identity = "\0".join([str(root.resolve()), *sorted(set(ignore))])
+    key = hashlib.sha256(identity.encode("utf-8")).hexdigest()[:32]
+    return cache_root() / "trees" / f"{key}.json"
+
+
+def _load_state(path: Path, root: Path, ignore: list[str]) -> dict[str, Any]:
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if (
+        not isinstance(state, dict)
+        or state.get("version") != STATE_VERSION
+        or state.get("root") != str(root.resolve())
+        or state.get("ignore") != ignore
+    ):
+        return {}
+    nodes = state.get("nodes")
+    return nodes if isinstance(nodes, dict) else {}
+
+
+class _Walker:
+    def __init__(self, excluded_dirs: set[str], ignore: set[str], previous: dict[str, Any]) -> None:
+        self.excluded_dirs = excluded_dirs
+        self.ignore = ignore
+        self.previous = previous
+        self.nodes: dict[str, Any] = {}
+        self.index: dict[str, FileStat] = {}
+        self.reused_listings = 0
+
+    def _stat_known_files(self, directory: str, names: Iterable[str]) -> dict[str, FileStat] | None:
+        files: dict[str, FileStat] = {}
+        for name in names:
+            try:
+                info = os.stat(os.path.join(directory, name))
+            except OSError:
+                return None
+            if not stat.S_ISREG(info.st_mode):
+                return None
+            files[name] = FileStat(info.st_size, info.st_mtime_ns)
+        return files
+
+    def _list(self, directory: str) -> tuple[dict[str, FileStat], list[str]]:
+        files: dict[str, FileStat] = {}
+        dirs: list[str] = []
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return files, dirs
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in self.excluded_dirs:
+                        dirs.append(entry.name)
+                    continue
+                info = entry.stat()
+            except OSError:
+                continue
+            if stat.S_ISREG(info.st_mode):
+                files[entry.name] = FileStat(info.st_size, info.st_mtime_ns)
+        return files, dirs
+
+    def visit(self, rel_dir: str, directory: str) -> str | None:
+        try:
+            dir_mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+
+        previous = self.previous.get(rel_dir)
+        files: dict[str, FileStat] | None = None
+        dirs: list[str] = []
+        # A directory's mtime only moves when entries are added, removed or renamed, so an
+        # unchanged mtime lets us reuse the stored listing. Files are still stat'ed because
+        # in-place edits do not touch the parent directory.
+        if previous is not None and previous.get("mtime_ns") == dir_mtime:
+            files = self._stat_known_files(directory, previous.get("files", {}))
+            if files is not None:
+                dirs = list(previous.get("dirs", {}))
+                self.reused_listings += 1
+        if files is None:
+            files, dirs = self._list(directory)
+
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        child_digests: dict[str, str] = {}
+        for name in sorted(dirs):
+            child_digest = self.visit(f"{prefix}{name}", os.path.join(directory, name))
+            if child_digest is not None:
+                child_digests[name] = child_digest
+
+        stored_files = {name: [file_stat.size, file_stat.mtime_ns] for name, file_stat in files.items()}
+        for name, file_stat in files.items():
+            self.index[f"{prefix}{name}"] = file_stat
+
+        if previous is not None and previous.get("files") == stored_files and previous.get("dirs") == child_digests:
+            digest = str(previous["digest"])
+        else:
+            hasher = hashlib.sha256()
+            for name in sorted(files):
+                if f"{prefix}{name}" in self.ignore:
+                    continue
+                file_stat = files[name]
+                hasher.update(f"f\0{name}\0{file_stat.size}\0{file_stat.mtime_ns}\n".encode("utf-8"))
+            for name, child_digest in sorted(child_digests.items()):
+                # Directories without hashed files (empty, or only ignored files) leave no trace.
+                if child_digest == EMPTY_DIGEST:
+                    continue
+                hasher.update(f"d\0{name}\0{child_digest}\n".encode("utf-8"))
+            digest = hasher.hexdigest()
+
+        self.nodes[rel_dir] = {"mtime_ns": dir_mtime, "files": stored_files, "dirs": child_digests, "digest": digest}
+        return digest
+
+
+def scan_tree(
+    root: Path,
+    excluded_dirs: set[str],
+    ignore: Iterable[str] = (),
+    state_path: Path | None = None,
+    persist: bool = False,
+) -> TreeScan:
+    """Walk ``root`` into a Merkle tree of directory digests.
+
+    With ``persist``, the state stored at ``state_path`` is reused where valid and updated.
+    Files listed in ``ignore`` stay in the index but do not contribute to any digest.
+    """
+    ignore_list = sorted(set(ignore))
+    state_path = state_path or tree_state_path(root, ignore_list)
+    previous = _load_state(state_path, root, ignore_list) if persist else {}
+
+    walker = _Walker(excluded_dirs, set(ignore_list), previous)
+    digest = walker.visit("", str(root)) or EMPTY_DIGEST
+
+    if persist:
+        try:
+            if walker.nodes != previous:
+                write_json_atomic(
+                    state_path,
+                    {"version": STATE_VERSION, "root": str(root.resolve()), "ignore": ignore_list, "nodes": walker.nodes},
+                )
+                evict_lru(state_path.parent, MAX_TREE_STATES)
+            else:
+                os.utime(state_path)
+        except OSError:
+            pass
+
+    return TreeScan(index=walker.index, digest=digest, reused_listings=walker.reused_listings)
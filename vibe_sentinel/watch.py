@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from vibe_sentinel.cache import report_ignores
+from vibe_sentinel.checks import (
+    CHECK_RULES,
+    CHECK_SPECS,
+    CONTENT_RULES,
+    EXCLUDED_DIRS,
+    LISTING_CHECKS,
+    TREE_CHECKS,
+    ContentRule,
+    FileStat,
+    build_context,
+    compute_scorecard,
+    evaluate_checks,
+    scan_project,
+    visit_files,
+)
+from vibe_sentinel.classify import FileKind
+from vibe_sentinel.defaults import DEBOUNCE_SECONDS, POLL_SECONDS
+from vibe_sentinel.languages import collect_language_stats
+from vibe_sentinel.models import AuditReport, CheckResult
+from vibe_sentinel.report import build_audit_report, write_report_files
+from vibe_sentinel.tree import TreeScan
+
+_IN_MODIFY = 0x002
+_IN_ATTRIB = 0x004
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_DELETE_SELF = 0x400
+_IN_Q_OVERFLOW = 0x4000
+_IN_IGNORED = 0x8000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+@dataclass(frozen=True)
+class WatchUpdate:
+    """One re-audit: the files that changed, the checks that re-ran, and the refreshed report."""
+
+    changed: list[str]
+    rerun: list[str]
+    report: AuditReport
+    elapsed_ms: float
+
+
+class IncrementalAuditor:
+    """Keeps the last index, content findings and check results so a change re-reads only changed files.
+
+    Each refresh rescans the persisted Merkle tree, revisits changed files, and re-runs just the
+    checks whose inputs (``CHECK_RULES``, ``LISTING_CHECKS``, ``TREE_CHECKS``) were touched.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        output_dir: Path,
+        rules: Iterable[ContentRule] = CONTENT_RULES,
+        classify: bool = True,
+        workers: int | None = None,
+        write: bool = True,
+    ) -> None:
+        self.root = root
+        self.output_dir = output_dir
+        self.rules = tuple(rules)
+        self.classify = classify
+        self.workers = workers
+        self.write = write
+        self.index: dict[str, FileStat] = {}
+        self.content: dict[str, dict[str, Any]] = {rule.rule_id: {} for rule in self.rules}
+        self.kinds: dict[str, FileKind] = {}
+        self.results: dict[str, CheckResult] = {}
+        self.report: AuditReport | None = None
+        self.report_paths: tuple[Path, Path] | None = None
+        # The reports this auditor rewrites must not count as changes, or every write would trigger another.
+        self.ignore = report_ignores(root, output_dir)
+
+    def _audit(self, tree: TreeScan, changed: set[str], rerun: set[str], started: float) -> WatchUpdate:
+        for path in changed:
+            for found in self.content.values():
+                found.pop(path, None)
+            self.kinds.pop(path, None)
+        present = [path for path in changed if path in tree.index]
+        fresh = visit_files(self.root, present, self.rules, classify=self.classify, kinds=self.kinds, stats=tree.index)
+        for rule_id, found in fresh.items():
+            self.content.setdefault(rule_id, {}).update(found)
+
+        ctx = build_context(
+            self.root, self.rules, tree=tree, content=self.content, classify=self.classify, persist=True
+        )
+        ctx.file_kinds = self.kinds
+        for check in evaluate_checks(ctx, only=rerun):
+            self.results[check.check_id] = check
+        checks = [self.results[spec.check_id] for spec in CHECK_SPECS]
+        stats = collect_language_stats(self.root, tree.index, workers=self.workers, persist=True).to_dict()
+        self.report = build_audit_report(self.root, checks, compute_scorecard(checks), stats=stats)
+        if self.write:
+            self.report_paths = write_report_files(self.report, self.output_dir)
+        self.index = dict(tree.index)
+        return WatchUpdate(
+            changed=sorted(changed),
+            rerun=[spec.check_id for spec in CHECK_SPECS if spec.check_id in rerun],
+            report=self.report,
+            elapsed_ms=(time.perf_counter() - started) * 1000,
+        )
+
+    def _scan(self) -> TreeScan:
+        return scan_project(self.root, ignore=self.ignore, persist=True)
+
+    def full(self) -> WatchUpdate:
+        started = time.perf_counter()
+        tree = self._scan()
+        return self._audit(tree, set(tree.index), {spec.check_id for spec in CHECK_SPECS}, started)
+
+    def refresh(self) -> WatchUpdate | None:
+        """Re-audit what changed since the last run, or return ``None`` if nothing did."""
+        started = time.perf_counter()
+        tree = self._scan()
+        modified = {path for path, file_stat in tree.index.items() if self.index.get(path) != file_stat}
+        modified.difference_update(self.ignore)
+        added = modified - set(self.index)
+        removed = set(self.index) - set(tree.index) - set(self.ignore)
+        if not modified and not removed:
+            return None
+        changed = modified | removed
+        return self._audit(tree, changed, self.affected_checks(changed, bool(added or removed)), started)
+
+    def affected_checks(self, changed: set[str], listing_changed: bool) -> set[str]:
+        """Checks whose inputs ``changed`` touches; ``listing_changed`` means files were added or removed."""
+        rule_ids = {rule.rule_id for rule in self.rules for path in changed if rule.matches(path)}
+        affected = {check_id for check_id, needs in CHECK_RULES.items() if needs & rule_ids}
+        if listing_changed:
+            affected |= LISTING_CHECKS
+        if changed:
+            affected |= TREE_CHECKS
+        return affected
+
+
+class _Inotify:
+    """Recursive directory watches over Linux inotify, through libc and ``ctypes``."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, Path] = {}
+        try:
+            self._add_tree(root)
+        except OSError:
+            os.close(self.fd)
+            raise
+
+    def _add_tree(self, directory: Path) -> None:
+        for current, dirnames, _ in os.walk(directory):
+            dirnames[:] = [name for name in dirnames if name not in EXCLUDED_DIRS]
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(current), _WATCH_MASK)
+            if wd < 0:
+                # Usually fs.inotify.max_user_watches; the caller falls back to polling.
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {current}")
+            self._dirs[wd] = Path(current)
+
+    def wait(self, timeout: float | None) -> bool:
+        """Block until at least one event arrives (or ``timeout`` passes) and drain the queue."""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return True
+            pos = 0
+            while pos < len(data):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(data, pos)
+                name = data[pos + _EVENT_HEADER.size : pos + _EVENT_HEADER.size + length].rstrip(b"\0")
+                pos += _EVENT_HEADER.size + length
+                if mask & _IN_Q_OVERFLOW:
+                    continue
+                if mask & _IN_IGNORED:
+                    self._dirs.pop(wd, None)
+                elif mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO) and wd in self._dirs:
+                    name_text = os.fsdecode(name)
+                    if name_text not in EXCLUDED_DIRS:
+                        try:
+                            self._add_tree(self._dirs[wd] / name_text)
+                        except OSError:
+                            # Out of watches: the directory is still rescanned on the next event.
+                            pass
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class _Poller:
+    """Fallback that wakes on a fixed interval and lets the Merkle-tree rescan find changes."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+
+    def wait(self, timeout: float | None) -> bool:
+        time.sleep(self.interval if timeout is None else min(timeout, self.interval))
+        return True
+
+    def close(self) -> None:
+        return None
+
+
+def _open_watcher(root: Path, poll: bool, interval: float) -> _Inotify | _Poller:
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return _Inotify(root)
+        except (OSError, AttributeError):
+            pass
+    return _Poller(interval)
+
+
+def watch(
+    project_path: Path,
+    output_dir: Path,
+    on_update: Callable[[WatchUpdate], None],
+    debounce: float = DEBOUNCE_SECONDS,
+    interval: float = POLL_SECONDS,
+    poll: bool = False,
+    stop: threading.Event | None = None,
+    on_start: Callable[[str], None] | None = None,
+) -> None:
+    """Audit once, then re-audit after each debounced batch of changes until ``stop`` is set.
+
+    Uses inotify on Linux and mtime polling over the stat index elsewhere (or with ``poll``).
+    ``on_start`` receives the backend in use, ``"inotify"`` or ``"poll"``.
+    """
+    stop = stop or threading.Event()
+    # Watch before the first audit so edits made while it runs are not missed.
+    watcher = _open_watcher(project_path, poll, interval)
+    backend = "inotify" if isinstance(watcher, _Inotify) else "poll"
+    try:
+        auditor = IncrementalAuditor(project_path, output_dir)
+        if on_start is not None:
+            on_start(backend)
+        on_update(auditor.full())
+        while not stop.is_set():
+            if not watcher.wait(interval):
+                continue
+            if backend == "inotify":
+                # Editors save in bursts (write, rename, chmod); wait for the burst to settle.
+                while watcher.wait(debounce) and not stop.is_set():
+                    pass
+            update = auditor.refresh()
+            if update is not None:
+                on_update(update)
+    finally:
+        watcher.close()